@@ -0,0 +1,134 @@
+"""Benchmark of the per-run logging overhead of an Experiment, measured as the time spent inside
+`G.log`, `G.debug`, and `G.warn` during a 10-fold :class:`hyperparameter_hunter.CVExperiment` with
+`runs=10`. A dummy model is used, so the Experiment itself is cheap, but fitting time is excluded
+from the measurement regardless. "legacy frames" reproduces the uncached frame source formatting,
+which inspected the source file on every call made with `add_frame=True`
+
+Usage
+-----
+`python benchmarks/bench_logging_overhead.py [--repeat 3]`"""
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter import Environment, CVExperiment
+from hyperparameter_hunter.i_o import reporting
+from hyperparameter_hunter.settings import G
+from hyperparameter_hunter.utils.learning_utils import get_toy_classification_data
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+import inspect
+import io
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+##################################################
+# Import Learning Assets
+##################################################
+from sklearn.dummy import DummyClassifier
+
+##################################################
+# Global Settings
+##################################################
+N_SPLITS, RUNS = 10, 10
+
+
+##################################################
+# Benchmark Fixtures
+##################################################
+def legacy_format_frame_source(previous_frame, **kwargs):
+    """Uncached :func:`reporting.format_frame_source`, which inspects the source file of frames"""
+    source = inspect.getframeinfo(previous_frame)
+    src_class = None
+    if "self" in previous_frame.f_locals:
+        src_class = type(previous_frame.f_locals["self"]).__name__
+    return reporting.stringify_frame_source(source[0], source[1], source[2], src_class, **kwargs)
+
+
+def timed(method, totals: dict, pass_frame=True):
+    """Wrap the logging `method` of :class:`reporting.ReportingHandler` to add the time spent in it
+    to `totals`. If `pass_frame`, the caller's frame is given to `method`, so frame sources still
+    point to the real call site"""
+
+    def _method(self, content, *args, **kwargs):
+        if pass_frame:
+            kwargs.setdefault("previous_frame", sys._getframe(1))
+        start = perf_counter()
+        try:
+            return method(self, content, *args, **kwargs)
+        finally:
+            totals["calls"] += 1
+            totals["seconds"] += perf_counter() - start
+
+    return _method
+
+
+##################################################
+# Per-Run Overhead
+##################################################
+def logging_overhead(results_path: str, **env_kwargs) -> dict:
+    """Run one Experiment, returning the number of logging calls it made and their total time"""
+    handler = reporting.ReportingHandler
+    originals = handler._logging_log, handler._logging_debug, handler._logging_warn
+
+    totals = dict(calls=0, seconds=0.0)
+
+    try:
+        with redirect_stdout(io.StringIO()):
+            Environment(
+                train_dataset=get_toy_classification_data(),
+                results_path=results_path,
+                metrics=["accuracy_score"],
+                cv_type="KFold",
+                cv_params=dict(n_splits=N_SPLITS, shuffle=True, random_state=32),
+                runs=RUNS,
+                **env_kwargs,
+            )
+            # Experiments initialize their own `ReportingHandler`, so its class methods are wrapped
+            handler._logging_log = timed(originals[0], totals)
+            handler._logging_debug = timed(originals[1], totals)
+            handler._logging_warn = timed(originals[2], totals, pass_frame=False)
+            CVExperiment(DummyClassifier, dict(strategy="prior"))
+    finally:
+        handler._logging_log, handler._logging_debug, handler._logging_warn = originals
+    return totals
+
+
+def execute(repeat: int):
+    """Print the best logging time per run of each scenario, over `repeat` Experiments"""
+    scenarios = [
+        ("default", {}, False),
+        ("heartbeat off", dict(file_blacklist=["current_heartbeat"]), False),
+        ("add_frame", dict(reporting_params=dict(add_frame=True)), False),
+        ("legacy frames", dict(reporting_params=dict(add_frame=True)), True),
+    ]
+    original_format_frame_source = reporting.format_frame_source
+
+    for name, env_kwargs, legacy in scenarios:
+        if legacy:
+            reporting.format_frame_source = legacy_format_frame_source
+        try:
+            results = []
+            for _ in range(repeat):
+                with TemporaryDirectory() as results_path:
+                    results.append(logging_overhead(results_path, **env_kwargs))
+        finally:
+            reporting.format_frame_source = original_format_frame_source
+            G.reset_attributes()
+
+        best = min(results, key=lambda _: _["seconds"])
+        print(
+            "{:<16}{:>6} calls{:>10.1f} µs/run".format(
+                name, best["calls"], best["seconds"] / (N_SPLITS * RUNS) * 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Experiments run for each scenario")
+    execute(parser.parse_args().repeat)
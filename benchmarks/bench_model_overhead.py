@@ -0,0 +1,125 @@
+"""Micro-benchmark of the fixed, per-run overhead of :class:`hyperparameter_hunter.models.Model`,
+excluding the time spent actually fitting the model. This overhead is made up of 1) resolving the
+`Sentinel` values in `initialization_params` and `extra_params`, and 2) building the keyword
+arguments given to the model's `fit` method. Deep-copying the params is included in all cases.
+"Uncached" reproduces the per-run tree walk and signature inspection; "cached" uses the metadata
+cached in :mod:`hyperparameter_hunter.models`
+
+Usage
+-----
+`python benchmarks/bench_model_overhead.py [--number 2000]`"""
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.models import clear_model_metadata_caches, get_default_fit_kwargs
+from hyperparameter_hunter.models import get_sentinel_paths
+from hyperparameter_hunter.sentinels import Sentinel, locate_sentinels, resolve_sentinel_paths
+from hyperparameter_hunter.settings import G
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from argparse import ArgumentParser
+from copy import deepcopy
+import inspect
+from timeit import repeat
+from types import SimpleNamespace
+
+
+##################################################
+# Benchmark Fixtures
+##################################################
+class ConstantSentinel(Sentinel):
+    def __init__(self, name):
+        self.name = name
+        super().__init__()
+
+    def _build_sentinel(self):
+        return f"SENTINEL***constant***{self.name}"
+
+    def retrieve_by_sentinel(self):
+        return self.name
+
+    def _validate_parameters(self):
+        pass
+
+
+class CheapModel:
+    """Model with a `fit` signature similar to those of gradient boosting libraries"""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def fit(self, X, y, sample_weight=None, eval_set=None, eval_metric=None, verbose=True):
+        return self
+
+
+INIT_PARAMS = dict({f"param_{_}": _ for _ in range(30)}, nested=dict(a=[1, 2, 3], b=None))
+EXTRA_PARAMS = dict(
+    fit=dict(
+        eval_set=[
+            (ConstantSentinel("train_input"), ConstantSentinel("train_target")),
+            (ConstantSentinel("validation_input"), ConstantSentinel("validation_target")),
+        ],
+        eval_metric="auc",
+    )
+)
+
+
+##################################################
+# Per-Run Overhead
+##################################################
+def uncached_overhead():
+    """Sentinel resolution and fit kwarg building as performed before caching"""
+    init_params = locate_sentinels(deepcopy(INIT_PARAMS))
+    extra_params = locate_sentinels(deepcopy(EXTRA_PARAMS))
+    model = CheapModel(**init_params)
+    expected_fit_parameters = list(inspect.signature(model.fit).parameters)
+    fit_kwargs = {}
+    if "verbose" in expected_fit_parameters:
+        fit_kwargs["verbose"] = False
+    if "silent" in expected_fit_parameters and "verbose" not in fit_kwargs:
+        fit_kwargs["silent"] = True
+    return dict(fit_kwargs, **extra_params.get("fit", {}))
+
+
+def cached_overhead():
+    """Sentinel resolution and fit kwarg building, as performed by :class:`Model`"""
+    init_params = deepcopy(INIT_PARAMS)
+    init_params = resolve_sentinel_paths(
+        init_params, get_sentinel_paths(CheapModel, "initialization_params", init_params)
+    )
+    extra_params = deepcopy(EXTRA_PARAMS)
+    extra_params = resolve_sentinel_paths(
+        extra_params, get_sentinel_paths(CheapModel, "extra_params", extra_params)
+    )
+    model = CheapModel(**init_params)
+    return dict(get_default_fit_kwargs(model), **extra_params.get("fit", {}))
+
+
+def cold_cache_overhead():
+    """:func:`cached_overhead` with the caches emptied before every run"""
+    clear_model_metadata_caches()
+    return cached_overhead()
+
+
+def execute(number: int):
+    """Print the best time per run of each overhead variant, over 5 repetitions of `number` runs"""
+    G.Env = SimpleNamespace(current_task=SimpleNamespace(experiment_id="benchmark"))
+    try:
+        for name, func in [
+            ("uncached", uncached_overhead),
+            ("cold cache", cold_cache_overhead),
+            ("cached", cached_overhead),
+        ]:
+            best = min(repeat(func, number=number, repeat=5)) / number
+            print(f"{name:<12}{best * 1e6:>10.1f} µs/run")
+    finally:
+        G.Env = None
+        clear_model_metadata_caches()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--number", type=int, default=2000, help="Runs per timing repetition")
+    execute(parser.parse_args().number)
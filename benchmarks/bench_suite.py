@@ -0,0 +1,429 @@
+"""Benchmark suite of framework overhead and scaling, meant to catch performance regressions in
+dataset hashing, key-making, result-finding, the Experiment callback chain, and the optimization
+backend. The benchmarks are classes written in the style of airspeed velocity (asv): each `time_*`
+method is timed once for every value in the class's `params`, after `setup` is called with that
+value. Unlike asv, `setup` is called only once per value, before all timing repeats, and each
+repeat makes `number` calls (or as many as are needed to take at least 0.2 seconds, if `number`
+is not set). The best time per call of each benchmark is reported
+
+Results can be saved as JSON for historical comparison, along with the commit and library versions
+they were measured with. Comparing with a saved result prints the ratio of each new time to the
+old one, and exits with status 1 if any benchmark slowed down by more than `--threshold`
+
+Usage
+-----
+`python benchmarks/bench_suite.py [--filter ResultFinder] [--repeat 3] [--save] [--compare PATH]`"""
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter import Environment, CVExperiment, FeatureEngineer, EngineerStep
+from hyperparameter_hunter import Categorical, Integer, Real, __version__
+from hyperparameter_hunter.algorithm_handlers import identify_algorithm_hyperparameters
+from hyperparameter_hunter.i_o.result_reader import ResultFinder
+from hyperparameter_hunter.keys.hashing import make_hash_sha256
+from hyperparameter_hunter.keys.makers import HyperparameterKeyMaker
+from hyperparameter_hunter.optimization.backends.skopt.engine import Optimizer
+from hyperparameter_hunter.settings import G
+from hyperparameter_hunter.space.space_core import Space
+from hyperparameter_hunter.utils.file_utils import read_json, write_json
+from hyperparameter_hunter.utils.learning_utils import get_toy_classification_data
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from datetime import datetime
+import io
+import numpy as np
+import os
+import pandas as pd
+import platform
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+from timeit import Timer
+from uuid import uuid4
+
+##################################################
+# Import Learning Assets
+##################################################
+import sklearn
+import skopt
+from sklearn.dummy import DummyClassifier
+from sklearn.linear_model import LogisticRegression
+
+##################################################
+# Global Settings
+##################################################
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+##################################################
+# Benchmark Fixtures
+##################################################
+def make_frame(n_rows: int, seed=32) -> pd.DataFrame:
+    """Make a DataFrame of `n_rows` with float, int, string, and categorical columns"""
+    rng = np.random.RandomState(seed)
+    frame = pd.DataFrame(rng.normal(size=(n_rows, 6)), columns=[f"float_{_}" for _ in range(6)])
+    frame["int_0"] = rng.randint(0, 1000, size=n_rows)
+    frame["int_1"] = rng.randint(0, 2, size=n_rows)
+    frame["str"] = rng.choice(["alpha", "beta", "gamma", "delta"], size=n_rows)
+    frame["category"] = frame["str"].astype("category")
+    return frame
+
+
+def make_env(results_path: str, **kwargs) -> Environment:
+    """Activate an Environment with the toy classification dataset, saving results to
+    `results_path`. Its console output is silenced"""
+    with redirect_stdout(io.StringIO()):
+        return Environment(
+            train_dataset=get_toy_classification_data(),
+            results_path=results_path,
+            metrics=["accuracy_score"],
+            cv_type="KFold",
+            cv_params=dict(n_splits=kwargs.pop("n_splits", 5), shuffle=True, random_state=32),
+            **kwargs,
+        )
+
+
+def double_inputs(all_inputs):
+    all_inputs = all_inputs * 2
+    return all_inputs
+
+
+##################################################
+# Benchmarks: Hashing and Keys
+##################################################
+class HashDataFrame:
+    """Hash DataFrames like the datasets hashed into every cross-experiment key"""
+
+    params = [1_000, 10_000, 100_000]
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        self.frame = make_frame(n_rows)
+
+    def time_make_hash_sha256(self, n_rows):
+        make_hash_sha256(self.frame)
+
+
+class KeyMakers:
+    """Make the cross-experiment key of an Environment (including its dataset hashes), and the
+    hyperparameter key of an Experiment, saving both to a temporary results directory"""
+
+    params = [None]
+    param_names = []
+
+    def setup(self, _):
+        self.results_dir = TemporaryDirectory()
+        self.env = make_env(self.results_dir.name)
+        self.hyperparameters = dict(
+            model_initializer=LogisticRegression,
+            model_init_params=LogisticRegression(C=0.5).get_params(),
+            model_extra_params=dict(fit=dict(sample_weight=None)),
+            feature_engineer=FeatureEngineer([EngineerStep(double_inputs)]),
+            feature_selector=[f"input_{_}" for _ in range(4)],
+        )
+
+    def teardown(self, _):
+        G.reset_attributes()
+        self.results_dir.cleanup()
+
+    def time_cross_experiment_key(self, _):
+        self.env.generate_cross_experiment_key()
+
+    def time_hyperparameter_key(self, _):
+        HyperparameterKeyMaker(self.hyperparameters, self.env.cross_experiment_key)
+
+
+##################################################
+# Benchmarks: Result Finding
+##################################################
+class ResultFinderFind:
+    """Find the saved Experiments compatible with an optimization space among a synthetic asset
+    directory of `n_experiments`. The directory is made by copying the description of one real
+    Experiment, so half of the copies match the space, and the other half do not"""
+
+    params = [1_000, 10_000, 50_000]
+    param_names = ["n_experiments"]
+    number = 1
+
+    def setup(self, n_experiments):
+        self.results_dir = TemporaryDirectory()
+        env = make_env(self.results_dir.name, n_splits=3)
+        with redirect_stdout(io.StringIO()):
+            template = CVExperiment(DummyClassifier, dict(strategy="prior"))
+
+        self.descriptions_dir = env.result_paths["description"]
+        self.leaderboard_path = env.result_paths["global_leaderboard"]
+        self.cross_experiment_key = env.cross_experiment_key.key
+
+        #################### Copy Template Experiment ####################
+        description = read_json(f"{self.descriptions_dir}/{template.experiment_id}.json")
+        leaderboard_row = pd.read_csv(self.leaderboard_path).iloc[0]
+        strategies = ["prior", "most_frequent", "stratified", "uniform"]
+        scores = np.random.RandomState(32).uniform(size=n_experiments)
+        rows = [dict(leaderboard_row)]
+
+        for i in range(n_experiments):
+            experiment_id, hyperparameter_key = str(uuid4()), uuid4().hex
+            description["experiment_id"] = experiment_id
+            description["hyperparameter_key"] = hyperparameter_key
+            description["hyperparameters"]["model_init_params"]["strategy"] = strategies[i % 4]
+            description["final_evaluations"]["oof"]["accuracy_score"] = scores[i]
+            write_json(f"{self.descriptions_dir}/{experiment_id}.json", description)
+            rows.append(
+                dict(
+                    leaderboard_row,
+                    oof_accuracy_score=scores[i],
+                    experiment_id=experiment_id,
+                    hyperparameter_key=hyperparameter_key,
+                )
+            )
+        pd.DataFrame(rows).to_csv(self.leaderboard_path, index=False)
+        self.n_matches = 1 + sum(i % 4 < 2 for i in range(n_experiments))
+
+        #################### Optimization Space ####################
+        choice = Categorical(strategies[:2])
+        choice._name = ("model_init_params", "strategy")
+        self.space = Space([choice])
+        self.model_params = dict(
+            model_init_params=dict(identify_algorithm_hyperparameters(DummyClassifier)),
+            model_extra_params={},
+            feature_engineer=FeatureEngineer([]),
+            feature_selector=[],
+        )
+        self.model_params["model_init_params"]["strategy"] = choice
+
+    def teardown(self, n_experiments):
+        G.reset_attributes()
+        self.results_dir.cleanup()
+
+    def time_find(self, n_experiments):
+        finder = ResultFinder(
+            "DummyClassifier",
+            "sklearn",
+            self.cross_experiment_key,
+            ("oof", "accuracy_score"),
+            self.space,
+            self.leaderboard_path,
+            self.descriptions_dir,
+            self.model_params,
+        )
+        with redirect_stdout(io.StringIO()):
+            finder.find()
+        assert len(finder.similar_experiments) == self.n_matches
+
+
+##################################################
+# Benchmarks: Experiment Overhead
+##################################################
+class CVExperimentOverhead:
+    """Run a 5-fold :class:`~hyperparameter_hunter.experiments.CVExperiment` with a constant-time
+    dummy model, so nearly all of its time is spent by the framework: data chunking, the callback
+    chain, evaluation, logging, and saving result files"""
+
+    params = [1, 10]
+    param_names = ["runs"]
+
+    def setup(self, runs):
+        self.results_dir = TemporaryDirectory()
+        make_env(self.results_dir.name, runs=runs)
+
+    def teardown(self, runs):
+        G.reset_attributes()
+        self.results_dir.cleanup()
+
+    def time_cv_experiment(self, runs):
+        with redirect_stdout(io.StringIO()):
+            CVExperiment(DummyClassifier, dict(strategy="prior"))
+
+
+##################################################
+# Benchmarks: Optimization Backend
+##################################################
+def make_dimensions() -> list:
+    return [
+        Real(0.001, 10.0, prior="log-uniform", name="C"),
+        Real(0.0, 1.0, name="l1_ratio"),
+        Integer(10, 500, name="max_iter"),
+        Categorical(["lbfgs", "saga", "liblinear"], name="solver"),
+    ]
+
+
+class OptimizerTell:
+    """Tell a new :class:`~hyperparameter_hunter.optimization.backends.skopt.engine.Optimizer`
+    `n_points` observations at once, which fits its Gaussian process, and finds its next point.
+    The time includes initializing the `Optimizer`"""
+
+    params = [50, 500]
+    param_names = ["n_points"]
+    number = 1
+
+    def setup(self, n_points):
+        self.points = Space(make_dimensions()).rvs(n_points, random_state=32)
+        self.evaluations = np.random.RandomState(32).uniform(size=n_points).tolist()
+
+    def time_tell(self, n_points):
+        optimizer = Optimizer(make_dimensions(), n_initial_points=10, random_state=32)
+        optimizer.tell(self.points, self.evaluations)
+
+
+class SpaceSampling:
+    """Draw random points from a :class:`~hyperparameter_hunter.space.space_core.Space`, and
+    transform them into the warped space given to the optimizer's estimator"""
+
+    params = [10_000]
+    param_names = ["n_samples"]
+
+    def setup(self, n_samples):
+        self.space = Space(make_dimensions())
+        self.samples = self.space.rvs(n_samples, random_state=32)
+
+    def time_rvs(self, n_samples):
+        self.space.rvs(n_samples, random_state=32)
+
+    def time_transform(self, n_samples):
+        self.space.transform(self.samples)
+
+
+BENCHMARKS = [
+    HashDataFrame,
+    KeyMakers,
+    ResultFinderFind,
+    CVExperimentOverhead,
+    OptimizerTell,
+    SpaceSampling,
+]
+
+
+##################################################
+# Execution
+##################################################
+def benchmark_name(cls: type, method_name: str, param) -> str:
+    """Name a benchmark result, like "HashDataFrame.time_make_hash_sha256(n_rows=1000)" """
+    args = ", ".join(f"{k}={v}" for k, v in zip(cls.param_names, [param]))
+    return f"{cls.__name__}.{method_name}({args})"
+
+
+def run_benchmark(cls: type, param, repeat: int, name_filter: str = None) -> dict:
+    """Time each `time_*` method of `cls` with `param`, returning the best time per call of each
+    in seconds, keyed by :func:`benchmark_name`"""
+    methods = [_ for _ in dir(cls) if _.startswith("time_")]
+    methods = [
+        _ for _ in methods if not name_filter or name_filter in benchmark_name(cls, _, param)
+    ]
+    if not methods:
+        return {}
+
+    instance = cls()
+    getattr(instance, "setup", lambda _: None)(param)
+    results = {}
+
+    try:
+        for method_name in methods:
+            timer = Timer(lambda: getattr(instance, method_name)(param))
+            number = getattr(cls, "number", None) or timer.autorange()[0]
+            results[benchmark_name(cls, method_name, param)] = (
+                min(timer.repeat(repeat=repeat, number=number)) / number
+            )
+    finally:
+        getattr(instance, "teardown", lambda _: None)(param)
+    return results
+
+
+def get_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            universal_newlines=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("µs", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def execute(repeat: int, name_filter=None, save=False, compare=None, threshold=0.2) -> int:
+    """Run the benchmarks, printing each result, then optionally save and compare the results
+
+    Returns
+    -------
+    Int
+        1 if `compare` was given, and a benchmark was slower than its previous time by more than
+        `threshold` (as a fraction of the previous time). Else 0"""
+    previous = read_json(compare)["results"] if compare else {}
+    results = {}
+    regressions = []
+
+    for cls in BENCHMARKS:
+        for param in cls.params:
+            for name, seconds in run_benchmark(cls, param, repeat, name_filter).items():
+                results[name] = seconds
+                line = f"{name:<64}{format_time(seconds):>12}"
+                if name in previous:
+                    ratio = seconds / previous[name]
+                    line += f"{ratio:>10.2f}x"
+                    if ratio > 1 + threshold:
+                        regressions.append(name)
+                        line += "  (slower)"
+                print(line, flush=True)
+
+    if save:
+        commit = get_commit()
+        timestamp = datetime.now()
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(
+            RESULTS_DIR, f"{timestamp:%Y%m%d-%H%M%S}_{(commit or 'unknown')[:8]}.json"
+        )
+        write_json(
+            path,
+            dict(
+                commit=commit,
+                timestamp=str(timestamp),
+                machine=dict(
+                    node=platform.node(),
+                    platform=platform.platform(),
+                    processor=platform.processor(),
+                ),
+                versions=dict(
+                    python=platform.python_version(),
+                    hyperparameter_hunter=__version__,
+                    numpy=np.__version__,
+                    pandas=pd.__version__,
+                    sklearn=sklearn.__version__,
+                    skopt=skopt.__version__,
+                ),
+                repeat=repeat,
+                results=results,
+            ),
+        )
+        print(f"Saved results to {path}")
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than {compare} by over {threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--filter", help="Only run benchmarks whose names contain this string")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats per benchmark")
+    parser.add_argument("--save", action="store_true", help=f"Save results to {RESULTS_DIR}")
+    parser.add_argument("--compare", help="Path to saved results to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Fractional slowdown reported as a regression"
+    )
+    args = parser.parse_args()
+    sys.exit(execute(args.repeat, args.filter, args.save, args.compare, args.threshold))
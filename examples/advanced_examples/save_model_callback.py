@@ -117,16 +117,17 @@ makedirs("_saved_models/best", exist_ok=True)
 
 def save_best_model(_rep, _fold, _run, model, stat_aggregates):
     all_scores = stat_aggregates["evaluations"]["oof_roc_auc_score"]["runs"]
-    # Get all scores by "run" that have been recorded.
+    # Get the array of scores by "run", of shape (<reps>, <folds>, <runs>). Runs that have not
+    #   ended yet are NaN
     # NOTE: We need the "oof_" prefix in "oof_roc_auc_score" above to specify we want our
     #   out-of-fold scores as opposed to "holdout" scores
 
-    current_score = all_scores[-1]
-    # Get the last (most recent) score in the above `all_scores` list
+    current_score = all_scores[_rep, _fold, _run]
+    # Get the score of the current (most recent) run in the above `all_scores` array
 
-    if current_score >= np.max(all_scores):
+    if current_score >= np.nanmax(all_scores):
         # Check if our current score is greater than all previous scores
-        # If you're measuring loss/error, change `np.max` to `np.min`
+        # If you're measuring loss/error, change `np.nanmax` to `np.nanmin`
 
         print(f"NEW BEST:   {current_score}   @ R{_rep} / f{_fold} / r{_run}")
         model.model.save_model(f"_saved_models/best/model_{_rep}_{_fold}_{_run}_{current_score}")
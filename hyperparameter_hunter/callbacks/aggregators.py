@@ -2,12 +2,20 @@
 # Import Own Assets
 ##################################################
 from hyperparameter_hunter.callbacks.bases import BaseAggregatorCallback
+from hyperparameter_hunter.settings import G
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
 from datetime import datetime
 import numpy as np
+import sys
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 
 class AggregatorTimes(BaseAggregatorCallback):
@@ -72,61 +80,261 @@ class AggregatorTimes(BaseAggregatorCallback):
 
 
 class AggregatorEvaluations(BaseAggregatorCallback):
+    """Record the evaluation of each metric on each dataset at the end of every run, fold, and
+    repetition, and of the entire Experiment, in `stat_aggregates["evaluations"]`. Each key is
+    formatted as "<dataset>_<metric>", like "oof_roc_auc_score", and maps to a dict, whose "runs",
+    "folds", and "reps" are arrays of shape (<reps>, <folds>, <runs>), (<reps>, <folds>), and
+    (<reps>,), respectively. Evaluations of divisions that have not ended yet are NaN
+
+    Notes
+    -----
+    The arrays are filled in place, using each division's indexes. They are converted to nested
+    lists only when the Experiment's description is saved by
+    :class:`~hyperparameter_hunter.i_o.recorders.DescriptionRecorder`"""
+
     stat_aggregates: dict
     last_evaluation_results: dict
+    experiment_params: dict
     _rep: int
     _fold: int
     _run: int
 
+    def on_exp_start(self):
+        self.__evaluation_keys = {}
+        super().on_exp_start()
+
     def on_run_end(self):
+        self.__update_evaluations("runs", (self._rep, self._fold, self._run))
+        super().on_run_end()
+
+    def on_fold_end(self):
+        self.__update_evaluations("folds", (self._rep, self._fold))
+        super().on_fold_end()
+
+    def on_rep_end(self):
+        self.__update_evaluations("reps", (self._rep,))
+        super().on_rep_end()
+
+    def on_exp_end(self):
+        self.__update_evaluations("final", None)
+        super().on_exp_end()
+
+    def __initialize_evaluations(self):
+        """Map the aggregate keys of the metrics in :attr:`last_evaluation_results` to their dataset
+        and metric keys, and preallocate the arrays of evaluations. If the "evaluations" aggregates
+        already exist (as when resuming from a checkpoint), only the keys are mapped"""
+        evaluations = self.stat_aggregates.setdefault("evaluations", {})
+        runs_shape = np.shape(self.experiment_params["random_seeds"])
+
+        for dataset_key, metric_results in self.last_evaluation_results.items():
+            for metric_key in metric_results or {}:
+                agg_key = "{}_{}".format(dataset_key, metric_key)
+                self.__evaluation_keys[agg_key] = (dataset_key, metric_key)
+                evaluations.setdefault(
+                    agg_key,
+                    dict(
+                        runs=np.full(runs_shape, np.nan),
+                        folds=np.full(runs_shape[:-1], np.nan),
+                        reps=np.full(runs_shape[:1], np.nan),
+                        final=None,
+                    ),
+                )
+
+    def __update_evaluations(self, division: str, index):
+        """Record the current evaluation of each metric in the `division` aggregates of
+        `stat_aggregates["evaluations"]`, at `index`. If `index` is None, the evaluation replaces
+        the aggregate, rather than being set in its array"""
         #################### Initialize Evaluations Aggregator ####################
-        if len(self.stat_aggregates.setdefault("evaluations", {}).keys()) == 0:
-            for dataset_key, metric_results in self.last_evaluation_results.items():
-                if metric_results is not None:
-                    self.stat_aggregates["evaluations"].update(
-                        {
-                            "{}_{}".format(dataset_key, metric_key): dict(
-                                runs=[], folds=[], reps=[], final=None
-                            )
-                            for metric_key in metric_results.keys()
-                        }
-                    )
-
-        #################### Update Evaluations for Run ####################
-        for agg_key, agg_val in self.stat_aggregates["evaluations"].items():
-            agg_val["runs"].append(self.__loop_helper(agg_key))
+        # Not necessarily in `on_run_end`, since resumed Experiments may skip the runs of a rep
+        if not self.__evaluation_keys:
+            self.__initialize_evaluations()
+
+        evaluations = self.stat_aggregates["evaluations"]
+
+        for agg_key, (dataset_key, metric_key) in self.__evaluation_keys.items():
+            value = (self.last_evaluation_results.get(dataset_key) or {}).get(metric_key)
+            agg_val = evaluations[agg_key]
+
+            if index is None:
+                agg_val[division] = value
+                continue
+            try:
+                agg_val[division][index] = value
+            except (TypeError, ValueError):
+                # Non-numeric evaluations (or None) are kept by switching to an object array
+                agg_val[division] = agg_val[division].astype(object)
+                agg_val[division][index] = value
+
+
+class AggregatorMemory(BaseAggregatorCallback):
+    """Record the peak memory usage (in MiB) of each run, fold, and repetition, and of the entire
+    Experiment, in `stat_aggregates["memory"]`. Added to Experiments if the active Environment's
+    `track_memory` is truthy. The peak resident set size of the process is recorded under "rss".
+    If `track_memory` is "tracemalloc", the peak memory traced by :mod:`tracemalloc` is recorded
+    under "tracemalloc", as well
+
+    Notes
+    -----
+    Memory is sampled at the start and end of every division. By default, the peak RSS is never
+    reset, since it is the peak of the whole process. A division's RSS peak is then only known if
+    the peak of the process rose during the division, and it is None otherwise. If `track_memory`
+    is "reset_rss", the peak RSS of the process is reset after each sample (only possible on
+    Linux), so each sample is the peak since the previous sample, and counts toward the peaks of
+    all divisions in progress. This changes the peak RSS seen by anything else in the process. On
+    Python < 3.9, the tracemalloc peak is reset by clearing the traced allocations, so it only
+    includes memory allocated since the previous sample"""
+
+    stat_aggregates: dict
+    _rep: int
+    _fold: int
+    _run: int
+
+    def on_exp_start(self):
+        self.__kinds = ["rss"] if get_peak_rss() is not None else []
+        self.__reset_rss = G.Env.track_memory == "reset_rss"
+        self.__started_tracing = False
+        if G.Env.track_memory == "tracemalloc":
+            self.__kinds.append("tracemalloc")
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self.__started_tracing = True
+
+        self.stat_aggregates["memory"] = {
+            _: dict(runs=[], folds=[], reps=[], final=None) for _ in self.__kinds
+        }
+        self.__open_peaks = {}
+        self.__rss_at_open = {}
+        self.__open_division("final")
+        super().on_exp_start()
+
+    def on_rep_start(self):
+        self.__open_division("reps")
+        super().on_rep_start()
+
+    def on_fold_start(self):
+        self.__open_division("folds")
+        super().on_fold_start()
+
+    def on_run_start(self):
+        self.__open_division("runs")
+        super().on_run_start()
 
+    def on_run_end(self):
+        self.__close_division("runs")
         super().on_run_end()
 
     def on_fold_end(self):
-        for agg_key, agg_val in self.stat_aggregates["evaluations"].items():
-            agg_val["folds"].append(self.__loop_helper(agg_key))
+        self.__close_division("folds")
         super().on_fold_end()
 
     def on_rep_end(self):
-        for agg_key, agg_val in self.stat_aggregates["evaluations"].items():
-            agg_val["reps"].append(self.__loop_helper(agg_key))
+        self.__close_division("reps")
         super().on_rep_end()
 
     def on_exp_end(self):
-        for agg_key, agg_val in self.stat_aggregates["evaluations"].items():
-            agg_val["final"] = self.__loop_helper(agg_key)
+        self.__close_division("final")
+        if self.__started_tracing:
+            tracemalloc.stop()
 
-            #################### Reshape Aggregates to be of Proper Dimensions ####################
-            runs_shape = (self._rep + 1, self._fold + 1, self._run + 1)
-            agg_val["runs"] = np.reshape(agg_val["runs"], runs_shape).tolist()
-            agg_val["folds"] = np.reshape(agg_val["folds"], runs_shape[:-1]).tolist()
+        #################### Reshape Run/Fold Peaks to be of Proper Dimensions ####################
+        runs_shape = (self._rep + 1, self._fold + 1, self._run + 1)
+        for agg_val in self.stat_aggregates["memory"].values():
+            for (key, shape) in [("runs", runs_shape), ("folds", runs_shape[:-1])]:
+                # Peaks of divisions restored from a checkpoint saved without them are None
+                values = [None] * (int(np.prod(shape)) - len(agg_val[key])) + agg_val[key]
+                agg_val[key] = np.reshape(values, shape).tolist()
 
         super().on_exp_end()
 
-    def __loop_helper(self, agg_key):
-        # TODO: Add documentation
-        for dataset_key, metric_results in self.last_evaluation_results.items():
-            if metric_results is not None:
-                for metric_key, metric_value in metric_results.items():
-                    if agg_key == "{}_{}".format(dataset_key, metric_key):
-                        return metric_value
-        return None
+    def __sample(self):
+        """Add the memory peaks since the last sample to the peaks of all open divisions, and
+        return them"""
+        samples = {}
+        if "rss" in self.__kinds:
+            samples["rss"] = get_peak_rss(reset=self.__reset_rss)
+        if "tracemalloc" in self.__kinds:
+            samples["tracemalloc"] = get_peak_traced(reset=True)
+
+        for peaks in self.__open_peaks.values():
+            for kind in peaks:
+                peaks[kind] = max(peaks[kind], samples[kind])
+        return samples
+
+    def __open_division(self, division):
+        samples = self.__sample()
+        self.__open_peaks[division] = dict.fromkeys(self.__kinds, 0.0)
+        if "rss" in samples and not self.__reset_rss:
+            self.__rss_at_open[division] = samples["rss"]
+
+    def __close_division(self, division):
+        self.__sample()
+        peaks = self.__open_peaks.pop(division)
+        if division in self.__rss_at_open and peaks["rss"] <= self.__rss_at_open.pop(division):
+            peaks["rss"] = None  # The peak of the process was reached before the division
+
+        # `stat_aggregates` may have been restored from a checkpoint saved without memory peaks
+        memory = self.stat_aggregates.setdefault("memory", {})
+        for kind, peak in peaks.items():
+            agg_val = memory.setdefault(kind, dict(runs=[], folds=[], reps=[], final=None))
+            if division == "final":
+                agg_val[division] = peak
+            else:
+                agg_val[division].append(peak)
+
+
+def get_peak_rss(reset=False):
+    """Get the peak resident set size of the current process
+
+    Parameters
+    ----------
+    reset: Boolean, default=False
+        If True, reset the peak to the current resident set size after reading it, by writing to
+        "/proc/self/clear_refs". This is only possible on Linux, and it resets the peak for the
+        whole process, including any other code that reads it. Elsewhere, the peak never decreases
+
+    Returns
+    -------
+    Float, or None
+        Peak resident set size in MiB, or None if it cannot be determined on this platform"""
+    peak = None
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    peak = int(line.split()[1]) / 1024
+                    break
+        if reset:
+            with open("/proc/self/clear_refs", "w") as f:
+                f.write("5")
+    except OSError:
+        pass
+
+    if peak is None and resource is not None:
+        # `ru_maxrss` is in bytes on macOS, and in kilobytes elsewhere
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak = max_rss / 1024 ** (2 if sys.platform == "darwin" else 1)
+    return peak
+
+
+def get_peak_traced(reset=False):
+    """Get the peak size of the memory blocks traced by :mod:`tracemalloc`
+
+    Parameters
+    ----------
+    reset: Boolean, default=False
+        If True, reset the peak after reading it. On Python < 3.9, this clears all traces
+
+    Returns
+    -------
+    Float
+        Peak size of traced memory blocks in MiB"""
+    peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    if reset:
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.clear_traces()
+    return peak
 
 
 class AggregatorOOF(BaseAggregatorCallback):
@@ -43,10 +43,13 @@ class LoggerFitStatus(BaseLoggerCallback):
             G.log("", previous_frame=inspect.currentframe().f_back)
         super().on_fold_start()
 
+    # Status messages are given to `G.log`/`G.debug` as callables, so they are only built if emitted
     def on_run_start(self):
-        content = format_fold_run(rep=self._rep, fold=self._fold, run=self._run)
-        content += format(self.log_separator if content != "" and self.current_seed else "")
-        content += "Seed: {}".format(self.current_seed) if self.current_seed else ""
+        def content():
+            _content = format_fold_run(rep=self._rep, fold=self._fold, run=self._run)
+            _content += format(self.log_separator if _content != "" and self.current_seed else "")
+            _content += "Seed: {}".format(self.current_seed) if self.current_seed else ""
+            return _content
 
         if G.Env.verbose >= 4 and G.Env.runs > 1:
             G.log(content, previous_frame=inspect.currentframe().f_back, add_time=True)
@@ -55,24 +58,31 @@ class LoggerFitStatus(BaseLoggerCallback):
         super().on_run_start()
 
     def on_run_end(self):
-        content = [
-            format_fold_run(rep=self._rep, fold=self._fold, run=self._run),
-            format_evaluation(self.last_evaluation_results, float_format=self.float_format),
-            self.__elapsed_helper("runs"),
-        ]
+        def content():
+            return self.log_separator.join(
+                [
+                    format_fold_run(rep=self._rep, fold=self._fold, run=self._run),
+                    format_evaluation(self.last_evaluation_results, float_format=self.float_format),
+                    self.__elapsed_helper("runs"),
+                ]
+            )
 
         if G.Env.verbose >= 3 and G.Env.runs > 1:
-            G.log(self.log_separator.join(content), previous_frame=inspect.currentframe().f_back)
+            G.log(content, previous_frame=inspect.currentframe().f_back)
         else:
-            G.debug(self.log_separator.join(content), previous_frame=inspect.currentframe().f_back)
+            G.debug(content, previous_frame=inspect.currentframe().f_back)
         super().on_run_end()
 
     def on_fold_end(self):
-        content = format_fold_run(rep=self._rep, fold=self._fold, run="-")
-        content += self.log_separator if not content.endswith(" ") else ""
-        content += format_evaluation(self.last_evaluation_results, float_format=self.float_format)
-        content += self.log_separator if not content.endswith(" ") else ""
-        content += self.__elapsed_helper("folds")
+        def content():
+            _content = format_fold_run(rep=self._rep, fold=self._fold, run="-")
+            _content += self.log_separator if not _content.endswith(" ") else ""
+            _content += format_evaluation(
+                self.last_evaluation_results, float_format=self.float_format
+            )
+            _content += self.log_separator if not _content.endswith(" ") else ""
+            _content += self.__elapsed_helper("folds")
+            return _content
 
         if G.Env.verbose >= 2 and G.Env.cv_params["n_splits"] > 1:
             G.log(content, previous_frame=inspect.currentframe().f_back, add_time=False)
@@ -81,11 +91,15 @@ class LoggerFitStatus(BaseLoggerCallback):
         super().on_fold_end()
 
     def on_rep_end(self):
-        content = format_fold_run(rep=self._rep, fold="-", run="-")
-        content += self.log_separator if not content.endswith(" ") else ""
-        content += format_evaluation(self.last_evaluation_results, float_format=self.float_format)
-        content += self.log_separator if not content.endswith(" ") else ""
-        content += self.__elapsed_helper("reps")
+        def content():
+            _content = format_fold_run(rep=self._rep, fold="-", run="-")
+            _content += self.log_separator if not _content.endswith(" ") else ""
+            _content += format_evaluation(
+                self.last_evaluation_results, float_format=self.float_format
+            )
+            _content += self.log_separator if not _content.endswith(" ") else ""
+            _content += self.__elapsed_helper("reps")
+            return _content
 
         if G.Env.verbose >= 2 and G.Env.cv_params.get("n_repeats", 1) > 1:
             G.log(content, previous_frame=inspect.currentframe().f_back)
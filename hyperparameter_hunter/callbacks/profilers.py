@@ -0,0 +1,363 @@
+"""This module defines the tools used to profile the callbacks of an Experiment, which are enabled
+by :class:`~hyperparameter_hunter.environment.Environment`'s `profile_callbacks` kwarg. Everything
+an Experiment does between fitting and predicting happens in a long chain of callback methods, each
+of which ends by calling the method of the same name on the next class in the Experiment's MRO. To
+measure each link of that chain, :func:`profile_bases` replaces every callback base class assembled
+by :class:`~hyperparameter_hunter.experiment_core.ExperimentMeta` with a thin subclass, whose
+division methods (`on_{exp,rep,fold,run}_{start,end}`) time the original methods with a
+:class:`CallbackProfiler`. Because each subclass immediately precedes its original class in the
+MRO, the time spent by a callback method can be separated from the time spent by the callback
+methods it reaches via `super()`
+
+Related
+-------
+:mod:`hyperparameter_hunter.experiment_core`
+    Uses :func:`profile_bases` to wrap the bases of an Experiment if `G.Env.profile_callbacks`
+:mod:`hyperparameter_hunter.experiments`
+    Experiments create the :class:`CallbackProfiler` used by the wrapped bases, and add its
+    :meth:`CallbackProfiler.summary` to their `stat_aggregates`
+:mod:`hyperparameter_hunter.i_o.recorders`
+    :class:`~hyperparameter_hunter.i_o.recorders.CallbackProfileRecorder` saves the
+    :meth:`CallbackProfiler.to_chrome_trace` of an Experiment to its "CallbackProfiles" directory
+
+The time spent by an Experiment as a whole is split between its model and the framework by
+:class:`StageTimer`, which is always used, regardless of `profile_callbacks`
+
+Notes
+-----
+The time spent in intermediate base classes shared by several callbacks (like
+:class:`~hyperparameter_hunter.callbacks.bases.BaseCallback`) cannot be wrapped without changing
+the MRO, so it is counted in the exclusive time of the callback that precedes them in the MRO"""
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+##################################################
+# Global Variables
+##################################################
+DIVISION_METHODS = [
+    f"on_{division}_{point}"
+    for division in ["exp", "rep", "fold", "run"]
+    for point in ["start", "end"]
+]
+MODEL_STAGES = ["fit", "predict"]
+FRAMEWORK_STAGES = ["key_making", "feature_engineering", "evaluation", "recording"]
+
+
+##################################################
+# Callback Profiler
+##################################################
+class CallbackProfiler(object):
+    def __init__(self, clock=perf_counter):
+        """Record the inclusive and exclusive time of every profiled callback method call made by
+        an Experiment. Inclusive time is the total time between the call and its return, which
+        includes all of the callback methods called after it in the MRO. Exclusive time is the
+        inclusive time, less the inclusive time of the next profiled callback method it calls
+
+        Parameters
+        ----------
+        clock: Callable, default=`time.perf_counter`
+            Function returning the current time in seconds
+
+        Attributes
+        ----------
+        events: List[dict]
+            One dict for each completed call, with the keys "callback", "method", "start",
+            "inclusive", "exclusive", and "division". "start" is the number of seconds since the
+            profiler was created, and "division" is a dict of the Experiment's current "rep",
+            "fold", and "run" indexes
+        totals: Dict[str, Dict[str, dict]]
+            Maps the names of callbacks to dicts, which map the names of their methods to dicts of
+            "calls", "inclusive" and "exclusive" sums
+
+        Examples
+        --------
+        >>> times = iter([0.0, 1.0, 1.5, 2.5, 4.0])
+        >>> profiler = CallbackProfiler(clock=lambda: next(times))
+        >>> outer = profiler.enter()
+        >>> inner = profiler.enter()
+        >>> profiler.exit(inner, "Inner", "on_run_end")
+        >>> profiler.exit(outer, "Outer", "on_run_end")
+        >>> summary = profiler.summary()
+        >>> summary["Inner"]
+        {'on_run_end': {'calls': 1, 'inclusive': 1.0, 'exclusive': 1.0}}
+        >>> summary["Outer"]
+        {'on_run_end': {'calls': 1, 'inclusive': 3.0, 'exclusive': 2.0}}"""
+        self.clock = clock
+        self.origin = clock()
+        self.events = []
+        self.totals = {}
+        self._stack = []
+
+    def enter(self) -> list:
+        """Mark the start of a profiled call. Must be paired with :meth:`exit`
+
+        Returns
+        -------
+        List
+            Token to give to :meth:`exit`, holding the start time of the call, and the inclusive
+            time of the profiled calls made within it"""
+        token = [self.clock(), 0.0]
+        self._stack.append(token)
+        return token
+
+    def exit(self, token: list, callback: str, method: str, division: dict = None):
+        """Mark the end of the profiled call started by :meth:`enter`, and record its times
+
+        Parameters
+        ----------
+        token: List
+            Value returned by the :meth:`enter` call that started the profiled call
+        callback: String
+            Name of the callback whose method was called
+        method: String
+            Name of the method that was called, like "on_fold_end"
+        division: Dict, or None, default=None
+            Indexes of the Experiment's current divisions, recorded with the call"""
+        start, nested = self._stack.pop()
+        inclusive = self.clock() - start
+        exclusive = inclusive - nested
+        if self._stack:
+            self._stack[-1][1] += inclusive
+
+        self.events.append(
+            dict(
+                callback=callback,
+                method=method,
+                start=start - self.origin,
+                inclusive=inclusive,
+                exclusive=exclusive,
+                division=division or {},
+            )
+        )
+
+        total = self.totals.setdefault(callback, {}).setdefault(
+            method, dict(calls=0, inclusive=0.0, exclusive=0.0)
+        )
+        total["calls"] += 1
+        total["inclusive"] += inclusive
+        total["exclusive"] += exclusive
+
+    def summary(self) -> dict:
+        """Summarize the recorded calls for the Experiment's `stat_aggregates`
+
+        Returns
+        -------
+        Dict
+            Copy of :attr:`totals`, sorted by callback name"""
+        return {k: {m: dict(t) for m, t in v.items()} for k, v in sorted(self.totals.items())}
+
+    def to_chrome_trace(self) -> dict:
+        """Format the recorded calls as a Chrome trace, which can be opened by "chrome://tracing",
+        or by Perfetto. Each call is a complete event ("ph": "X"), and the :meth:`summary` is
+        included in the trace's "otherData"
+
+        Returns
+        -------
+        Dict
+            Chrome trace object, with times in microseconds"""
+        trace_events = [
+            dict(
+                name=f"{_['callback']}.{_['method']}",
+                cat=_["method"],
+                ph="X",
+                ts=round(_["start"] * 1e6, 3),
+                dur=round(_["inclusive"] * 1e6, 3),
+                pid=0,
+                tid=0,
+                args=dict(exclusive_us=round(_["exclusive"] * 1e6, 3), **_["division"]),
+            )
+            for _ in self.events
+        ]
+        return dict(
+            traceEvents=trace_events, displayTimeUnit="ms", otherData=dict(summary=self.summary())
+        )
+
+
+##################################################
+# Stage Timer
+##################################################
+class StageTimer(object):
+    def __init__(self, clock=perf_counter):
+        """Record the wall time of an Experiment, and the time it spent in each of its stages, to
+        tell how much of it went to fitting and predicting with its model, and how much went to
+        the framework. Stages must not be nested
+
+        Parameters
+        ----------
+        clock: Callable, default=`time.perf_counter`
+            Function returning the current time in seconds
+
+        Attributes
+        ----------
+        origin: Float
+            Time at which the timer was created
+        totals: Dict[str, float]
+            Maps the names of stages to the total seconds spent in them
+
+        Examples
+        --------
+        >>> times = iter([0.0, 1.0, 4.0, 5.0, 5.5, 8.0])
+        >>> timer = StageTimer(clock=lambda: next(times))
+        >>> with timer.time("fit"):
+        ...     pass
+        >>> with timer.time("evaluation"):
+        ...     pass
+        >>> report = timer.report()
+        >>> [report[_] for _ in ["total", "model", "framework", "framework_fraction"]]
+        [8.0, 3.0, 5.0, 0.625]
+        >>> [report[_] for _ in ["fit", "predict", "evaluation", "recording", "other"]]
+        [3.0, 0.0, 0.5, 0.0, 4.5]"""
+        self.clock = clock
+        self.origin = clock()
+        self.totals = {}
+
+    @contextmanager
+    def time(self, stage: str):
+        """Add the time spent in the body of the `with` statement to the total of `stage`
+
+        Parameters
+        ----------
+        stage: String
+            Name of the stage, like those in `MODEL_STAGES` and `FRAMEWORK_STAGES`"""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.totals[stage] = self.totals.get(stage, 0.0) + self.clock() - start
+
+    def report(self) -> dict:
+        """Summarize the time spent so far for the Experiment's `stat_aggregates`
+
+        Returns
+        -------
+        Dict
+            Seconds spent in "total", by the "model" (the sum of `MODEL_STAGES`), and by the
+            "framework" (everything else), followed by the "framework_fraction" of the total, and
+            the seconds spent in each stage. Framework time not spent in any of `FRAMEWORK_STAGES`
+            (like callback dispatch, fold splitting, and logging) is reported as "other\""""
+        total = self.clock() - self.origin
+        stages = {_: self.totals.get(_, 0.0) for _ in MODEL_STAGES + FRAMEWORK_STAGES}
+        model = sum(stages[_] for _ in MODEL_STAGES)
+        framework = total - model
+
+        return dict(
+            total=total,
+            model=model,
+            framework=framework,
+            framework_fraction=framework / total if total else 0.0,
+            **stages,
+            other=framework - sum(stages[_] for _ in FRAMEWORK_STAGES),
+        )
+
+
+##################################################
+# Profiled Bases
+##################################################
+def profile_bases(bases: tuple) -> tuple:
+    """Wrap the callback classes in `bases`, so their division methods are timed by the
+    :class:`CallbackProfiler` found at the `callback_profiler` attribute of the Experiment
+
+    Parameters
+    ----------
+    bases: Tuple
+        Callback base classes of an Experiment, as assembled by
+        :class:`~hyperparameter_hunter.experiment_core.ExperimentMeta`
+
+    Returns
+    -------
+    Tuple
+        `bases`, in which each class is replaced by a subclass that profiles the division methods
+        it defines. Classes with the same name (like those made by
+        :func:`~hyperparameter_hunter.callbacks.bases.lambda_callback`) are profiled under the
+        names "<name>", "<name>[1]", "<name>[2]", and so on
+
+    Examples
+    --------
+    >>> class Foo:
+    ...     def on_run_end(self):
+    ...         pass
+    >>> profiled = profile_bases((Foo, Foo))
+    >>> [_.__name__ for _ in profiled]
+    ['ProfiledFoo', 'ProfiledFoo']
+    >>> [issubclass(_, Foo) for _ in profiled]
+    [True, True]
+    >>> [_.on_run_end.__name__ for _ in profiled]
+    ['on_run_end', 'on_run_end']"""
+    labels = {}
+    profiled = []
+
+    for base in bases:
+        label = base.__name__
+        labels[label] = labels.get(label, -1) + 1
+        if labels[label]:
+            label = f"{label}[{labels[label]}]"
+        profiled.append(_profile_base(base, label))
+
+    return tuple(profiled)
+
+
+def _profile_base(base: type, label: str) -> type:
+    """Create a subclass of `base` that profiles the division methods defined by `base` under the
+    name `label`"""
+    namespace = {"__module__": base.__module__, "__doc__": base.__doc__}
+    for method_name in DIVISION_METHODS:
+        if method_name in vars(base):
+            namespace[method_name] = _profile_method(vars(base)[method_name], method_name, label)
+    return type(f"Profiled{base.__name__}", (base,), namespace)
+
+
+def make_experiment_profiler() -> type:
+    """Create a class that profiles the division methods of the Experiment itself. It should
+    directly precede the Experiment's original bases, so the exclusive time of its methods is the
+    time spent by the Experiment's methods before the next callback's. It is profiled under the
+    name of the Experiment's class
+
+    Returns
+    -------
+    Type
+        Class whose division methods only call those of the next class in the MRO
+
+    Examples
+    --------
+    >>> class Workflow:
+    ...     def on_fold_end(self):
+    ...         print("Fold ended")
+    >>> class Experiment(make_experiment_profiler(), Workflow):
+    ...     callback_profiler = CallbackProfiler()
+    >>> experiment = Experiment()
+    >>> experiment.on_fold_end()
+    Fold ended
+    >>> experiment.callback_profiler.totals["Experiment"]["on_fold_end"]["calls"]
+    1"""
+
+    def _method_factory(method_name):
+        def _method(self, *args, **kwargs):
+            return getattr(super(ProfiledExperiment, self), method_name)(*args, **kwargs)
+
+        return _profile_method(_method, method_name, None)
+
+    namespace = {_: _method_factory(_) for _ in DIVISION_METHODS}
+    ProfiledExperiment = type("ProfiledExperiment", (object,), namespace)
+    return ProfiledExperiment
+
+
+def _profile_method(method, method_name: str, label):
+    """Wrap the division method `method`, named `method_name`, so its calls are recorded by the
+    Experiment's `callback_profiler` under the callback name `label`. If `label` is None, the name
+    of the Experiment's class is used"""
+
+    @wraps(method)
+    def _profiled_method(self, *args, **kwargs):
+        profiler = self.callback_profiler
+        token = profiler.enter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            division = {_: self.__dict__.get(f"_{_}") for _ in ["rep", "fold", "run"]}
+            profiler.exit(token, label or type(self).__name__, method_name, division)
+
+    return _profiled_method
@@ -37,6 +37,7 @@ Related
 # Import Own Assets
 ##################################################
 from hyperparameter_hunter.callbacks.bases import BasePredictorCallback
+from hyperparameter_hunter.callbacks.profilers import StageTimer
 from hyperparameter_hunter.data import OOFDataset, HoldoutDataset, TestDataset
 
 
@@ -45,6 +46,7 @@ from hyperparameter_hunter.data import OOFDataset, HoldoutDataset, TestDataset
 ##################################################
 class PredictorOOF(BasePredictorCallback):
     data_oof: OOFDataset
+    stage_timer: StageTimer
 
     #################### Division Start Points ####################
     def on_exp_start(self):
@@ -65,7 +67,8 @@ class PredictorOOF(BasePredictorCallback):
 
     #################### Division End Points ####################
     def on_run_end(self):
-        prediction = self.model.predict(self.data_oof.input.T.fold)
+        with self.stage_timer.time("predict"):
+            prediction = self.model.predict(self.data_oof.input.T.fold)
         self.data_oof.prediction.on_run_end(
             prediction, self.feature_engineer, self.target_column, self.validation_index
         )
@@ -86,6 +89,7 @@ class PredictorOOF(BasePredictorCallback):
 
 class PredictorHoldout(BasePredictorCallback):
     data_holdout: HoldoutDataset
+    stage_timer: StageTimer
 
     #################### Division Start Points ####################
     def on_exp_start(self):
@@ -106,7 +110,8 @@ class PredictorHoldout(BasePredictorCallback):
 
     #################### Division End Points ####################
     def on_run_end(self):
-        prediction = self.model.predict(self.data_holdout.input.T.fold)
+        with self.stage_timer.time("predict"):
+            prediction = self.model.predict(self.data_holdout.input.T.fold)
         self.data_holdout.prediction.on_run_end(
             prediction, self.feature_engineer, self.target_column
         )
@@ -127,6 +132,7 @@ class PredictorHoldout(BasePredictorCallback):
 
 class PredictorTest(BasePredictorCallback):
     data_test: TestDataset
+    stage_timer: StageTimer
 
     #################### Division Start Points ####################
     def on_exp_start(self):
@@ -147,7 +153,8 @@ class PredictorTest(BasePredictorCallback):
 
     #################### Division End Points ####################
     def on_run_end(self):
-        prediction = self.model.predict(self.data_test.input.T.fold)
+        with self.stage_timer.time("predict"):
+            prediction = self.model.predict(self.data_test.input.T.fold)
         self.data_test.prediction.on_run_end(prediction, self.feature_engineer, self.target_column)
         super().on_run_end()
 
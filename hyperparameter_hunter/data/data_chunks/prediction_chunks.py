@@ -1,38 +1,228 @@
+"""This module defines the prediction data chunks, which accumulate a dataset's predictions (and
+their transformed counterparts) across all divisions of an experiment
+
+Notes
+-----
+Unlike the input and target chunks, prediction chunks do not hold their divisions as DataFrames.
+Each of the `run`, `fold`, `rep` and `final` divisions (of both the chunk itself, and its `T`) is
+backed by a :class:`_PredictionBuffer`, which keeps a 2-dimensional `numpy.float64` array that is
+updated in place as predictions are accumulated and averaged. A DataFrame is only built when a
+division is actually requested (by an evaluator, recorder or other callback), and the DataFrame is
+a view of the buffer it was built from. If the buffer is modified after a DataFrame has been handed
+out, the buffer is copied first, so DataFrames retrieved from prediction chunks are never changed
+by the chunk after the fact
+
+Predictions are always accumulated in `numpy.float64`. Once an Experiment has been evaluated, the
+buffers of its prediction chunks are converted to :attr:`~hyperparameter_hunter.environment.
+Environment.prediction_dtype` via :meth:`BasePredictionChunk.compact`, so the predictions kept (and
+saved) by finished Experiments can take as little as a quarter of the memory. Additionally, if
+:attr:`~hyperparameter_hunter.environment.Environment.prediction_forms` is "required", transformed
+predictions are only accumulated if they are evaluated. See :func:`get_required_prediction_forms`"""
 ##################################################
 # Import Own Assets
 ##################################################
-from hyperparameter_hunter.data.data_core import BaseDataChunk
+from hyperparameter_hunter.data.data_core import BaseDataChunk, _BaseDataChunk
 from hyperparameter_hunter.feature_engineering import FeatureEngineer
+from hyperparameter_hunter.settings import G
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
-from contextlib import suppress
-from copy import deepcopy
 import numpy as np
 import pandas as pd
 
 
+##################################################
+# Prediction Buffers
+##################################################
+class _PredictionBuffer:
+    def __init__(self):
+        """Array-backed storage for a single division (`run`, `fold`, `rep`, or `final`) of a
+        prediction chunk
+
+        Attributes
+        ----------
+        values: None, scalar, or np.ndarray
+            None if the division has not been started. A scalar (usually 0) if the division has
+            been started, but no predictions have been accumulated into it yet. Else, a
+            2-dimensional array of predictions
+        index: pd.Index, or None
+            Index used to build the DataFrame returned by :meth:`get`. If None, a `RangeIndex`
+        columns: pd.Index, list, or None
+            Column names used to build the DataFrame returned by :meth:`get`"""
+        self.values = None
+        self.index = None
+        self.columns = None
+        self._frame = None
+        self._spare = None
+
+    def get(self):
+        """Retrieve the division's predictions, building a DataFrame view of :attr:`values` if it
+        is an array"""
+        if not isinstance(self.values, np.ndarray):
+            return self.values
+        if self._frame is None:
+            self._frame = pd.DataFrame(
+                self.values, index=self.index, columns=self.columns, copy=False
+            )
+        return self._frame
+
+    def set(self, value):
+        """Replace the division's predictions with `value`, which may be a DataFrame, or a scalar
+        placeholder, like 0 (at division start) or None"""
+        if isinstance(value, pd.DataFrame):
+            self.store(value.values.astype(np.float64), value.index, value.columns)
+            return
+
+        if isinstance(self.values, np.ndarray) and self._frame is None:
+            self._spare = self.values  # Never handed out, so it can be reused on next accumulation
+        self.values, self._frame = value, None
+
+    def store(self, values: np.ndarray, index=None, columns=None):
+        """Replace the division's predictions with the 2-dimensional array `values`"""
+        if (columns is not None) and (values.shape[1] != len(columns)):
+            raise ValueError(f"Prediction of shape {values.shape} does not match columns {columns}")
+        self.values, self.index, self.columns, self._frame = values, index, columns, None
+
+    def add(self, other: "_PredictionBuffer", rows=None):
+        """Accumulate the predictions of `other` into this division in place
+
+        Parameters
+        ----------
+        other: _PredictionBuffer
+            Buffer whose :attr:`values` are added to :attr:`values`
+        rows: Array-like, or None, default=None
+            If not None, positional indexes of the rows of :attr:`values` to which `other` is
+            added"""
+        if isinstance(self.values, np.ndarray):
+            values = self._writable()
+            if rows is None:
+                values += other.values
+            else:
+                values[rows] += other.values
+            return
+
+        # Division was just started, so `values` is a scalar placeholder - Take layout from `other`
+        spare, self._spare = self._spare, None
+        out = spare if _is_reusable(spare, other.values) else None
+        self.store(np.add(other.values, self.values, out=out), other.index, other.columns)
+
+    def divide(self, divisor):
+        """Divide the division's predictions by `divisor` in place"""
+        if isinstance(self.values, np.ndarray):
+            values = self._writable()
+            values /= divisor
+        else:
+            self.values = self.values / divisor
+
+    def compact(self, dtype):
+        """Convert the division's predictions to `dtype` for storage. DataFrames previously handed
+        out by :meth:`get` are unaffected"""
+        if isinstance(self.values, np.ndarray) and self.values.dtype != dtype:
+            self.store(self.values.astype(dtype), self.index, self.columns)
+            self._spare = None
+
+    def _writable(self) -> np.ndarray:
+        """Retrieve :attr:`values` for in-place modification, first copying the array if a
+        DataFrame view of it has been handed out by :meth:`get`"""
+        if self._frame is not None:
+            self.values, self._frame = self.values.copy(), None
+        return self.values
+
+
+class _PredictionDivision:
+    """Data descriptor exposing a :class:`_PredictionBuffer` of a prediction chunk as one of the
+    standard data chunk division attributes (`run`, `fold`, `rep`, `final`)"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if not getattr(instance, "kept", True):
+            raise ValueError(
+                f"Transformed `{self.name}` predictions are not kept, because the Environment's"
+                " `prediction_forms` is 'required', and `save_transformed_metrics` is False. Use"
+                " `prediction_forms='both'` to access transformed predictions"
+            )
+        return instance.buffers[self.name].get()
+
+    def __set__(self, instance, value):
+        instance.buffers[self.name].set(value)
+
+
+class _PredictionDivisionsMixIn:
+    run = _PredictionDivision()
+    fold = _PredictionDivision()
+    rep = _PredictionDivision()
+    final = _PredictionDivision()
+
+    def __init__(self, *args, **kwargs):
+        """MixIn for data chunks whose division attributes are backed by :class:`_PredictionBuffer`
+        instances, found in :attr:`buffers`. Must precede the data chunk class in the bases"""
+        self.buffers = {_: _PredictionBuffer() for _ in ["run", "fold", "rep", "final"]}
+        super().__init__(*args, **kwargs)
+
+
+class _TransformedPredictionChunk(_PredictionDivisionsMixIn, _BaseDataChunk):
+    def __init__(self, d):
+        """Array-backed counterpart of
+        :class:`~hyperparameter_hunter.data.data_core._BaseDataChunk`, used as the `T` attribute of
+        prediction chunks
+
+        Attributes
+        ----------
+        kept: Boolean
+            Whether transformed predictions are accumulated, as determined by
+            :func:`get_required_prediction_forms`. If False, getting any division raises a
+            `ValueError`, rather than returning None, as though the division had not started"""
+        super().__init__(d=d)
+        self.kept = "transformed" in get_required_prediction_forms()
+
+
 ##################################################
 # Prediction Chunks
 ##################################################
-class BasePredictionChunk(BaseDataChunk):
+class BasePredictionChunk(_PredictionDivisionsMixIn, BaseDataChunk):
+    def __init__(self, d):
+        super().__init__(d=d)
+        self.T: _TransformedPredictionChunk = _TransformedPredictionChunk(d=d)
+
+    @property
+    def kept_chunks(self) -> list:
+        """Chunks whose predictions are accumulated: the chunk itself for inverted predictions, and
+        its `T` for transformed predictions, if :attr:`_TransformedPredictionChunk.kept`"""
+        return [self, self.T] if self.T.kept else [self]
+
+    def compact(self, dtype):
+        """Convert the predictions of all divisions to `dtype` for storage. Should be called only
+        once the chunk's predictions are no longer accumulated or evaluated
+
+        Parameters
+        ----------
+        dtype: Dtype
+            Datatype in which predictions should be stored, like `numpy.float32`"""
+        for chunk in [self, self.T]:
+            for buffer in chunk.buffers.values():
+                buffer.compact(dtype)
+
     #################### Division Start Points ####################
     def on_exp_start(self, *args, **kwargs):
-        self.final = 0
-        self.T.final = 0
+        for chunk in self.kept_chunks:
+            chunk.final = 0
 
     def on_rep_start(self, *args, **kwargs):
-        self.rep = 0
-        self.T.rep = 0
+        for chunk in self.kept_chunks:
+            chunk.rep = 0
 
     def on_fold_start(self, *args, **kwargs):
-        self.fold = 0
-        self.T.fold = 0
+        for chunk in self.kept_chunks:
+            chunk.fold = 0
 
     #################### Division End Points ####################
     def on_run_end(self, prediction, feature_engineer, target_column, *args, **kwargs):
-        """...
+        """Store the run's transformed and inverted predictions, then add them to the fold
 
         Parameters
         ----------
@@ -41,68 +231,65 @@ class BasePredictionChunk(BaseDataChunk):
         target_column: List[str]
         *args: Tuple
         **kwargs: Dict"""
-        self.T.run = deepcopy(prediction)
-        self.run = deepcopy(prediction)
+        transformed = _format_prediction_values(prediction, target_column)
 
-        self.run = _format_prediction(self.run, target_column)
-        # `self.run` must be same shape as data transformed by `feature_engineer` prior to inversion
-        # TODO: Make sure this doesn't screw up when no `inverse_transform` call
-        #  Because then it'll just be two consecutive calls to `_format_predictions` with `self.run`
+        if self.T.kept:
+            self.T.buffers["run"].store(transformed, columns=target_column)
+            self.T.buffers["fold"].add(self.T.buffers["run"])
 
-        with suppress(AttributeError):  # TODO: Drop `suppress` - Was for `feature_engineer={}`
+        if _has_inversion(feature_engineer):
             # NOTE: How does `FeatureEngineer` know these are predictions to invert, not inputs?
             #   Probably need to make an assumption for now, albeit a fairly safe one
-            self.run = feature_engineer.inverse_transform(self.run)
+            inverted = feature_engineer.inverse_transform(
+                pd.DataFrame(transformed.copy(), columns=target_column)
+            )
+            inverted = _format_prediction_values(inverted, target_column)
+        elif self.T.kept:
+            inverted = transformed.copy()  # Accumulated separately, so don't share the array
+        else:
+            inverted = transformed
+        self.buffers["run"].store(inverted, columns=target_column)
+        self.buffers["fold"].add(self.buffers["run"])
 
-        self.run = _format_prediction(self.run, target_column)
-        self.T.run = _format_prediction(self.T.run, target_column)
-
-        self.fold += self.run
-        self.T.fold += self.T.run
-        # TODO: Add `FeatureEngineer` method called after `inverse_transform` to format as DataFrame
-        #   Should already know about different column names - Move `_format_prediction` there?
         # FLAG: Need to `_format_prediction` on `self.T.run` although `target_column` may differ
         #   Might be able to use transformed `data_holdout.target` to figure it out - Not pretty
 
     def on_fold_end(self, runs: int, *args, **kwargs):
         # TODO: For all `/=` ops herein, conditionally do floor div if `self.run` is non-continuous?
-        self.fold /= runs
-        self.rep += self.fold
-        self.T.fold /= runs
-        self.T.rep += self.T.fold
+        for chunk in self.kept_chunks:
+            chunk.buffers["fold"].divide(runs)
+            chunk.buffers["rep"].add(chunk.buffers["fold"])
 
     def on_rep_end(self, n_splits: int, *args, **kwargs):
-        self.rep /= n_splits
-        self.final += self.rep
-        self.T.rep /= n_splits
-        self.T.final += self.T.rep
+        for chunk in self.kept_chunks:
+            chunk.buffers["rep"].divide(n_splits)
+            chunk.buffers["final"].add(chunk.buffers["rep"])
 
     def on_exp_end(self, n_repeats: int):
-        self.final /= n_repeats
-        self.T.final /= n_repeats
+        for chunk in self.kept_chunks:
+            chunk.buffers["final"].divide(n_repeats)
 
 
 class OOFPredictionChunk(BasePredictionChunk):
     #################### Division Start Points ####################
     def on_exp_start(self, zero_predictions, *args, **kwargs):
-        self.final = deepcopy(zero_predictions)
-        self.T.final = deepcopy(zero_predictions)
+        for chunk in self.kept_chunks:
+            chunk.final = zero_predictions
 
     def on_rep_start(self, zero_predictions, *args, **kwargs):
-        self.rep = deepcopy(zero_predictions)
-        self.T.rep = deepcopy(zero_predictions)
+        for chunk in self.kept_chunks:
+            chunk.rep = zero_predictions
 
     #################### Division End Points ####################
     # noinspection PyMethodOverriding
     def on_fold_end(self, validation_index, runs: int, *args, **kwargs):
-        self.fold /= runs
-        self.rep.iloc[validation_index] += self.fold.values
-        self.T.fold /= runs
-        self.T.rep.iloc[validation_index] += self.T.fold.values
+        for chunk in self.kept_chunks:
+            chunk.buffers["fold"].divide(runs)
+            chunk.buffers["rep"].add(chunk.buffers["fold"], rows=validation_index)
 
     def on_rep_end(self, *args, **kwargs):
-        self.final += self.rep
-        self.T.final += self.T.rep
+        for chunk in self.kept_chunks:
+            chunk.buffers["final"].add(chunk.buffers["rep"])
 
 
 class HoldoutPredictionChunk(BasePredictionChunk):
@@ -116,6 +303,71 @@ class TestPredictionChunk(BasePredictionChunk):
 ##################################################
 # Utilities
 ##################################################
+def get_required_prediction_forms() -> set:
+    """Determine the forms of predictions that prediction chunks should accumulate. Inverted
+    predictions are always accumulated, because they are saved in prediction files. If the active
+    Environment's `prediction_forms` is "required", transformed predictions are only accumulated if
+    they are evaluated (see
+    :attr:`~hyperparameter_hunter.environment.Environment.save_transformed_metrics`)
+
+    Returns
+    -------
+    Set
+        {"transformed", "inverted"}, or {"inverted"} if the active Environment's
+        `prediction_forms` is "required", and `save_transformed_metrics` is False"""
+    if getattr(G.Env, "prediction_forms", "both") == "required":
+        if not G.Env.save_transformed_metrics:
+            return {"inverted"}
+    return {"transformed", "inverted"}
+
+
+def _is_reusable(spare, values: np.ndarray) -> bool:
+    """Determine whether the array `spare` can hold the float64 accumulation of `values`"""
+    return spare is not None and spare.shape == values.shape and spare.dtype == np.float64
+
+
+def _has_inversion(feature_engineer: FeatureEngineer) -> bool:
+    """Determine whether any of the steps of `feature_engineer` define an inverse transformation"""
+    return any(getattr(_, "inversion", None) for _ in getattr(feature_engineer, "steps", []))
+
+
+def _format_prediction_values(predictions, target_column, dtype=np.float64) -> np.ndarray:
+    """Organize predictions into a new 2-dimensional array, one-hot encoding them as necessary.
+    This is the array-only counterpart of :func:`_format_prediction`
+
+    Parameters
+    ----------
+    predictions: Array-like
+        A model's predictions for a set of input data
+    target_column: List[str]
+        Name(s) for the target column(s) of `predictions`
+    dtype: Dtype, or None, default=`numpy.float64`
+        Datatype to force on `predictions`. If None, datatype will be inferred
+
+    Returns
+    -------
+    np.ndarray
+        Copy of `predictions` of shape (<n_samples>, <n_columns>), one-hot encoded if necessary
+
+    Examples
+    --------
+    >>> _format_prediction_values(np.array([3.2, 14.5, 6.8]), ["y"])
+    array([[ 3.2],
+           [14.5],
+           [ 6.8]])
+    >>> _format_prediction_values(np.array([2, 1, 0]), ["y_0", "y_1", "y_2"], dtype=np.int8)
+    array([[0, 0, 1],
+           [0, 1, 0],
+           [1, 0, 0]], dtype=int8)"""
+    # `target_column` indicates multidimensional output, but predictions are one-dimensional
+    if len(target_column) > 1:
+        if (len(predictions.shape) == 1) or (predictions.shape[1] == 1):
+            predictions = pd.get_dummies(predictions).values
+
+    values = np.array(predictions, dtype=dtype)
+    return values.reshape(len(values), -1) if values.ndim != 2 else values
+
+
 def _format_prediction(predictions, target_column, index=None, dtype=np.float64) -> pd.DataFrame:
     """Organize predictions into a standard format, and one-hot encode predictions as necessary
 
@@ -66,6 +66,7 @@ Related
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+import numpy as np
 import pandas as pd
 from typing import List, Optional
 
@@ -264,7 +265,7 @@ class BaseDataset(BaseDataCore):
             input_ = None
 
         try:
-            target = data.copy().loc[:, target_column]
+            target = to_dense(data.copy().loc[:, target_column])
         except (AttributeError, KeyError, TypeError):
             target = None
 
@@ -282,3 +283,54 @@ class BaseDataset(BaseDataCore):
         self.input._do_something(division, point, *args, **kwargs)
         self.target._do_something(division, point, *args, **kwargs)
         self.prediction._do_something(division, point, *args, **kwargs)
+
+
+##################################################
+# Sparse Data Utilities
+##################################################
+def is_sparse_frame(df) -> bool:
+    """Determine whether `df` is a DataFrame with at least one sparse column
+
+    Examples
+    --------
+    >>> is_sparse_frame(pd.DataFrame(dict(a=pd.arrays.SparseArray([0, 1]), b=[2, 3])))
+    True
+    >>> is_sparse_frame(pd.DataFrame(dict(b=[2, 3])))
+    False
+    >>> is_sparse_frame(None)
+    False"""
+    return isinstance(df, pd.DataFrame) and any(isinstance(_, pd.SparseDtype) for _ in df.dtypes)
+
+
+def to_dense(df: OptionalDF) -> OptionalDF:
+    """Convert the sparse columns of `df` to dense columns. Dense columns are unchanged
+
+    Parameters
+    ----------
+    df: pd.DataFrame, or None
+        DataFrame whose sparse columns should be densified
+
+    Returns
+    -------
+    pd.DataFrame, or None
+        `df` itself if it has no sparse columns. Else, a copy of `df` with dense columns
+
+    Examples
+    --------
+    >>> df = to_dense(pd.DataFrame(dict(a=pd.arrays.SparseArray([0, 1]), b=[2, 3])))
+    >>> df.dtypes.tolist()
+    [dtype('int64'), dtype('int64')]
+    >>> df.values.tolist()
+    [[0, 2], [1, 3]]"""
+    if not is_sparse_frame(df):
+        return df
+
+    columns = [
+        pd.Series(np.asarray(column), index=df.index)
+        if isinstance(column.dtype, pd.SparseDtype)
+        else column
+        for _, column in df.items()
+    ]
+    dense_df = pd.concat(columns, axis=1)
+    dense_df.columns = df.columns
+    return dense_df
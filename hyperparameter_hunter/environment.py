@@ -22,15 +22,18 @@ Despite the fact that :mod:`hyperparameter_hunter.settings` is the only module l
 ##################################################
 # Import Own Assets
 ##################################################
+from hyperparameter_hunter import __version__
 from hyperparameter_hunter.callbacks.bases import BaseCallback
 from hyperparameter_hunter.i_o.reporting import ReportingHandler
+from hyperparameter_hunter.i_o.tracing import FileSpanExporter, NULL_TRACER, Tracer
 from hyperparameter_hunter.keys.makers import CrossExperimentKeyMaker
 from hyperparameter_hunter.metrics import format_metrics
 from hyperparameter_hunter.sentinels import DatasetSentinel
 from hyperparameter_hunter.settings import G, ASSETS_DIRNAME, RESULT_FILE_SUB_DIR_PATHS
 from hyperparameter_hunter.utils.boltons_utils import remap
-from hyperparameter_hunter.utils.file_utils import make_dirs, ParametersFromFile
+from hyperparameter_hunter.utils.file_utils import make_dirs, ParametersFromFile, read_dataset
 from hyperparameter_hunter.utils.general_utils import Alias
+from hyperparameter_hunter.utils.parallel_utils import CPUBudget
 from hyperparameter_hunter.utils.result_utils import format_predictions, default_do_full_save
 
 ##################################################
@@ -40,12 +43,15 @@ from inspect import signature, isclass
 import numpy as np
 import os.path
 import pandas as pd
-from pandas.api.types import is_numeric_dtype
+from pandas.api.types import is_float_dtype, is_integer_dtype, is_numeric_dtype
+from pandas.api.types import is_object_dtype, is_unsigned_integer_dtype
 from typing import List, Optional, Tuple, Union
 
 ##################################################
 # Import Learning Assets
 ##################################################
+from scipy import sparse
+
 # noinspection PyProtectedMember
 from sklearn.model_selection import _split as sk_cv
 
@@ -74,6 +80,14 @@ class Environment:
         to_csv_params=dict(),
         do_full_save=default_do_full_save,
         save_transformed_metrics=None,
+        cpu_budget=None,
+        memory_mode=None,
+        prediction_dtype="float64",
+        prediction_forms="both",
+        profile_callbacks=False,
+        track_memory=False,
+        overhead_threshold=None,
+        trace_spans=False,
     )
 
     @ParametersFromFile(key="environment_params_path", verbose=True)
@@ -110,6 +124,14 @@ class Environment:
         experiment_callbacks=None,
         experiment_recorders=None,
         save_transformed_metrics=None,
+        cpu_budget=None,
+        memory_mode=None,
+        prediction_dtype=None,
+        prediction_forms=None,
+        profile_callbacks=None,
+        track_memory=None,
+        overhead_threshold=None,
+        trace_spans=None,
     ):
         """Class to organize the parameters that allow Experiments/OptPros to be fairly compared
 
@@ -129,12 +151,15 @@ class Environment:
 
         Parameters
         ----------
-        train_dataset: Pandas.DataFrame, or str path
+        train_dataset: Pandas.DataFrame, `scipy.sparse` matrix, or str path
             The training data for the experiment. Will be split into train/holdout data, if
             applicable, and train/validation data if cross-validation is to be performed. If str,
-            will attempt to read file at path via :func:`pandas.read_csv`. For more information on
-            which columns will be used during fitting/predicting, see the "Dataset columns" note
-            in the "Notes" section below
+            will attempt to read file at path via :func:`.utils.file_utils.read_dataset`, which
+            reads ".csv" files, and memory-maps Parquet, Feather, and ".npy" files where possible.
+            Sparse matrices (and ".npz" files) become DataFrames of sparse columns named by their
+            integer positions, which are never densified. See :func:`to_dataset`. For more
+            information on which columns will be used during fitting/predicting, see the "Dataset
+            columns" note in the "Notes" section below
         environment_params_path: String path, or None, default=None
             If not None and is valid .json filepath containing an object (dict), the file's contents
             are treated as the default values for all keys that match any of the below kwargs used
@@ -179,19 +204,20 @@ class Environment:
             Metric callable functions should expect inputs of form (target, prediction), and should
             return floats. See the documentation of :class:`metrics.Metric` for information
             regarding expected parameters and types
-        holdout_dataset: Pandas.DataFrame, callable, str path, or None, default=None
-            If pd.DataFrame, this is the holdout dataset. If callable, expects a function that takes
-            (self.train: DataFrame, self.target_column: str) as input and returns the new
-            (self.train: DataFrame, self.holdout: DataFrame). If str, will attempt to read file at
-            path via :func:`pandas.read_csv`. Else, there is no holdout set. For more information on
-            which columns will be used during fitting/predicting, see the "Dataset columns" note
-            in the "Notes" section below
-        test_dataset: Pandas.DataFrame, str path, or None, default=None
+        holdout_dataset: Pandas.DataFrame, sparse matrix, callable, str path, or None, default=None
+            If pd.DataFrame, or sparse matrix, this is the holdout dataset. If callable, expects a
+            function that takes (self.train: DataFrame, self.target_column: str) as input and
+            returns the new (self.train: DataFrame, self.holdout: DataFrame). If str, will attempt
+            to read file at path via :func:`.utils.file_utils.read_dataset`. Else, there is no
+            holdout set. For more information on which columns will be used during
+            fitting/predicting, see the "Dataset columns" note in the "Notes" section below
+        test_dataset: Pandas.DataFrame, `scipy.sparse` matrix, str path, or None, default=None
             The testing data for the experiment. Structure should be identical to that of
             `train_dataset`, except its `target_column` column can be empty or non-existent, because
             `test_dataset` predictions will never be evaluated. If str, will attempt to read file at
-            path via :func:`pandas.read_csv`. For more information on which columns will be used
-            during fitting/predicting, see the "Dataset columns" note in the "Notes" section below
+            path via :func:`.utils.file_utils.read_dataset`. For more information on which columns
+            will be used during fitting/predicting, see the "Dataset columns" note in the "Notes"
+            section below
         target_column: Str, or list, default='target'
             If str, denotes the column name in all provided datasets (except test) that contains the
             target output. If list, should be a list of strs designating multiple target columns.
@@ -346,6 +372,78 @@ class Environment:
             inputs. This is described further in :attr:`save_transformed_metrics`. A more
             descriptive name for this may be "calculate_metrics_using_transformed_predictions",
             but that's a bit verbose--even by my standards
+        cpu_budget: Int, :class:`~hyperparameter_hunter.utils.parallel_utils.CPUBudget`, or None
+            If None (default), the number of threads used by models is left untouched. Else, the
+            number of CPU cores that may be used by Experiments, following the `n_jobs` convention
+            of negative values (-1 means all cores). The cores are divided between any outer
+            workers and the threads of each worker's model. Each run's model then has its `n_jobs`,
+            `nthread`, or `thread_count` parameter set to its share of threads, and BLAS/OpenMP
+            threads are capped to the same number while an Experiment executes. Because
+            these parameters are ignored when making hyperparameter keys, `cpu_budget` does not
+            affect Experiment matching. The chosen split is logged at the start of each Experiment,
+            so it is recorded in the Experiment's heartbeat
+        memory_mode: {None, "downcast"}, default=None
+            If "downcast", the columns of all datasets are converted to smaller dtypes via
+            :func:`downcast_dataset` to reduce memory usage: float columns become float32, 64-bit
+            integer columns become 32-bit if their values fit, and object columns with repeated
+            values become categorical. Integers are never made narrower than 32 bits, so that
+            arithmetic on them in feature engineering steps does not easily overflow, as it could
+            for int8 or int16 columns. The columns in `target_column` and `id_column`
+            are never downcast. Datasets are downcast after :attr:`cross_experiment_key` is made
+            from the original datasets, so `memory_mode` does not affect Experiment matching.
+            However, models fitted on float32 data may produce slightly different results
+        prediction_dtype: Str, or dtype, default="float64"
+            Floating point datatype in which the predictions of an Experiment are kept once it has
+            been evaluated, and in which they are saved. Predictions are always accumulated across
+            runs, folds, and repetitions in float64, and evaluated before conversion, so "float32"
+            or "float16" reduce the memory held by finished Experiments without affecting their
+            evaluations or keys
+        prediction_forms: {"both", "required"}, default="both"
+            Forms of predictions accumulated by Experiments. If "both", transformed predictions (as
+            returned by a model) and inverted predictions (in the form of the original target, and
+            identical if there is no target transformation) are both kept. If "required", inverted
+            predictions are kept, because they are saved in prediction files, but transformed
+            predictions are only kept if they are evaluated (see :attr:`save_transformed_metrics`).
+            Otherwise, they are never computed, and getting any division of the `T` attribute of a
+            prediction chunk (like `data_oof.prediction.T.final`) raises a `ValueError`
+        profile_callbacks: Boolean, default=False
+            If True, Experiments time every division method (`on_exp_start`, `on_fold_end`, etc.)
+            of each of their callbacks, and of the Experiment itself, via
+            :mod:`~hyperparameter_hunter.callbacks.profilers`. The number of calls, and the
+            inclusive and exclusive time spent by each callback in each method are added to the
+            Experiment's `stat_aggregates` under "callback_profile". The time of every call is also
+            saved as a Chrome trace file in the "Experiments/CallbackProfiles" directory, unless
+            "callback_profile" is in `file_blacklist`
+        track_memory: {False, True, "reset_rss", "tracemalloc"}, default=False
+            If True, Experiments record the peak resident set size (RSS) of the process during each
+            of their runs, folds, and repetitions via
+            :class:`~hyperparameter_hunter.callbacks.aggregators.AggregatorMemory`. The peak RSS of
+            the process never decreases, so a division's peak is None unless the process reached a
+            new peak during it. If "reset_rss", the peak RSS of the process is reset at the start
+            and end of each division, so every division's peak is recorded. This is only possible
+            on Linux, and it changes the peak RSS seen by any other code in the process. If
+            "tracemalloc", the peak memory allocated by Python, as traced by :mod:`tracemalloc`, is
+            also recorded. Tracing allocations is precise, but it slows down Experiments
+            considerably. Peaks are added to the Experiment's `stat_aggregates` under "memory", and
+            the peaks of the whole Experiment are added to the leaderboards
+        overhead_threshold: Float in (0, 1], or None, default=None
+            If given, a warning is logged for each Experiment whose framework overhead exceeds this
+            fraction of its wall time. Every Experiment reports how its wall time was split between
+            fitting and predicting with its model, and the framework (key-making, feature
+            engineering, evaluation, recording, and everything else) in its `stat_aggregates` under
+            "overhead", and its "framework_fraction" is added to the leaderboards. See
+            :class:`~hyperparameter_hunter.callbacks.profilers.StageTimer`. Because the report is
+            made before results are saved, it (and the warning) excludes the time spent saving
+            them. The full report, including the "recording" stage, is given by the Experiment's
+            `stage_timer.report()`
+        trace_spans: Boolean, default=False
+            If True, OptPros and Experiments record their work as nested spans, from each
+            :meth:`~hyperparameter_hunter.optimization.protocol_core.BaseOptPro.go`, through each
+            Experiment's workflows, down to each of its runs, with attributes like "experiment_id",
+            "hyperparameter_key", "fold", and "score". Spans are appended to the "Traces.jsonl" file
+            in the OpenTelemetry Protocol's JSON format, unless "traces" is in `file_blacklist`, or
+            `results_path` is None, in which case nothing is traced. See
+            :mod:`~hyperparameter_hunter.i_o.tracing`
 
         Other Parameters
         ----------------
@@ -396,6 +494,14 @@ class Environment:
         columns of the given datasets prior to fitting. See its documentation for more information,
         but it can effectively be used to remove any columns from the datasets
 
+        Sparse datasets: The columns of a dataset given as a `scipy.sparse` matrix are named by
+        their integer positions, so `target_column` should be given as a list of those positions,
+        like `[n_columns - 1]`. Alternatively, build the DataFrame yourself via
+        :meth:`pandas.DataFrame.sparse.from_spmatrix`, giving named columns, and add a dense target
+        column to it. Sparse columns are kept sparse through fold splitting and feature engineering,
+        and input data consisting entirely of sparse columns is given to the model's `fit` and
+        `predict` methods as a `scipy.sparse.csr_matrix`. Sparse target columns are densified
+
         Overriding default kwargs at `environment_params_path`: If you have any of the above kwargs
         specified in the .json file at environment_params_path (except environment_params_path,
         which will be ignored), you can override its value by passing it as a kwarg when
@@ -451,9 +557,18 @@ class Environment:
         self.experiment_callbacks = experiment_callbacks or []
         self.experiment_recorders = experiment_recorders or []
         self.save_transformed_metrics = save_transformed_metrics
+        self.cpu_budget = cpu_budget
+        self.memory_mode = memory_mode
+        self.prediction_dtype = prediction_dtype
+        self.prediction_forms = prediction_forms
+        self.profile_callbacks = profile_callbacks
+        self.track_memory = track_memory
+        self.overhead_threshold = overhead_threshold
+        self.trace_spans = trace_spans
 
         self.result_paths = {
             "root": self.results_path,
+            "callback_profile": None,
             "checkpoint": None,
             "description": None,
             "heartbeat": None,
@@ -466,7 +581,9 @@ class Environment:
             "key_attribute_lookup": None,
             "leaderboards": None,
             "global_leaderboard": None,
+            "optimizer_checkpoint": None,
             "current_heartbeat": None,
+            "traces": None,
         }
         self.current_task = None
         self.cross_experiment_key = None
@@ -527,7 +644,7 @@ class Environment:
 
     @train_dataset.setter
     def train_dataset(self, value):
-        self._train_dataset = pd.read_csv(value) if isinstance(value, str) else value
+        self._train_dataset = to_dataset(value)
 
     #################### `test_dataset` ####################
     @property
@@ -536,7 +653,7 @@ class Environment:
 
     @test_dataset.setter
     def test_dataset(self, value):
-        self._test_dataset = pd.read_csv(value) if isinstance(value, str) else value
+        self._test_dataset = to_dataset(value)
 
     #################### `holdout_dataset` ####################
     @property
@@ -657,8 +774,10 @@ class Environment:
         self.update_custom_environment_params()
         self.validate_parameters()
         self.format_result_paths()
+        self.initialize_tracing()
         self.generate_cross_experiment_key()
         G.log("Cross-Experiment Key:   '{!s}'".format(self.cross_experiment_key))
+        self.apply_memory_mode()
 
     def validate_parameters(self):
         """Ensure the provided parameters are valid and properly formatted"""
@@ -679,6 +798,43 @@ class Environment:
             self.metrics = format_metrics(self.metrics)
             self.metrics_params = {**{_metrics_alias: self.metrics}, **self.metrics_params}
 
+        #################### cpu_budget ####################
+        if self.cpu_budget is not None and not isinstance(self.cpu_budget, CPUBudget):
+            self.cpu_budget = CPUBudget(self.cpu_budget)
+
+        #################### memory_mode ####################
+        if self.memory_mode not in (None, "downcast"):
+            raise ValueError(f"`memory_mode` must be None or 'downcast', not {self.memory_mode!r}")
+
+        #################### prediction_dtype ####################
+        if np.dtype(self.prediction_dtype).kind != "f":
+            raise ValueError(
+                f"`prediction_dtype` must be a float dtype, not {self.prediction_dtype!r}"
+            )
+
+        #################### prediction_forms ####################
+        if self.prediction_forms not in ("both", "required"):
+            raise ValueError(
+                f"`prediction_forms` must be 'both' or 'required', not {self.prediction_forms!r}"
+            )
+
+        #################### track_memory ####################
+        if self.track_memory not in (False, True, "reset_rss", "tracemalloc"):
+            raise ValueError(
+                "`track_memory` must be False, True, 'reset_rss', or 'tracemalloc', not "
+                f"{self.track_memory!r}"
+            )
+
+        #################### overhead_threshold ####################
+        if self.overhead_threshold is not None and not (0 < self.overhead_threshold <= 1):
+            raise ValueError(
+                f"`overhead_threshold` must be in (0, 1], or None, not {self.overhead_threshold!r}"
+            )
+
+        #################### trace_spans ####################
+        if not isinstance(self.trace_spans, bool):
+            raise ValueError(f"`trace_spans` must be a boolean, not {self.trace_spans!r}")
+
     def format_result_paths(self):
         """Remove paths contained in file_blacklist, and format others to prepare for saving results"""
         if self.file_blacklist == "ALL" or self.results_path is None:
@@ -712,6 +868,21 @@ class Environment:
                 self.result_paths[k] = None
                 # G.debug('Result file "{}" has been blacklisted'.format(k))
 
+    def initialize_tracing(self):
+        """Set :attr:`hyperparameter_hunter.settings.G.tracer` to a tracer that appends spans to the
+        "traces" result path if :attr:`trace_spans` is True, or to one that records nothing"""
+        if self.trace_spans is not True:
+            G.tracer = NULL_TRACER
+        elif self.result_paths["traces"] is None:
+            G.warn(
+                "WARNING: `trace_spans`=True, but traces cannot be saved. Nothing will be traced"
+            )
+            G.tracer = NULL_TRACER
+        else:
+            G.tracer = Tracer(
+                FileSpanExporter(self.result_paths["traces"], scope_version=__version__)
+            )
+
     def update_custom_environment_params(self):
         """Try to update null parameters from environment_params_path, or DEFAULT_PARAMS"""
         allowed_parameter_keys = [
@@ -756,16 +927,35 @@ class Environment:
         #################### Make `cross_experiment_key` ####################
         self.cross_experiment_key = CrossExperimentKeyMaker(parameters)
 
+    def apply_memory_mode(self):
+        """Downcast the datasets if :attr:`memory_mode` is "downcast". This must be called after
+        :meth:`generate_cross_experiment_key`, so the key describes the original datasets"""
+        if self.memory_mode != "downcast":
+            return
+
+        exclude = self.target_column + ([self.id_column] if self.id_column is not None else [])
+        for attr in ["_train_dataset", "_holdout_dataset", "_test_dataset"]:
+            if getattr(self, attr) is not None:
+                setattr(self, attr, downcast_dataset(getattr(self, attr), exclude=exclude))
+
     def initialize_reporting(self):
-        """Initialize reporting for the Environment and Experiments conducted during its lifetime"""
+        """Initialize reporting for the Environment and Experiments conducted during its lifetime
+
+        Returns
+        -------
+        reporting_handler: :class:`~hyperparameter_hunter.i_o.reporting.ReportingHandler`
+            The new handler, whose `heartbeat_buffer` collects the heartbeat of the Experiment being
+            initialized, unless "heartbeat" is blacklisted"""
         reporting_params = self.reporting_params
         reporting_params["heartbeat_path"] = self.result_paths["current_heartbeat"]
+        reporting_params["buffer_heartbeat"] = self.result_paths["heartbeat"] is not None
         reporting_handler = ReportingHandler(**reporting_params)
 
         #################### Make Unified Logging Globally Available ####################
         G.log = reporting_handler.log
         G.debug = reporting_handler.debug
         G.warn = reporting_handler.warn
+        return reporting_handler
 
     ##################################################
     # Dataset Sentinels for Use as Extra Parameters
@@ -853,6 +1043,37 @@ class Environment:
         )
 
 
+def to_dataset(value):
+    """Convert a dataset given to :class:`Environment` to a DataFrame, if necessary
+
+    Parameters
+    ----------
+    value: Pandas.DataFrame, `scipy.sparse` matrix, str path, or None
+        If str, the file at the path is read via :func:`.utils.file_utils.read_dataset`. If a
+        `scipy.sparse` matrix, it is converted to a DataFrame of sparse columns, named by their
+        integer positions, via :meth:`pandas.DataFrame.sparse.from_spmatrix`. Its values are never
+        densified. Else, `value` is returned unchanged
+
+    Returns
+    -------
+    Pandas.DataFrame, or None
+        The dataset represented by `value`
+
+    Examples
+    --------
+    >>> from scipy.sparse import csr_matrix
+    >>> df = to_dataset(csr_matrix([[0, 1], [2, 0]]))
+    >>> df.dtypes.tolist()
+    [Sparse[int64, 0], Sparse[int64, 0]]
+    >>> df.sparse.density
+    0.5"""
+    if isinstance(value, str):
+        return read_dataset(value)
+    if sparse.issparse(value):
+        return pd.DataFrame.sparse.from_spmatrix(value)
+    return value
+
+
 def define_holdout_set(
     train_set: pd.DataFrame,
     holdout_set: Union[pd.DataFrame, callable, str, None],
@@ -865,10 +1086,11 @@ def define_holdout_set(
     ----------
     train_set: Pandas.DataFrame
         Training DataFrame. Will be split into train/holdout data, if `holdout_set` is callable
-    holdout_set: Pandas.DataFrame, callable, str, or None
-        If pd.DataFrame, this is the holdout dataset. If callable, expects a function that takes
-        (`train_set`, `target_column`) as input and returns the new (`train_set`, `holdout_set`). If
-        str, will attempt to read file at path via :func:`pandas.read_csv`. Else, no holdout set
+    holdout_set: Pandas.DataFrame, callable, str, `scipy.sparse` matrix, or None
+        If pd.DataFrame, or sparse matrix, this is the holdout dataset. If callable, expects a
+        function that takes (`train_set`, `target_column`) as input and returns the new
+        (`train_set`, `holdout_set`). If str, will attempt to read file at path via
+        :func:`.utils.file_utils.read_dataset`. Else, no holdout set
     target_column: Str, or list
         If str, denotes the column name in provided datasets that contains the target output. If
         list, should be a list of strs designating multiple target columns
@@ -883,8 +1105,8 @@ def define_holdout_set(
     #################### Update `holdout_set` ####################
     if callable(holdout_set):
         train_set, holdout_set = holdout_set(train_set, target_column)
-    elif isinstance(holdout_set, str):
-        holdout_set = pd.read_csv(holdout_set)
+    elif holdout_set is not None:
+        holdout_set = to_dataset(holdout_set)
     #################### Validate `holdout_set` ####################
     try:
         if holdout_set is None or np.array_equal(train_set.columns, holdout_set.columns):
@@ -894,6 +1116,62 @@ def define_holdout_set(
     raise ValueError(f"Mismatched columns\n{train_set.columns}\n!=\n{holdout_set.columns}")
 
 
+def downcast_dataset(dataset: pd.DataFrame, exclude: List[str] = ()) -> pd.DataFrame:
+    """Convert the columns of `dataset` to smaller dtypes to reduce its memory usage
+
+    Parameters
+    ----------
+    dataset: pd.DataFrame
+        Dataset whose columns should be downcast. Not modified
+    exclude: List[str], default=()
+        Names of columns in `dataset` that should not be downcast, such as target columns
+
+    Returns
+    -------
+    pd.DataFrame
+        Copy of `dataset`, in which float columns are float32, 64-bit integer columns are 32-bit
+        (signed or unsigned, as before) if their values fit, and object columns in which at most
+        half of the values are unique are categorical. Integer columns are never narrowed below 32
+        bits, so that arithmetic on them does not easily overflow. Other columns, including sparse
+        columns, are unchanged
+
+    Examples
+    --------
+    >>> df = pd.DataFrame(
+    ...     dict(a=[0.5, 1.5], b=[1, 300], c=["x", "x"], d=[-1, 2 ** 40], t=[0.5, 1.0])
+    ... )
+    >>> downcast_dataset(df, exclude=["t"]).dtypes
+    a     float32
+    b       int32
+    c    category
+    d       int64
+    t     float64
+    dtype: object"""
+    columns = []
+    for i, column in enumerate(dataset.columns):
+        values = dataset.iloc[:, i]
+
+        if column in exclude or isinstance(values.dtype, pd.SparseDtype):
+            pass  # Sparse columns are left as they are, because casting them could densify them
+        elif is_float_dtype(values) and values.dtype.itemsize > 4:
+            values = values.astype(np.float32)
+        elif is_integer_dtype(values) and values.dtype.itemsize > 4:
+            info = np.iinfo(np.uint32 if is_unsigned_integer_dtype(values) else np.int32)
+            if len(values) and info.min <= values.min() and values.max() <= info.max:
+                values = values.astype(info.dtype)
+        elif is_object_dtype(values) and values.nunique(dropna=False) <= len(values) // 2:
+            values = values.astype("category")
+
+        columns.append(values)
+
+    if not columns:
+        return dataset.copy()
+
+    downcast = pd.concat(columns, axis=1)
+    downcast.columns = dataset.columns
+    return downcast
+
+
 ##################################################
 # File Blacklist Utilities
 ##################################################
@@ -913,11 +1191,11 @@ def validate_file_blacklist(blacklist):
 
     Notes
     -----
-    'heartbeat': If the heartbeat file is saved, a new file is not generated and saved to the
-    "Experiments/Heartbeats" directory as is the case with most other files. Instead, the general
-    "Heartbeat.log" file is copied and renamed to the current experiment id, then saved to the
-    appropriate dir. This is because the general "Heartbeat.log" file represents the heartbeat
-    for whatever experiment is currently in progress.
+    'heartbeat': While an Experiment is in progress, the messages added to the general
+    "Heartbeat.log" file are also collected in memory. When the Experiment is saved, they are
+    written to the "Experiments/Heartbeats" directory in a file named for the current experiment id.
+    The general "Heartbeat.log" file is appended to by every Experiment, and it is rotated by size,
+    according to `max_bytes` and `backup_count` in `reporting_params["heartbeat_params"]`
 
     'script_backup': This file is saved as quickly as possible after starting a new experiment,
     rather than waiting for the experiment to end. There are two reasons for this behavior: 1) to
@@ -935,13 +1213,32 @@ def validate_file_blacklist(blacklist):
     'tested_keys' (continued): If this string is included in the blacklist, then the contents of the
     "KeyAttributeLookup" directory will also be excluded from the list of files to update
 
+    'callback_profile': The Chrome trace of an Experiment's callback method calls, saved if the
+    Environment's `profile_callbacks` is True. See :mod:`hyperparameter_hunter.callbacks.profilers`
+
+    'checkpoint': The state of an Experiment after each completed fold, saved so that an
+    interrupted Experiment can be resumed by an Experiment with the same keys. The file is deleted
+    once the Experiment's other result files have been saved. If blacklisted, Experiments always
+    start from the first fold
+
+    'optimizer_checkpoint': The state of an OptPro's search, saved in the "Optimizers/Checkpoints"
+    directory after every `checkpoint_every` successful iterations of its `go` method, so the search
+    can be resumed by `go(resume=True)`. If blacklisted, OptPros cannot be resumed from checkpoints,
+    and instead start by reading the results of saved Experiments, as usual
+
     'current_heartbeat': The general heartbeat file that should be stored at
     'HyperparameterHunterAssets/Heartbeat.log'. If this value is blacklisted, then 'heartbeat' is
-    also added to `blacklist` automatically out of necessity. This is done because the heartbeat
-    file for the current experiment cannot be created as a copy of the general heartbeat file if the
-    general heartbeat file is never created in the first place"""
+    also added to `blacklist` automatically out of necessity. This is done because the messages
+    saved in the heartbeat file for the current experiment are collected by a `HeartbeatBuffer`,
+    which :meth:`~hyperparameter_hunter.i_o.reporting.ReportingHandler._initialize_logging_logging`
+    only attaches alongside the handler of the general heartbeat file. If the general heartbeat file
+    is never created, nothing is collected for the current experiment's heartbeat
+
+    'traces': The spans recorded by OptPros and Experiments if the Environment's `trace_spans` is
+    True. If blacklisted, nothing is traced. See :mod:`hyperparameter_hunter.i_o.tracing`"""
     valid_values = [
-        # 'checkpoint',
+        "callback_profile",
+        "checkpoint",
         "description",
         "heartbeat",
         "predictions_holdout",
@@ -950,7 +1247,9 @@ def validate_file_blacklist(blacklist):
         "predictions_test",
         "script_backup",
         "tested_keys",
+        "optimizer_checkpoint",
         "current_heartbeat",
+        "traces",
     ]
     if blacklist == "ALL":
         G.warn('WARNING: Received `blacklist`="ALL". Nothing will be saved')
@@ -32,7 +32,11 @@ the future"""
 ##################################################
 # Import Own Assets
 ##################################################
-from hyperparameter_hunter.callbacks.aggregators import AggregatorEvaluations, AggregatorTimes
+from hyperparameter_hunter.callbacks.aggregators import (
+    AggregatorEvaluations,
+    AggregatorMemory,
+    AggregatorTimes,
+)
 from hyperparameter_hunter.callbacks.bases import (
     BaseCallback,
     BaseInputWranglerCallback,
@@ -45,6 +49,7 @@ from hyperparameter_hunter.callbacks.bases import (
 )
 from hyperparameter_hunter.callbacks.evaluators import EvaluatorOOF, EvaluatorHoldout
 from hyperparameter_hunter.callbacks.loggers import LoggerFitStatus
+from hyperparameter_hunter.callbacks.profilers import make_experiment_profiler, profile_bases
 from hyperparameter_hunter.callbacks.wranglers.input_wranglers import (
     WranglerInputTrain,
     WranglerInputOOF,
@@ -66,14 +71,21 @@ from hyperparameter_hunter.settings import G
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+import copyreg
 from inspect import currentframe, getframeinfo
 from os.path import abspath
+from weakref import WeakValueDictionary
 
 
 class ExperimentMeta(type):
     """Metaclass that determines which callbacks should be inherited by an Experiment in order to
     complete its functionality"""
 
+    #: Subclasses of Experiments that inherit callbacks, made by :meth:`assemble`, keyed by the
+    #: Experiment class, its priority and auxiliary callbacks, and whether they are profiled. Values
+    #: are weak references, so a subclass is dropped once no Experiment or other object uses it
+    assembled_classes = WeakValueDictionary()
+
     @classmethod
     def __prepare__(mcs, name, bases, **kwargs):
         """Prepare the namespace for the Experiment by separating its parent classes according to
@@ -115,14 +127,14 @@ class ExperimentMeta(type):
         return class_obj
 
     def __call__(cls, *args, **kwargs):
-        """Store necessary instance-wide callbacks to :attr:`__instance_bases`, sort all dynamically
-        added callback base classes, then add them to the instance"""
-        original_bases = getattr(cls, "__original_bases")
+        """Determine the necessary instance-wide callbacks, and sort all dynamically added callback
+        base classes. Then, create the instance from the subclass of `cls` that inherits those
+        callbacks, retrieved by :meth:`assemble`"""
         class_wide_bases = getattr(cls, "__class_wide_bases")
         instance_bases = []
 
         # Get source_script for use by Experiment later
-        setattr(cls, "source_script", abspath(getframeinfo(currentframe().f_back)[0]))
+        source_script = abspath(getframeinfo(currentframe().f_back)[0])
 
         # TODO: Should target wranglers addition be contingent on `kwargs["feature_engineer"].steps
 
@@ -145,12 +157,13 @@ class ExperimentMeta(type):
             instance_bases.append(WranglerInputTest)
             instance_bases.append(PredictorTest)
 
+        if G.Env.track_memory:
+            instance_bases.append(AggregatorMemory)
+
         # Add callbacks explicitly provided to the Environment
         if len(G.Env.experiment_callbacks) > 0:
             instance_bases.extend(G.Env.experiment_callbacks)
 
-        setattr(cls, "__instance_bases", instance_bases)
-
         # Sort dynamically added auxiliary base classes
         auxiliary_bases = tuple(base_callback_class_sorter((class_wide_bases + instance_bases)))
 
@@ -159,10 +172,81 @@ class ExperimentMeta(type):
         # FLAG: Add ability to record full_predictions, then provide callback to check on experiment end...
         # FLAG: ... to determine whether full_predictions should actually be saved - Like checking final score/std > threshold
 
-        setattr(cls, "__priority_callback_bases", list(G.priority_callbacks))
-        cls.__bases__ = G.priority_callbacks + original_bases + auxiliary_bases
+        experiment_class = cls.assemble(
+            tuple(G.priority_callbacks), auxiliary_bases, bool(G.Env.profile_callbacks)
+        )
 
-        return super().__call__(*args, **kwargs)
+        # Mirror `type.__call__`, but set `source_script` on the instance, not the shared class
+        experiment = experiment_class.__new__(experiment_class, *args, **kwargs)
+        experiment.source_script = source_script
+        experiment.__init__(*args, **kwargs)
+        return experiment
+
+    def assemble(cls, priority_bases: tuple, auxiliary_bases: tuple, do_profile=False):
+        """Retrieve the subclass of `cls` that inherits `priority_bases` and `auxiliary_bases`. Each
+        distinct subclass is created once, then cached in :attr:`ExperimentMeta.assembled_classes`
+        while it is in use. This avoids rebuilding the MRO of `cls` each time an Experiment is
+        created, and leaves `cls` itself unmodified. Subclasses are pickled as calls to
+        :meth:`assemble`, so they can be pickled if `cls` and all the callbacks can be
+
+        Parameters
+        ----------
+        priority_bases: Tuple
+            Callback classes to place between `cls` and its original bases in the MRO. See
+            :attr:`hyperparameter_hunter.settings.G.priority_callbacks`
+        auxiliary_bases: Tuple
+            Callback classes to place after the original bases of `cls` in the MRO, sorted by
+            :func:`base_callback_class_sorter`
+        do_profile: Boolean, default=False
+            If True, the callbacks are wrapped by
+            :func:`~hyperparameter_hunter.callbacks.profilers.profile_bases`
+
+        Returns
+        -------
+        ExperimentMeta
+            Subclass of `cls`, with the same name, whose MRO continues with `cls`, `priority_bases`,
+            the original bases of `cls`, then `auxiliary_bases`. This matches the MRO `cls` would
+            have if its own bases were extended by `priority_bases` and `auxiliary_bases`"""
+        key = (cls, priority_bases, auxiliary_bases, do_profile)
+        try:
+            return ExperimentMeta.assembled_classes[key]
+        except KeyError:
+            pass
+
+        if do_profile:
+            priority_bases = profile_bases(priority_bases) + (make_experiment_profiler(),)
+            auxiliary_bases = profile_bases(auxiliary_bases)
+
+        namespace = {
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__doc__": cls.__doc__,
+            "__assembled_from": key,
+        }
+        # Listing the original bases after `cls` keeps the priority bases ahead of them in the MRO
+        bases = (cls,) + priority_bases + getattr(cls, "__original_bases") + auxiliary_bases
+
+        # `type.__new__` skips :meth:`__prepare__` and :meth:`__new__`, which only set up new bases
+        experiment_class = type.__new__(ExperimentMeta, cls.__name__, bases, namespace)
+
+        ExperimentMeta.assembled_classes[key] = experiment_class
+        return experiment_class
+
+
+def _assemble(cls, priority_bases, auxiliary_bases, do_profile):
+    return cls.assemble(priority_bases, auxiliary_bases, do_profile)
+
+
+def _reduce_experiment_class(cls):
+    """Pickle a class made by :meth:`ExperimentMeta.assemble` as a call to it, since the class can't
+    be found by its name, which is that of the class it was assembled from. Other classes made by
+    :class:`ExperimentMeta` are pickled by name, like any other class"""
+    if "__assembled_from" in cls.__dict__:
+        return _assemble, cls.__dict__["__assembled_from"]
+    return cls.__qualname__
+
+
+copyreg.pickle(ExperimentMeta, _reduce_experiment_class)
 
 
 def base_callback_class_sorter(auxiliary_bases, parent_class_order=None):
@@ -25,9 +25,11 @@ from hyperparameter_hunter.algorithm_handlers import (
     identify_algorithm,
     identify_algorithm_hyperparameters,
 )
+from hyperparameter_hunter.callbacks.profilers import CallbackProfiler, StageTimer
 from hyperparameter_hunter.data import TrainDataset, OOFDataset, HoldoutDataset, TestDataset
+from hyperparameter_hunter.data.data_chunks.prediction_chunks import _has_inversion
 from hyperparameter_hunter.experiment_core import ExperimentMeta
-from hyperparameter_hunter.feature_engineering import FeatureEngineer
+from hyperparameter_hunter.feature_engineering import FeatureEngineer, read_only_view
 from hyperparameter_hunter.i_o.exceptions import (
     EnvironmentInactiveError,
     EnvironmentInvalidError,
@@ -36,18 +38,23 @@ from hyperparameter_hunter.i_o.exceptions import (
 from hyperparameter_hunter.i_o.recorders import RecorderList
 from hyperparameter_hunter.keys.makers import HyperparameterKeyMaker
 from hyperparameter_hunter.metrics import ScoringMixIn, get_formatted_target_metric
-from hyperparameter_hunter.models import model_selector
+from hyperparameter_hunter.models import model_selector, clear_native_data_caches
 from hyperparameter_hunter.settings import G
-from hyperparameter_hunter.utils.file_utils import RetryMakeDirs
+from hyperparameter_hunter.utils.boltons_utils import get_path
+from hyperparameter_hunter.utils.file_utils import RetryMakeDirs, make_dirs
+from hyperparameter_hunter.utils.file_utils import read_json, read_pickle, write_pickle
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
 from abc import abstractmethod
 from copy import deepcopy
+from contextlib import suppress
 from inspect import isclass
 import numpy as np
+import os
 import pandas as pd
+import pickle
 import random
 import shutil
 from sys import exc_info
@@ -78,6 +85,7 @@ class BaseExperiment(ScoringMixIn):
         do_raise_repeated=False,
         auto_start=True,
         target_metric=None,
+        on_repeated="run",
     ):
         """One-off Experimentation base class
 
@@ -213,6 +221,16 @@ class BaseExperiment(ScoringMixIn):
             words, for the purposes of Experiment matching/recording, all other factors being equal,
             an Experiment with `callbacks` is considered identical to an Experiment without, despite
             whatever custom functionality was added by the LambdaCallbacks
+        on_repeated: {"run", "reuse"}, default="run"
+            What to do if this Experiment locates a previous Experiment's results with matching
+            Environment and Hyperparameter Keys, and `do_raise_repeated` is False. If "run", a
+            warning is logged, and the Experiment is run again. If "reuse", the most recent matching
+            Experiment's saved description and predictions are loaded instead of fitting any models.
+            This populates :attr:`last_evaluation_results`, :attr:`stat_aggregates`, and the `final`
+            predictions of the datasets that have saved prediction files. In this case,
+            :attr:`served_from_cache` is set to True, and :attr:`experiment_id` is set to the ID of
+            the matching Experiment. If the matching Experiment's description cannot be found, the
+            Experiment is run again, as if `on_repeated` = "run"
 
         See Also
         --------
@@ -234,6 +252,8 @@ class BaseExperiment(ScoringMixIn):
             kwarg of :class:`~hyperparameter_hunter.environment.Environment`, and the callback
             classes literally get thrown in to the parent classes of the Experiment, so they're
             kind of a big deal"""
+        # Started first, so the Experiment's total time includes its initialization
+        self.stage_timer = StageTimer()
         self.model_initializer = model_initializer
         self.model_init_params = identify_algorithm_hyperparameters(self.model_initializer)
         model_init_params = model_init_params if model_init_params is not None else {}
@@ -254,10 +274,11 @@ class BaseExperiment(ScoringMixIn):
         self.do_raise_repeated = do_raise_repeated
         self.auto_start = auto_start
         self.target_metric = target_metric
+        self.on_repeated = on_repeated
 
         #################### Attributes From Active Environment ####################
         self._validate_environment()
-        G.Env.initialize_reporting()
+        self.heartbeat_buffer = G.Env.initialize_reporting().heartbeat_buffer
 
         self.train_dataset = G.Env.train_dataset.copy()
         try:
@@ -289,7 +310,9 @@ class BaseExperiment(ScoringMixIn):
         self.model = None
         self.metrics = None  # Set by :class:`metrics.ScoringMixIn`
         self.stat_aggregates = dict()
+        self.callback_profiler = CallbackProfiler() if G.Env.profile_callbacks else None
         self.result_description = None
+        self.served_from_cache = False
 
         #################### Experiment Identification Attributes ####################
         self.experiment_id = None
@@ -299,8 +322,10 @@ class BaseExperiment(ScoringMixIn):
         ScoringMixIn.__init__(self, **self.metrics_params if self.metrics_params else {})
 
         if self.auto_start is True:
-            self.preparation_workflow()
-            self.experiment_workflow()
+            with G.tracer.span("Experiment", algorithm_name=self.algorithm_name) as span:
+                self.preparation_workflow()
+                self.experiment_workflow()
+                self._trace_result(span)
 
     def __repr__(self):
         return '{}("{}", cross_experiment_key="{}", hyperparameter_key="{}")'.format(
@@ -328,32 +353,53 @@ class BaseExperiment(ScoringMixIn):
             if self.do_raise_repeated is True:
                 self._clean_up()
                 raise RepeatedExperimentError(_ex)
+            if self.on_repeated == "reuse" and self._load_saved_results():
+                self._clean_up()
+                return
             G.debug(_ex)
             G.warn("WARNING: Duplicate experiment!")
 
         self._initialize_random_seeds()
-        self.execute()
+
+        if G.Env.cpu_budget is None:
+            self.execute()
+        else:
+            G.log(f"CPU budget: {G.Env.cpu_budget}")
+            with G.Env.cpu_budget.limit_threads():
+                self.execute()
+
+        self._compact_predictions()
+        if self.callback_profiler is not None:
+            self.stat_aggregates["callback_profile"] = self.callback_profiler.summary()
+        self._report_overhead()
 
         #################### Save Experiment Results ####################
-        recorders = RecorderList(
-            file_blacklist=G.Env.file_blacklist, extra_recorders=G.Env.experiment_recorders
-        )
-        recorders.format_result()
-        G.log(f"Saving results for Experiment: '{self.experiment_id}'")
-        recorders.save_result()
+        with self.stage_timer.time("recording"):
+            recorders = RecorderList(
+                file_blacklist=G.Env.file_blacklist, extra_recorders=G.Env.experiment_recorders
+            )
+            recorders.format_result()
+            G.log(f"Saving results for Experiment: '{self.experiment_id}'")
+            recorders.save_result()
+        self._remove_checkpoint()
         self._clean_up()
 
     def preparation_workflow(self):
         """Execute all tasks that must take place before the experiment is actually started. Such
         tasks include (but are not limited to): Creating experiment IDs and hyperparameter keys,
         creating script backups, and validating parameters"""
-        G.debug("Starting preparation_workflow...")
-        self._generate_experiment_id()
-        self._create_script_backup()
-        self._validate_parameters()
-        self._generate_hyperparameter_key()
-        self._additional_preparation_steps()
-        G.debug("Completed preparation_workflow")
+        with G.tracer.span("preparation_workflow") as span:
+            G.debug("Starting preparation_workflow...")
+            self._generate_experiment_id()
+            self._create_script_backup()
+            self._validate_parameters()
+            with self.stage_timer.time("key_making"):
+                self._generate_hyperparameter_key()
+            self._additional_preparation_steps()
+            span.set_attributes(
+                experiment_id=self.experiment_id, hyperparameter_key=str(self.hyperparameter_key)
+            )
+            G.debug("Completed preparation_workflow")
 
     @abstractmethod
     def _additional_preparation_steps(self):
@@ -374,22 +420,21 @@ class BaseExperiment(ScoringMixIn):
         formal :mod:`~hyperparameter_hunter.data.datasets` attributes, 2) Invoking
         `feature_engineer` to perform "pre_cv"-stage preprocessing, and 3) Updating datasets to
         include their (transformed) counterparts in `feature_engineer`"""
-        #################### Build Datasets ####################
-        data_kwargs = dict(feature_selector=self.feature_selector, target_column=self.target_column)
-        self.data_train = TrainDataset(self.train_dataset, require_data=True, **data_kwargs)
-        self.data_oof = OOFDataset(self.train_dataset, **data_kwargs)
-        self.data_holdout = HoldoutDataset(self.holdout_dataset, **data_kwargs)
-        self.data_test = TestDataset(self.test_dataset, feature_selector=self.feature_selector)
+        self._build_datasets()
 
         #################### Perform Pre-CV Feature Engineering ####################
-        self.feature_engineer(
-            "pre_cv",
-            train_inputs=deepcopy(self.data_train.input.d),
-            train_targets=deepcopy(self.data_train.target.d),
-            holdout_inputs=deepcopy(self.data_holdout.input.d),
-            holdout_targets=deepcopy(self.data_holdout.target.d),
-            test_inputs=deepcopy(self.data_test.input.d),
-        )
+        # Steps declared with `in_place=False` get read-only views. Others get copies of datasets
+        with self.stage_timer.time("feature_engineering"), G.tracer.span(
+            "feature_engineer", stage="pre_cv"
+        ):
+            self.feature_engineer(
+                "pre_cv",
+                train_inputs=read_only_view(self.data_train.input.d),
+                train_targets=read_only_view(self.data_train.target.d),
+                holdout_inputs=read_only_view(self.data_holdout.input.d),
+                holdout_targets=read_only_view(self.data_holdout.target.d),
+                test_inputs=read_only_view(self.data_test.input.d),
+            )
         self.data_train.input.T.d = self.feature_engineer.datasets["train_inputs"]
         self.data_train.target.T.d = self.feature_engineer.datasets["train_targets"]
         self.data_holdout.input.T.d = self.feature_engineer.datasets["holdout_inputs"]
@@ -399,14 +444,138 @@ class BaseExperiment(ScoringMixIn):
         G.log("Initial preprocessing stage complete", 4)
         super().on_exp_start()
 
+    def _build_datasets(self):
+        """Initialize formal :mod:`~hyperparameter_hunter.data.datasets` attributes"""
+        data_kwargs = dict(feature_selector=self.feature_selector, target_column=self.target_column)
+        self.data_train = TrainDataset(self.train_dataset, require_data=True, **data_kwargs)
+        self.data_oof = OOFDataset(self.train_dataset, **data_kwargs)
+        self.data_holdout = HoldoutDataset(self.holdout_dataset, **data_kwargs)
+        self.data_test = TestDataset(self.test_dataset, feature_selector=self.feature_selector)
+
+    ##################################################
+    # Saved Result Methods:
+    ##################################################
+    def _load_saved_results(self) -> bool:
+        """Populate the Experiment's results with those of the most recent saved Experiment that
+        has the same keys, instead of fitting any models. :attr:`last_evaluation_results` and
+        :attr:`stat_aggregates` are read from the saved description, and the `final` predictions of
+        each dataset are read from its saved prediction file, if one exists. Saved evaluations are
+        nested lists, which are converted back to arrays, as recorded by
+        :class:`~hyperparameter_hunter.callbacks.aggregators.AggregatorEvaluations`
+
+        Returns
+        -------
+        Boolean
+            True if the Experiment's results were loaded. False if no description was found"""
+        if self.result_paths["description"] is None:
+            return False
+
+        tested_keys_path = f"{self.result_paths['tested_keys']}/{self.cross_experiment_key}.json"
+        experiment_ids = read_json(tested_keys_path).get(str(self.hyperparameter_key), [])
+
+        for experiment_id in reversed(experiment_ids):
+            description_path = f"{self.result_paths['description']}/{experiment_id}.json"
+            if os.path.isfile(description_path):
+                break
+        else:
+            G.warn("WARNING: Saved description of duplicate experiment not found. Running again")
+            return False
+
+        description = read_json(description_path)
+        self._remove_script_backup()
+        self.experiment_id = experiment_id
+        self.last_evaluation_results = description["final_evaluations"]
+        self.stat_aggregates = description["aggregates"]
+        for agg_val in self.stat_aggregates.get("evaluations", {}).values():
+            for division in ["runs", "folds", "reps"]:
+                agg_val[division] = np.asarray(agg_val[division])
+
+        self._build_datasets()
+        # OOF predictions are indexed like `train_dataset`. Holdout/test predictions are not
+        for (dataset, data, index) in [
+            ("oof", self.train_dataset, getattr(self.train_dataset, "index", None)),
+            ("holdout", self.holdout_dataset, None),
+            ("test", self.test_dataset, None),
+        ]:
+            if data is not None:
+                predictions = self._read_saved_predictions(f"predictions_{dataset}", index)
+                if predictions is not None:
+                    chunk = getattr(self, f"data_{dataset}").prediction
+                    for form in self._get_saved_prediction_forms(chunk):
+                        form.final = predictions
+        self._compact_predictions()
+
+        self.served_from_cache = True
+        G.log(f"Served results of duplicate Experiment '{self.experiment_id}' from cache")
+        return True
+
+    def _get_saved_prediction_forms(self, chunk) -> list:
+        """Determine the forms of prediction chunk `chunk` described by the saved prediction files,
+        which hold inverted predictions. Without target inversion by :attr:`feature_engineer`, the
+        transformed and inverted forms are identical, so both are, if transformed predictions are
+        kept. Otherwise, only the inverted form is, and the `final` transformed predictions remain
+        None
+
+        Parameters
+        ----------
+        chunk: BasePredictionChunk
+            Prediction chunk of a dataset, whose `T` attribute holds the transformed predictions
+
+        Returns
+        -------
+        List
+            `chunk` and/or `chunk.T`"""
+        if chunk.T.kept and not _has_inversion(self.feature_engineer):
+            return [chunk, chunk.T]
+        return [chunk]
+
+    def _read_saved_predictions(self, result_path_key: str, index=None):
+        """Read the predictions saved for :attr:`experiment_id` in the directory given by
+        `result_path_key`, in the format of a dataset's `final` predictions
+
+        Parameters
+        ----------
+        result_path_key: String
+            Key of :attr:`result_paths` for the directory of the predictions. One of
+            ["predictions_oof", "predictions_holdout", "predictions_test"]
+        index: pd.Index, or None, default=None
+            Index given to the predictions. If None, a `RangeIndex`
+
+        Returns
+        -------
+        pd.DataFrame, or None
+            Predictions, with :attr:`target_column` columns. None if the file was not saved, or if
+            it lacks any of :attr:`target_column`"""
+        if self.result_paths[result_path_key] is None:
+            return None
+
+        try:
+            saved = pd.read_csv(f"{self.result_paths[result_path_key]}/{self.experiment_id}.csv")
+            return pd.DataFrame(
+                saved.loc[:, self.target_column].values, index=index, columns=self.target_column
+            )
+        except (FileNotFoundError, KeyError, ValueError):
+            G.debug(f"Unable to read saved '{result_path_key}' for '{self.experiment_id}'")
+            return None
+
     ##################################################
     # Supporting Methods:
     ##################################################
+    def _compact_predictions(self):
+        """Convert the predictions of all datasets to :attr:`Environment.prediction_dtype` for
+        storage, once they have been evaluated"""
+        for dataset in [self.data_oof, self.data_holdout, self.data_test]:
+            dataset.prediction.compact(G.Env.prediction_dtype)
+
     def _validate_parameters(self):
         """Ensure provided input parameters are properly formatted"""
         #################### target_metric ####################
         self.target_metric = get_formatted_target_metric(self.target_metric, self.metrics)
 
+        #################### on_repeated ####################
+        if self.on_repeated not in ("run", "reuse"):
+            raise ValueError(f"`on_repeated` must be 'run' or 'reuse', not {self.on_repeated!r}")
+
         #################### feature_selector ####################
         self.feature_selector = self.feature_selector or self.train_dataset.columns.values
         restricted_cols = [_ for _ in self.target_column + [self.id_column] if _ is not None]
@@ -423,11 +592,40 @@ class BaseExperiment(ScoringMixIn):
         else:
             raise EnvironmentInvalidError("Current experiment must finish before starting another")
 
-    @staticmethod
-    def _clean_up():
+    def _clean_up(self):
         """Clean up after experiment to prepare for next experiment"""
+        if self.heartbeat_buffer is not None:
+            self.heartbeat_buffer.detach()
+        clear_native_data_caches()
         G.Env.current_task = None
 
+    ##################################################
+    # Checkpoint Methods:
+    ##################################################
+    @property
+    def checkpoint_path(self):
+        """Path to the file at which the Experiment's progress is checkpointed. Experiments with the
+        same `cross_experiment_key` and `hyperparameter_key` share a checkpoint, so a repeated
+        Experiment can resume the progress of an interrupted one. None if `checkpoint` result files
+        are not saved
+
+        Returns
+        -------
+        String, or None
+            Path to the .pkl checkpoint file, or None if `checkpoint` is blacklisted"""
+        checkpoint_dir = G.Env.result_paths.get("checkpoint")
+        if checkpoint_dir is None or self.hyperparameter_key is None:
+            return None
+        return os.path.join(
+            checkpoint_dir, str(self.cross_experiment_key), f"{self.hyperparameter_key}.pkl"
+        )
+
+    def _remove_checkpoint(self):
+        """Delete the file at :attr:`checkpoint_path` once the Experiment's results are saved"""
+        if self.checkpoint_path is not None:
+            with suppress(FileNotFoundError):
+                os.remove(self.checkpoint_path)
+
     ##################################################
     # Key/ID Methods:
     ##################################################
@@ -450,7 +648,7 @@ class BaseExperiment(ScoringMixIn):
         self.hyperparameter_key = HyperparameterKeyMaker(parameters, self.cross_experiment_key)
         G.log("Hyperparameter Key:     '{}'".format(self.hyperparameter_key))
         G.debug("Raw hyperparameters...")
-        G.debug(self.hyperparameter_key.parameters)
+        G.debug(lambda: self.hyperparameter_key.parameters)
 
     def _create_script_backup(self):
         """Create and save a copy of the script that initialized the Experiment if allowed to, and
@@ -479,6 +677,13 @@ class BaseExperiment(ScoringMixIn):
                 )
             raise
 
+    def _remove_script_backup(self):
+        """Delete the script backup created for :attr:`experiment_id`, if any. Used when the
+        Experiment's results are served from a saved Experiment, whose own script backup is kept"""
+        if self.result_paths["script_backup"] is not None:
+            with suppress(FileNotFoundError):
+                os.remove(f"{self.result_paths['script_backup']}/{self.experiment_id}.py")
+
     @RetryMakeDirs()
     def _source_copy_helper(self):
         """Helper method to handle attempting to copy source script to backup file"""
@@ -489,6 +694,44 @@ class BaseExperiment(ScoringMixIn):
     ##################################################
     # Utility Methods:
     ##################################################
+    def evaluate(self, *args, **kwargs):
+        """Time :meth:`~hyperparameter_hunter.metrics.ScoringMixIn.evaluate` as the "evaluation"
+        stage of :attr:`stage_timer`"""
+        with self.stage_timer.time("evaluation"):
+            return super().evaluate(*args, **kwargs)
+
+    def _report_overhead(self):
+        """Add the :attr:`stage_timer` report of the time spent so far to :attr:`stat_aggregates`
+        under "overhead", and warn if the framework's share of it exceeds the Environment's
+        `overhead_threshold`. Called before results are recorded, so the report matches the saved
+        description, and excludes the time spent recording, which remains in :attr:`stage_timer`"""
+        report = self.stat_aggregates["overhead"] = self.stage_timer.report()
+        threshold = G.Env.overhead_threshold
+
+        if threshold is not None and report["framework_fraction"] > threshold:
+            G.warn(
+                f"WARNING: Framework overhead was {report['framework_fraction']:.0%} of the "
+                f"Experiment's time ({report['framework']:.3f}s of {report['total']:.3f}s), "
+                f"exceeding `overhead_threshold`={threshold}. "
+                f"Fitting and predicting took {report['model']:.3f}s"
+            )
+
+    def _trace_result(self, span):
+        """Set the "score" attribute of `span` to the latest evaluation of :attr:`target_metric`,
+        and identify the Experiment in its "experiment_id" and "hyperparameter_key" attributes
+
+        Parameters
+        ----------
+        span: :class:`~hyperparameter_hunter.i_o.tracing.Span`
+            Span of the division of the Experiment that just ended"""
+        if not span.is_recording:
+            return
+        with suppress(KeyError, IndexError, TypeError):
+            span.set_attribute("score", get_path(self.last_evaluation_results, self.target_metric))
+        span.set_attributes(
+            experiment_id=self.experiment_id, hyperparameter_key=str(self.hyperparameter_key)
+        )
+
     def _initialize_random_seeds(self):
         """Initialize global random seed, and generate random seeds for stages if not provided"""
         np.random.seed(self.experiment_params["global_random_seed"])
@@ -568,6 +811,7 @@ class BaseCVExperiment(BaseExperiment):
         do_raise_repeated=False,
         auto_start=True,
         target_metric=None,
+        on_repeated="run",
     ):
         self._rep = 0
         self._fold = 0
@@ -576,6 +820,7 @@ class BaseCVExperiment(BaseExperiment):
         self.train_index = None
         self.validation_index = None
         self.folds = None
+        self.do_checkpoint = True
 
         #################### Initialize Result Placeholders ####################
         # self.full_oof_predictions = None  # (n_repeats * runs) intermediate columns
@@ -593,6 +838,7 @@ class BaseCVExperiment(BaseExperiment):
             do_raise_repeated=do_raise_repeated,
             auto_start=auto_start,
             target_metric=target_metric,
+            on_repeated=on_repeated,
         )
 
     def _additional_preparation_steps(self):
@@ -604,7 +850,9 @@ class BaseCVExperiment(BaseExperiment):
         """"""
 
     def execute(self):
-        self.cross_validation_workflow()
+        with G.tracer.span("cross_validation_workflow") as span:
+            self.cross_validation_workflow()
+            self._trace_result(span)
 
     def cross_validation_workflow(self):
         """Execute workflow for cross-validation process, consisting of the following tasks:
@@ -612,22 +860,126 @@ class BaseCVExperiment(BaseExperiment):
         performing `cv_fold_workflow` for each, 3) Average accumulated predictions over fold
         splits, 4) Evaluate final predictions, 5) Format final predictions to prepare for saving"""
         self.on_exp_start()
+        checkpoint = self._load_checkpoint()
+        last_rep, last_fold = (checkpoint["_rep"], checkpoint["_fold"]) if checkpoint else (-1, -1)
 
         reshaped_indices = get_cv_indices(
             self.folds, self.cv_params, self.data_train.input.d, self.data_train.target.d.iloc[:, 0]
         )
 
         for self._rep, rep_indices in enumerate(reshaped_indices):
-            self.on_rep_start()
-
-            for self._fold, (self.train_index, self.validation_index) in enumerate(rep_indices):
-                self.cv_fold_workflow()
-
-            self.on_rep_end()
+            if self._rep < last_rep:
+                # Repetition completed before checkpoint, and its results are restored below, but
+                #   its fold indices must still be consumed, since `reshaped_indices` is lazy
+                for _ in rep_indices:
+                    pass
+                continue
+
+            with G.tracer.span("rep", rep=self._rep) as span:
+                self.on_rep_start()
+                if self._rep == last_rep:
+                    self._set_checkpoint_state(checkpoint)
+
+                for self._fold, (self.train_index, self.validation_index) in enumerate(rep_indices):
+                    if (self._rep, self._fold) <= (last_rep, last_fold):
+                        continue
+                    with G.tracer.span(
+                        "cv_fold_workflow", rep=self._rep, fold=self._fold
+                    ) as f_span:
+                        self.cv_fold_workflow()
+                        self._trace_result(f_span)
+                    self.save_checkpoint()
+
+                self.on_rep_end()
+                self._trace_result(span)
         self.on_exp_end()
 
         G.log("")
 
+    ##################################################
+    # Checkpoint Methods:
+    ##################################################
+    def save_checkpoint(self):
+        """Save the state of the Experiment after its last completed fold (see
+        :meth:`_get_checkpoint_state`) to :attr:`checkpoint_path`. If the Experiment is interrupted,
+        an Experiment with the same keys will resume after the last completed fold"""
+        checkpoint_path = self.checkpoint_path
+        if checkpoint_path is None or not self.do_checkpoint:
+            return
+
+        make_dirs(os.path.dirname(checkpoint_path), exist_ok=True)
+        try:
+            write_pickle(checkpoint_path, self._get_checkpoint_state())
+        except (pickle.PicklingError, AttributeError, TypeError) as _ex:
+            G.warn(f"Unable to save Experiment checkpoint. Checkpoints disabled. {_ex!r}")
+            self.do_checkpoint = False
+
+    def _load_checkpoint(self):
+        """Read the checkpoint at :attr:`checkpoint_path` left by an interrupted Experiment
+
+        Returns
+        -------
+        Dict, or None
+            The state saved by :meth:`save_checkpoint`, or None if there is no checkpoint"""
+        checkpoint_path = self.checkpoint_path
+        if checkpoint_path is None or not self.do_checkpoint or not os.path.isfile(checkpoint_path):
+            return None
+
+        checkpoint = read_pickle(checkpoint_path)
+        G.log(
+            "Resuming from checkpoint of Experiment '{}' after rep {}, fold {}".format(
+                checkpoint["experiment_id"], checkpoint["_rep"], checkpoint["_fold"]
+            )
+        )
+        return checkpoint
+
+    def _get_checkpoint_state(self) -> dict:
+        """Collect the attributes that are accumulated across folds, to be saved by
+        :meth:`save_checkpoint`. These are the `rep` and `final` divisions of all data chunks
+        (including the transformed and inverted predictions), :attr:`stat_aggregates` (evaluations
+        and times), and :attr:`last_evaluation_results`
+
+        Returns
+        -------
+        Dict
+            The state of the Experiment after the current fold"""
+        chunks = {}
+        for dataset_name in ["data_train", "data_oof", "data_holdout", "data_test"]:
+            for chunk_name in ["input", "target", "prediction"]:
+                chunk = getattr(getattr(self, dataset_name), chunk_name)
+                for division in ["rep", "final"]:
+                    chunks[(dataset_name, chunk_name, division)] = getattr(chunk, division)
+                    if not getattr(chunk.T, "kept", True):
+                        continue  # Transformed predictions are not accumulated
+                    chunks[(dataset_name, chunk_name, "T", division)] = getattr(chunk.T, division)
+
+        return dict(
+            experiment_id=self.experiment_id,
+            _rep=self._rep,
+            _fold=self._fold,
+            _run=self._run,
+            chunks=chunks,
+            stat_aggregates=self.stat_aggregates,
+            last_evaluation_results=self.last_evaluation_results,
+        )
+
+    def _set_checkpoint_state(self, state: dict):
+        """Restore the state collected by :meth:`_get_checkpoint_state`. Must be invoked after
+        :meth:`on_rep_start` for the repetition in which the checkpoint was saved, so the restored
+        `rep` divisions are not reset
+
+        Parameters
+        ----------
+        state: Dict
+            The state of the Experiment after the last completed fold"""
+        for (dataset_name, chunk_name, *transformed, division), value in state["chunks"].items():
+            chunk = getattr(getattr(self, dataset_name), chunk_name)
+            setattr(chunk.T if transformed else chunk, division, value)
+
+        self._run = state["_run"]
+        self.stat_aggregates = state["stat_aggregates"]
+        self.last_evaluation_results = state["last_evaluation_results"]
+
     ##################################################
     # Fold Workflow Methods:
     ##################################################
@@ -655,16 +1007,19 @@ class BaseCVExperiment(BaseExperiment):
                 data_chunk.T.fold = data_chunk.T.d.copy()
 
         #################### Perform Intra-CV Feature Engineering ####################
-        self.feature_engineer(
-            "intra_cv",
-            train_inputs=self.data_train.input.T.fold,
-            train_targets=self.data_train.target.T.fold,
-            validation_inputs=self.data_oof.input.T.fold,
-            validation_targets=self.data_oof.target.T.fold,
-            holdout_inputs=self.data_holdout.input.T.fold,
-            holdout_targets=self.data_holdout.target.T.fold,
-            test_inputs=self.data_test.input.T.fold,
-        )
+        with self.stage_timer.time("feature_engineering"), G.tracer.span(
+            "feature_engineer", stage="intra_cv"
+        ):
+            self.feature_engineer(
+                "intra_cv",
+                train_inputs=self.data_train.input.T.fold,
+                train_targets=self.data_train.target.T.fold,
+                validation_inputs=self.data_oof.input.T.fold,
+                validation_targets=self.data_oof.target.T.fold,
+                holdout_inputs=self.data_holdout.input.T.fold,
+                holdout_targets=self.data_holdout.target.T.fold,
+                test_inputs=self.data_test.input.T.fold,
+            )
         self.data_train.input.T.fold = self.feature_engineer.datasets["train_inputs"]
         self.data_train.target.T.fold = self.feature_engineer.datasets["train_targets"]
         self.data_oof.input.T.fold = self.feature_engineer.datasets["validation_inputs"]
@@ -683,7 +1038,11 @@ class BaseCVExperiment(BaseExperiment):
         G.log("Intra-CV preprocessing stage complete", 4)
 
         for self._run in range(self.experiment_params.get("runs", 1)):
-            self.cv_run_workflow()
+            with G.tracer.span(
+                "cv_run_workflow", rep=self._rep, fold=self._fold, run=self._run
+            ) as span:
+                self.cv_run_workflow()
+                self._trace_result(span)
         self.on_fold_end()
 
     ##################################################
@@ -702,9 +1061,13 @@ class BaseCVExperiment(BaseExperiment):
         """Execute run workflow, consisting of: 1) Execute overridden :meth:`on_run_start` tasks,
         2) Initialize and fit Model, 3) Execute overridden :meth:`on_run_end` tasks"""
         self.on_run_start()
+        model_init_params = deepcopy(self.model_init_params)
+        if G.Env.cpu_budget is not None:
+            model_init_params = G.Env.cpu_budget.inject(model_init_params, self.model_initializer)
+
         self.model = model_selector(self.model_initializer)(
             self.model_initializer,
-            deepcopy(self.model_init_params),
+            model_init_params,
             deepcopy(self.model_extra_params),
             train_input=self.data_train.input.T.fold,
             train_target=self.data_train.target.T.fold,
@@ -714,7 +1077,8 @@ class BaseCVExperiment(BaseExperiment):
             target_metric=self.target_metric,
             metrics=self.metrics,
         )
-        self.model.fit()
+        with self.stage_timer.time("fit"):
+            self.model.fit()
         self.on_run_end()
 
 
@@ -735,6 +1099,7 @@ class CVExperiment(BaseCVExperiment, metaclass=ExperimentMeta):
         auto_start=True,
         target_metric=None,
         callbacks=None,  # I get picked up by `ExperimentMeta`
+        on_repeated="run",
     ):
         BaseCVExperiment.__init__(
             self,
@@ -747,6 +1112,7 @@ class CVExperiment(BaseCVExperiment, metaclass=ExperimentMeta):
             do_raise_repeated=do_raise_repeated,
             auto_start=auto_start,
             target_metric=target_metric,
+            on_repeated=on_repeated,
         )
 
     def _initialize_folds(self):
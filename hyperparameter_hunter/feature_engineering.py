@@ -27,19 +27,30 @@ Related
 # Import Own Assets
 ##################################################
 from hyperparameter_hunter.keys.hashing import make_hash_sha256
+from hyperparameter_hunter.settings import G
 from hyperparameter_hunter.space.dimensions import Categorical, RejectedOptional
 from hyperparameter_hunter.utils.boltons_utils import remap, default_visit, default_enter
 from hyperparameter_hunter.utils.general_utils import subdict
+from hyperparameter_hunter.utils.parallel_utils import CPUBudget
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
 import ast
-from contextlib import suppress
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+import hashlib
 from inspect import getsource
+from itertools import chain
 import numpy as np
+from numpy.lib.format import open_memmap
+import os
 import pandas as pd
-from typing import List, Callable, Dict, Union, Tuple
+import tempfile
+from typing import List, Callable, Dict, Iterable, Iterator, Optional, Union, Tuple
+from uuid import uuid4 as uuid
+import weakref
 
 ##################################################
 # Global Variables
@@ -270,13 +281,89 @@ def split_merged_df(merged_df: pd.DataFrame) -> DFDict:
         Mapping of dataset names to their DataFrame values. Keys in `dfs` will be a subset of
         {"train_data", "train_inputs", "train_targets", "validation_data", "validation_inputs",
         "validation_targets", "holdout_data", "holdout_inputs", "holdout_targets", "test_inputs"}
-        containing only those values that are also primary indexes in `merged_df`"""
+        containing only those values that are also primary indexes in `merged_df`
+
+    Notes
+    -----
+    If the rows of each dataset in `merged_df` are still contiguous (as they are when produced by
+    :func:`merge_dfs`), each dataset is sliced by its row offsets, rather than looked up by label.
+    If `merged_df` also has a single NumPy dtype, the DataFrames in `dfs` are views of the values of
+    `merged_df`, so splitting copies no data. Otherwise, each dataset is copied
+
+    Examples
+    --------
+    >>> merged_df = merge_dfs("all_inputs", "pre_cv", dict(
+    ...     train_inputs=pd.DataFrame(dict(a=[0.0, 1.0]), index=[3, 4]),
+    ...     holdout_inputs=pd.DataFrame(dict(a=[2.0]), index=[5]),
+    ... ))
+    >>> dfs = split_merged_df(merged_df)
+    >>> dfs["train_inputs"]
+         a
+    3  0.0
+    4  1.0
+    >>> dfs["holdout_inputs"]
+         a
+    5  2.0
+    >>> np.shares_memory(dfs["train_inputs"].values, merged_df.values)
+    True"""
+    segments = _get_merged_segments(merged_df)
+    if segments is None:
+        return {_: merged_df.loc[_, :].copy() for _ in merged_df.index.levels[0]}
+
+    values = None
+    if len(merged_df.columns) and len(set(merged_df.dtypes)) == 1:
+        if isinstance(merged_df.dtypes.iloc[0], np.dtype):
+            values = merged_df.values  # A view for DataFrames with a single NumPy dtype
+
     dfs = dict()
-    for df_index in merged_df.index.levels[0]:
-        dfs[df_index] = merged_df.loc[df_index, :].copy()
+    for df_name, rows in segments.items():
+        index = merged_df.index[rows].droplevel(0)
+        if values is not None:
+            dfs[df_name] = pd.DataFrame(
+                values[rows], index=index, columns=merged_df.columns, copy=False
+            )
+        else:
+            dfs[df_name] = merged_df.iloc[rows].copy()
+            dfs[df_name].index = index
     return dfs
 
 
+def _get_merged_segments(merged_df: pd.DataFrame) -> Union[Dict[str, slice], None]:
+    """Find the rows belonging to each dataset in a DataFrame produced by :func:`merge_dfs`
+
+    Parameters
+    ----------
+    merged_df: pd.DataFrame
+        Multi-indexed DataFrame of the form returned by :func:`merge_dfs`
+
+    Returns
+    -------
+    Dict[str, slice], or None
+        Mapping of the primary indexes in `merged_df` to the slices of rows they label. None if the
+        rows of any primary index are not contiguous, in which case they cannot be sliced
+
+    Examples
+    --------
+    >>> merged_df = pd.DataFrame(
+    ...     dict(a=range(5)), index=pd.MultiIndex.from_arrays([list("xxyyz"), range(5)])
+    ... )
+    >>> _get_merged_segments(merged_df)
+    {'x': slice(0, 2, None), 'y': slice(2, 4, None), 'z': slice(4, 5, None)}
+    >>> _get_merged_segments(merged_df.iloc[[0, 2, 1, 3, 4]]) is None
+    True"""
+    codes = np.asarray(merged_df.index.codes[0])
+    if len(codes) == 0:
+        return None
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    if len(np.unique(codes[starts])) != len(starts):
+        return None
+
+    stops = np.r_[starts[1:], len(codes)]
+    names = merged_df.index.levels[0][codes[starts]]
+    return {name: slice(start, stop) for name, start, stop in zip(names, starts, stops)}
+
+
 def validate_dataset_names(params: Tuple[str], stage: str) -> List[str]:
     """Produce the names of merged datasets in `params` and verify there are no duplicate references
     to any datasets in `params`
@@ -318,7 +405,17 @@ def validate_dataset_names(params: Tuple[str], stage: str) -> List[str]:
 
 
 class EngineerStep:
-    def __init__(self, f: Callable, stage=None, name=None, params=None, do_validate=False):
+    def __init__(
+        self,
+        f: Callable,
+        stage=None,
+        name=None,
+        params=None,
+        do_validate=False,
+        row_wise=False,
+        fit=None,
+        in_place=None,
+    ):
         """Container for individual :class:`FeatureEngineer` step functions
 
         Compartmentalizes functions of singular engineer steps and allows for greater customization
@@ -406,6 +503,30 @@ class EngineerStep:
             were actually modified. Results will be logged. If `do_validate` = "strict", an
             exception will be raised if any anomalies are found, rather than logging a message. If
             `do_validate` = False, no validation will be performed
+        row_wise: Boolean, default=False
+            Whether `f` treats each row of the dataset it requests independently, returning exactly
+            one row for each row it is given, in the same order. Row-wise steps must request a
+            single dataset in `params`, such as "all_inputs". If True, and the `FeatureEngineer`
+            has a `chunk_size`, `f` is called on row chunks of each standard dataset in `params`,
+            rather than on the whole (merged) dataset, and its results are written to a
+            :class:`ColumnStore`. Because a row-wise `f` produces identical results either way,
+            `row_wise` does not affect Experiment keys
+        fit: Callable, or None, default=None
+            Only used if `row_wise` is True. Callable that computes the fitted state of the step
+            (means, encoders, etc.) in a first pass over the train dataset. `fit` receives an
+            iterator of row chunks of the train dataset of the same group ("inputs"/"targets") as
+            `params`, and returns the fitted state, which is then given to `f` as the keyword
+            argument `fit_state`. If the `FeatureEngineer` has no `chunk_size`, the iterator yields
+            the whole train dataset as a single chunk. Unlike `row_wise`, `fit` is part of the
+            step's key data, since it affects the step's results
+        in_place: Boolean, or None, default=None
+            Whether `f` modifies the datasets it is given in place, rather than returning new
+            DataFrames. Experiments give "pre_cv" steps read-only views of their datasets (see
+            :func:`read_only_view`), instead of copying them. If False, `f` is given the read-only
+            views, and a `ValueError` is raised if it attempts to modify them. Otherwise, `f` is
+            given writable copies of any read-only datasets it requests. Undeclared steps (None)
+            are given copies because retrying a step after it fails to modify a view would repeat
+            any side effects of its first call. `in_place` does not affect Experiment keys
 
         See Also
         --------
@@ -502,17 +623,46 @@ class EngineerStep:
         >>> es_4.params
         ('train_targets', 'non_train_targets')
         >>> # `params` does not include any returned transformers - Only data requested as input
+
+        *Row-wise steps can be executed on row chunks of each dataset. If they need to be fitted to
+        the train data, `fit` makes a first pass over it, and its result is given to `f`*
+
+        >>> def fit_scaler(train_chunks):
+        ...     s = StandardScaler()
+        ...     for chunk in train_chunks:
+        ...         s.partial_fit(chunk.values)
+        ...     return s
+        >>> def row_scale(all_inputs, fit_state):
+        ...     all_inputs[all_inputs.columns] = fit_state.transform(all_inputs.values)
+        ...     return all_inputs
+        >>> es_5 = EngineerStep(row_scale, row_wise=True, fit=fit_scaler)
+        >>> es_5.params
+        ('all_inputs',)
+        >>> EngineerStep(s_scale, row_wise=True)
+        Traceback (most recent call last):
+            File "feature_engineering.py", line ?, in __init__
+        ValueError: Row-wise steps must request a single dataset, not ('train_inputs', ...)
         """
         self._f = f
         self._name = name
+        self.row_wise = row_wise
+        self.fit = fit
+        self.in_place = in_place
         self.params = params
         self._stage = stage
         self.do_validate = do_validate
 
+        if self.row_wise and len(self.params) != 1:
+            raise ValueError(f"Row-wise steps must request a single dataset, not {self.params}")
+        if self.fit is not None and not self.row_wise:
+            raise ValueError("`fit` may only be given for row-wise steps")
+
         self.inversion = None
+        self.fit_state = None
         self.merged_datasets: List[str] = validate_dataset_names(self.params, self.stage)
         self.original_hashes = dict()
         self.updated_hashes = dict()
+        self.hash_cache: Optional[DatasetHashCache] = None
 
     def __call__(self, **datasets: DFDict) -> DFDict:
         """Apply :attr:`f` to `datasets` to produce updated datasets. If `f` requests any
@@ -532,14 +682,10 @@ class EngineerStep:
             merged prior to being given to :attr:`f` have been split back into the original
             datasets, with the updates made by :attr:`f`"""
         if self.do_validate:
-            self.original_hashes = hash_datasets(datasets)
+            self.original_hashes = self._hash_datasets(datasets, modified=())
 
         datasets_for_f = self.get_datasets_for_f(datasets)
-        step_result = self.f(**datasets_for_f)
-        step_result = (step_result,) if not isinstance(step_result, tuple) else step_result
-
-        if len(step_result) == len(self.params) + 1:
-            self.inversion, step_result = step_result[-1], step_result[:-1]
+        step_result = self._call_f_guarded(datasets_for_f, datasets)
 
         new_datasets = dict(zip(self.params, step_result))
         for dataset_name, dataset_value in new_datasets.items():
@@ -548,10 +694,165 @@ class EngineerStep:
         new_datasets = dict(datasets, **new_datasets)
 
         if self.do_validate:
-            self.updated_hashes = hash_datasets(new_datasets)
+            self.updated_hashes = self._hash_datasets(new_datasets, self.get_leaf_datasets())
         # TODO: Check `self.do_validate` here to decide whether to `compare_dataset_columns`
         return new_datasets
 
+    def call_in_chunks(self, chunk_size: int, store: "ColumnStore", **datasets: DFDict) -> DFDict:
+        """Apply the row-wise :attr:`f` to row chunks of each standard dataset in :attr:`params`,
+        writing the results to `store`. This is the chunked counterpart of
+        :meth:`EngineerStep.__call__`, and it produces the same datasets. Merged datasets are never
+        built. Instead, :attr:`f` is called on chunks of each of the datasets that would have been
+        merged, so at most `chunk_size` rows are given to :attr:`f` at a time
+
+        Parameters
+        ----------
+        chunk_size: Int
+            Maximum number of rows in each chunk given to :attr:`f`
+        store: ColumnStore
+            Store to which the results of :attr:`f` are written. The returned datasets are read
+            from `store`
+        **datasets: DFDict
+            Original dict of datasets, containing all datasets, some of which may be superfluous
+
+        Returns
+        -------
+        new_datasets: DFDict
+            Dict of datasets, in which those requested by :attr:`f` have been updated"""
+        if not self.row_wise:
+            raise ValueError(f"{self!r} is not row-wise, so it cannot be called in chunks")
+        if self.do_validate:
+            self.original_hashes = self._hash_datasets(datasets, modified=())
+
+        param = self.params[0]
+        names = names_for_merge(param, self.stage) if param in MERGED_DATASET_NAMES else [param]
+        self._fit(datasets, chunk_size)
+
+        new_datasets = dict()
+        for name in [_ for _ in names if isinstance(datasets.get(_, None), pd.DataFrame)]:
+            result_chunks = (
+                self._call_f({param: chunk}, datasets, expected_rows=len(chunk))[0]
+                for chunk in iter_row_chunks(datasets[name], chunk_size)
+            )
+            new_datasets[name] = store.write(result_chunks, datasets[name].index)
+        new_datasets = dict(datasets, **new_datasets)
+
+        if self.do_validate:
+            self.updated_hashes = self._hash_datasets(new_datasets, self.get_leaf_datasets())
+        return new_datasets
+
+    def _hash_datasets(self, datasets: DFDict, modified: Iterable[str]) -> dict:
+        """Helper to hash `datasets` for validation, reusing the hashes in :attr:`hash_cache` of
+        datasets that are not `modified`, if :attr:`hash_cache` is set. See
+        :meth:`DatasetHashCache.hash_datasets`"""
+        if self.hash_cache is None:
+            return hash_datasets(datasets)
+        return self.hash_cache.hash_datasets(datasets, modified)
+
+    def _call_f_guarded(self, datasets_for_f: DFDict, datasets: DFDict) -> tuple:
+        """Helper to call :meth:`_call_f`, giving :attr:`f` new read-only views of the read-only
+        datasets in `datasets_for_f` if :attr:`in_place` is False, or writable copies of them
+        otherwise. New views ensure that changes :attr:`f` makes to the DataFrames themselves (like
+        adding columns) do not affect the datasets given to the step
+
+        Parameters
+        ----------
+        datasets_for_f: DFDict
+            Datasets to give to :attr:`f`, as produced by :meth:`get_datasets_for_f`
+        datasets: DFDict
+            All datasets given to the step. See :meth:`_call_f`
+
+        Returns
+        -------
+        Tuple
+            Datasets returned by :attr:`f`, in the same order as :attr:`params`
+
+        Raises
+        ------
+        ValueError
+            If :attr:`in_place` is False, but :attr:`f` modifies its read-only datasets in place"""
+        guarded = [_ for _, df in datasets_for_f.items() if is_read_only(df)]
+
+        if guarded and self.in_place is False:
+            views = {_: read_only_view(datasets_for_f[_]) for _ in guarded}
+            try:
+                return self._call_f(dict(datasets_for_f, **views), datasets)
+            except ValueError as _ex:
+                if "read-only" not in str(_ex):
+                    raise
+                raise ValueError(
+                    f"EngineerStep {self.name!r} modifies its datasets in place, but it was "
+                    "declared with `in_place=False`. Declare it with `in_place=True` to give it "
+                    "copies"
+                ) from _ex
+
+        copies = {_: datasets_for_f[_].copy() for _ in guarded}
+        return self._call_f(dict(datasets_for_f, **copies), datasets)
+
+    def _call_f(self, datasets_for_f: DFDict, datasets: DFDict, expected_rows=None) -> tuple:
+        """Helper to call :attr:`f` with `datasets_for_f` (and :attr:`fit_state`, if :attr:`fit`
+        is given), and set :attr:`inversion` if :attr:`f` returned one
+
+        Parameters
+        ----------
+        datasets_for_f: DFDict
+            Datasets to give to :attr:`f`, as produced by :meth:`get_datasets_for_f`, or a row chunk
+            of the single dataset requested by a row-wise :attr:`f`
+        datasets: DFDict
+            All datasets given to the step, from which :attr:`fit` draws the train dataset if
+            :attr:`fit_state` has not been computed by :meth:`call_in_chunks`
+        expected_rows: Int, or None, default=None
+            If not None, the number of rows :attr:`f` must return for each dataset
+
+        Returns
+        -------
+        Tuple
+            Datasets returned by :attr:`f`, in the same order as :attr:`params`"""
+        if self.fit is not None:
+            if expected_rows is None:
+                self._fit(datasets, None)
+            datasets_for_f = dict(datasets_for_f, fit_state=self.fit_state)
+
+        step_result = self.f(**datasets_for_f)
+        step_result = (step_result,) if not isinstance(step_result, tuple) else step_result
+
+        if len(step_result) == len(self.params) + 1:
+            self.inversion, step_result = step_result[-1], step_result[:-1]
+
+        if expected_rows is not None and any(len(_) != expected_rows for _ in step_result):
+            raise ValueError(f"Row-wise step {self.name!r} must return one row for each row given")
+        return step_result
+
+    def _fit(self, datasets: DFDict, chunk_size: Union[int, None]):
+        """Set :attr:`fit_state` by calling :attr:`fit` on row chunks of the train dataset of the
+        same group ("inputs"/"targets") as :attr:`params`. Does nothing if :attr:`fit` is None"""
+        if self.fit is None:
+            return
+        train_name = "train_{}".format(self.params[0].rsplit("_", 1)[1])
+        self.fit_state = self.fit(iter_row_chunks(datasets[train_name], chunk_size))
+
+    def get_leaf_datasets(self) -> frozenset:
+        """Produce the names of the standard datasets read or modified by this step, after
+        resolving merged datasets in :attr:`params` for :attr:`stage`. If :attr:`fit` is given,
+        the train dataset it reads is included
+
+        Returns
+        -------
+        frozenset
+            Subset of {"train_inputs", "train_targets", "validation_inputs", "validation_targets",
+            "holdout_inputs", "holdout_targets", "test_inputs"}
+
+        Examples
+        --------
+        >>> def impute(all_inputs):
+        ...     return all_inputs
+        >>> sorted(EngineerStep(impute, stage="pre_cv").get_leaf_datasets())
+        ['holdout_inputs', 'test_inputs', 'train_inputs']"""
+        leaves = set(DatasetNameReport(self.params, self.stage).leaves.values())
+        if self.fit is not None:
+            leaves.add("train_{}".format(self.params[0].rsplit("_", 1)[1]))
+        return frozenset(leaves)
+
     def inverse_transform(self, data):
         """Perform the inverse transformation for this engineer step (if it exists)
 
@@ -607,7 +908,7 @@ class EngineerStep:
         -------
         Dict
             Important attributes describing this :class:`EngineerStep` instance"""
-        return dict(
+        key_data = dict(
             name=self.name,
             f=self.f,
             params=self.params,
@@ -616,6 +917,9 @@ class EngineerStep:
             original_hashes=self.original_hashes,
             updated_hashes=self.updated_hashes,
         )
+        if self.fit is not None:
+            key_data["fit"] = self.fit
+        return key_data
 
     ##################################################
     # Properties
@@ -653,15 +957,16 @@ class EngineerStep:
     # Comparison Methods
     ##################################################
     def __hash__(self):
-        return hash((self.name, self.f, self.params, self.stage, self.do_validate))
+        return hash((self.name, self.f, self.params, self.stage, self.do_validate, self.fit))
 
     def __eq__(self, other):
         """Check whether `other` is equal to `self`
 
         The two are considered equal if `other` has the following attributes and their values
-        are equal to those of `self`: :attr:`name`, :attr:`f`, :attr:`params`, :attr:`stage`, and
-        :attr:`do_validate`. The values of all the aforementioned attributes will have been set on
-        initialization (either explicitly or by inference), and they should never be altered
+        are equal to those of `self`: :attr:`name`, :attr:`f`, :attr:`params`, :attr:`stage`,
+        :attr:`do_validate`, and :attr:`fit`. The values of all the aforementioned attributes will
+        have been set on initialization (either explicitly or by inference), and they should never
+        be altered
 
         Parameters
         ----------
@@ -694,6 +999,9 @@ class EngineerStep:
             # If `other_attrs["f"]` is str, should be SHA256 - Use hash of `self.f` to compare
             if isinstance(other_attrs["f"], str):
                 own_attrs["f"] = make_hash_sha256(own_attrs["f"])
+            # Same for `other_attrs["fit"]`, unless `self` has no `fit` to hash
+            if isinstance(other_attrs["fit"], str) and own_attrs["fit"] is not None:
+                own_attrs["fit"] = make_hash_sha256(own_attrs["fit"])
 
             return own_attrs == other_attrs
 
@@ -714,7 +1022,8 @@ class EngineerStep:
             Critical :class:`EngineerStep` attributes. If `step_obj` does not have a necessary
             attribute (for `EngineerStep`) or a necessary key (for dict), its value in `attr_vals`
             will be a placeholder object. This is to facilitate comparison, while also ensuring
-            missing values will always be considered unequal to other values
+            missing values will always be considered unequal to other values. The exception is
+            "fit", which is None if missing, because it is only recorded for steps that have one
 
         Examples
         --------
@@ -726,7 +1035,8 @@ class EngineerStep:
          'f': <function dummy_f at ...>,
          'params': ('train_inputs', 'non_train_inputs'),
          'stage': 'intra_cv',
-         'do_validate': False}
+         'do_validate': False,
+         'fit': None}
         >>> EngineerStep.get_comparison_attrs(
         ...     dict(foo="hello", f=dummy_f, params=["all_inputs", "all_targets"], stage="pre_cv")
         ... )  # doctest: +ELLIPSIS +NORMALIZE_WHITESPACE
@@ -734,14 +1044,17 @@ class EngineerStep:
          'f': <function dummy_f at ...>,
          'params': ('all_inputs', 'all_targets'),
          'stage': 'pre_cv',
-         'do_validate': <object object at ...>}
+         'do_validate': <object object at ...>,
+         'fit': None}
         """
         # Attributes necessary for equality
         attr_names = ("name", "f", "params", "stage", "do_validate")
         if isinstance(step_obj, dict):
             attr_vals = {_: step_obj.get(_, object()) for _ in attr_names}
+            attr_vals["fit"] = step_obj.get("fit", None)
         else:
             attr_vals = {_: getattr(step_obj, _, object()) for _ in attr_names}
+            attr_vals["fit"] = getattr(step_obj, "fit", None)
 
         # Ensure :attr:`params` is always a tuple, not a list
         attr_vals["params"] = tuple(attr_vals["params"])
@@ -755,7 +1068,8 @@ class EngineerStep:
         String
             String describing all critical attributes of the :class:`EngineerStep` instance. This
             value is not particularly human-friendly due to both its length and the fact that
-            :attr:`EngineerStep.f` is represented by its hash
+            :attr:`EngineerStep.f` is represented by its hash. If the step has a :attr:`fit`, its
+            hash is appended
 
         Examples
         --------
@@ -766,13 +1080,15 @@ class EngineerStep:
         >>> EngineerStep(dummy_f, stage="pre_cv").stringify()  # doctest: +ELLIPSIS
         "EngineerStep(dummy_f, ..., ('train_inputs', 'non_train_inputs'), pre_cv, False)"
         """
-        return "{}({}, {}, {}, {}, {})".format(
+        fit = "" if self.fit is None else f", {make_hash_sha256(self.fit)}"
+        return "{}({}, {}, {}, {}, {}{})".format(
             self.__class__.__name__,
             self.name,
             make_hash_sha256(self.f),
             self.params,
             self.stage,
             self.do_validate,
+            fit,
         )
 
     @classmethod
@@ -813,7 +1129,15 @@ class EngineerStep:
 
 
 class FeatureEngineer:
-    def __init__(self, steps=None, do_validate=False, **datasets: DFDict):
+    def __init__(
+        self,
+        steps=None,
+        do_validate=False,
+        chunk_size=None,
+        store_dir=None,
+        n_jobs=1,
+        **datasets: DFDict,
+    ):
         """Class to organize feature engineering step callables `steps` (:class:`EngineerStep`
         instances) and the datasets that the steps request and return.
 
@@ -840,7 +1164,28 @@ class FeatureEngineer:
             hashes of the new datasets will be compared to those of the originals to ensure they
             were actually modified. Results will be logged. If `do_validate` = "strict", an
             exception will be raised if any anomalies are found, rather than logging a message. If
-            `do_validate` = False, no validation will be performed
+            `do_validate` = False, no validation will be performed. If all steps validate, they
+            share a :class:`DatasetHashCache`, so each step only rehashes the datasets it was given
+        chunk_size: Int, or None, default=None
+            If not None, steps declared with `row_wise=True` are executed on chunks of at most
+            `chunk_size` rows of each dataset via :meth:`EngineerStep.call_in_chunks`, and their
+            results are written to a memory-mapped :class:`ColumnStore` in `store_dir`. Other steps
+            are executed normally. This limits the memory used by row-wise steps, and it avoids
+            building merged datasets (like "all_inputs") for them. `chunk_size` does not affect
+            Experiment keys
+        store_dir: String, or None, default=None
+            Directory in which the :class:`ColumnStore` used for row-wise steps saves its files if
+            `chunk_size` is given. If None, a temporary directory is created when first needed
+        n_jobs: Int, default=1
+            Maximum number of threads used to execute independent steps concurrently. Steps are
+            independent if the standard datasets they request (after resolving merged datasets like
+            "all_inputs") are disjoint. See :func:`get_step_waves`. Dependent steps always execute
+            in the order given in `steps`, so results are identical for all values of `n_jobs`. If
+            negative, follows the convention of Scikit-learn's `n_jobs`: -1 means one thread per CPU
+            core, -2 means one fewer, and so on. If the active Environment has a `cpu_budget`, its
+            cores are used instead of all CPU cores, and they are divided between the steps of
+            each wave by limiting their BLAS/OpenMP threads. Steps are always executed sequentially
+            if any of them has `do_validate`. `n_jobs` does not affect Experiment keys
         **datasets: DFDict
             This is not expected to be provided on initialization and is offered primarily for
             debugging/testing. Mapping of datasets necessary to perform feature engineering steps
@@ -909,7 +1254,11 @@ class FeatureEngineer:
         """
         self.steps = []
         self.do_validate = do_validate
+        self.chunk_size = chunk_size
+        self.store_dir = store_dir
+        self.n_jobs = n_jobs
         self.datasets = datasets or {}
+        self._store = None
 
         for step in steps or []:
             self.add_step(step)
@@ -929,9 +1278,53 @@ class FeatureEngineer:
         if datasets:
             self.datasets = datasets
 
-        for i, step in enumerate(self.steps):
-            if step.stage == stage:
-                self.datasets = step(**self.datasets)
+        steps = [_ for _ in self.steps if _.stage == stage]
+        cpu_budget = getattr(G.Env, "cpu_budget", None)
+        n_workers = _resolve_n_jobs(self.n_jobs, cpu_budget)
+
+        # Validation hashes all datasets, so it must not run concurrently with other steps
+        if n_workers == 1 or len(steps) < 2 or any(_.do_validate for _ in steps):
+            # Steps that don't validate could modify datasets without rehashing them, so hashes
+            # are only shared between steps if every step validates
+            hash_cache = DatasetHashCache() if all(_.do_validate for _ in steps) else None
+
+            for step in steps:
+                step.hash_cache = hash_cache
+                try:
+                    self.datasets = self._call_step(step, self.datasets)
+                finally:
+                    step.hash_cache = None
+            return
+
+        if any(_.row_wise for _ in steps) and self.chunk_size:
+            self._get_store()  # Create the store before steps that share it run in parallel
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            for wave in get_step_waves(steps):
+                snapshot = self.datasets
+                with _limit_wave_threads(cpu_budget, min(n_workers, len(wave))):
+                    results = executor.map(lambda _: self._call_step(_, dict(snapshot)), wave)
+                    results = list(results)
+                self.datasets = dict(self.datasets)
+
+                # Steps in `wave` touch disjoint datasets, so updates are made in order of `steps`
+                for step, result in zip(wave, results):
+                    self.datasets.update(
+                        {_: result[_] for _ in step.get_leaf_datasets() if _ in result}
+                    )
+
+    def _call_step(self, step: EngineerStep, datasets: DFDict) -> DFDict:
+        """Helper to execute `step` on `datasets`, in chunks if it is row-wise and
+        :attr:`chunk_size` is given"""
+        if step.row_wise and self.chunk_size:
+            return step.call_in_chunks(self.chunk_size, self._get_store(), **datasets)
+        return step(**datasets)
+
+    def _get_store(self) -> "ColumnStore":
+        """Retrieve the :class:`ColumnStore` used for row-wise steps, creating it if necessary"""
+        if self._store is None:
+            self._store = ColumnStore(self.store_dir)
+        return self._store
 
     def __eq__(self, other: "FeatureEngineer"):
         return (
@@ -1051,6 +1444,317 @@ class FeatureEngineer:
             return EngineerStep(step, name=name, stage=stage, do_validate=self.do_validate)
 
 
+##################################################
+# Step Scheduling Utilities
+##################################################
+def get_step_waves(steps: List[EngineerStep]) -> List[List[EngineerStep]]:
+    """Group `steps` into consecutive waves of independent steps, which can be executed
+    concurrently. Each step is placed in the wave after the last one containing an earlier step
+    that shares any datasets with it, according to :meth:`EngineerStep.get_leaf_datasets`. This
+    is a level ordering of the dependency graph of `steps`, in which a step depends on each earlier
+    step whose datasets it shares
+
+    Parameters
+    ----------
+    steps: List[EngineerStep]
+        Steps of a single stage, in the order in which they would be executed sequentially
+
+    Returns
+    -------
+    List[List[EngineerStep]]
+        Waves of `steps`. Steps within each wave are independent of one another, and in the order
+        in which they appear in `steps`
+
+    Examples
+    --------
+    >>> def impute(all_inputs):
+    ...     return all_inputs
+    >>> def log_targets(train_targets, non_train_targets):
+    ...     return train_targets, non_train_targets
+    >>> def scale(train_inputs, non_train_inputs):
+    ...     return train_inputs, non_train_inputs
+    >>> get_step_waves([
+    ...     EngineerStep(impute, stage="intra_cv"),
+    ...     EngineerStep(log_targets),
+    ...     EngineerStep(scale),
+    ... ])
+    [[EngineerStep(impute), EngineerStep(log_targets)], [EngineerStep(scale)]]"""
+    waves, step_waves = [], []
+
+    for i, step in enumerate(steps):
+        leaves = step.get_leaf_datasets()
+        wave = 1 + max(
+            [step_waves[j] for j in range(i) if leaves & steps[j].get_leaf_datasets()], default=-1
+        )
+        step_waves.append(wave)
+
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(step)
+
+    return waves
+
+
+def _resolve_n_jobs(n_jobs: int, cpu_budget: Optional[CPUBudget] = None) -> int:
+    """Convert `n_jobs` to a positive number of workers, following the convention of Scikit-learn.
+    If `cpu_budget` is given, negative `n_jobs` count back from its cores, rather than from all of
+    the machine's cores, and the number of workers is capped at its cores
+
+    Examples
+    --------
+    >>> _resolve_n_jobs(3)
+    3
+    >>> _resolve_n_jobs(-1, CPUBudget(2))
+    2
+    >>> _resolve_n_jobs(-2, CPUBudget(4))
+    3
+    >>> _resolve_n_jobs(8, CPUBudget(2))
+    2"""
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    n_cores = (os.cpu_count() or 1) if cpu_budget is None else cpu_budget.n_cores
+    if n_jobs < 0:
+        return max(1, n_cores + 1 + n_jobs)
+    return n_jobs if cpu_budget is None else min(n_jobs, n_cores)
+
+
+@contextmanager
+def _limit_wave_threads(cpu_budget: Optional[CPUBudget], n_workers: int):
+    """Context manager to cap the BLAS/OpenMP threads of steps executed concurrently by `n_workers`
+    workers, so they divide the cores of `cpu_budget` between them. Does nothing if `cpu_budget`
+    is None"""
+    if cpu_budget is None:
+        yield
+    else:
+        with cpu_budget.split(n_workers).limit_threads():
+            yield
+
+
+##################################################
+# Chunked Execution Utilities
+##################################################
+def iter_row_chunks(df: pd.DataFrame, chunk_size: Union[int, None]) -> Iterator[pd.DataFrame]:
+    """Yield copies of consecutive row chunks of `df`
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        DataFrame to split into row chunks
+    chunk_size: Int, or None
+        Maximum number of rows in each chunk. If None, `df` itself is yielded as the only chunk
+
+    Yields
+    ------
+    pd.DataFrame
+        Chunk of at most `chunk_size` rows of `df`. If `df` is empty, it is yielded once
+
+    Examples
+    --------
+    >>> df = pd.DataFrame(dict(a=range(5)))
+    >>> [_.index.tolist() for _ in iter_row_chunks(df, 2)]
+    [[0, 1], [2, 3], [4]]
+    >>> [_.index.tolist() for _ in iter_row_chunks(df, None)]
+    [[0, 1, 2, 3, 4]]"""
+    if chunk_size is None:
+        yield df
+        return
+
+    for start in range(0, max(len(df), 1), chunk_size):
+        yield df.iloc[start : start + chunk_size].copy()
+
+
+class ColumnStore:
+    def __init__(self, directory: str = None):
+        """Memory-mapped columnar storage for the datasets produced by row-wise
+        :class:`EngineerStep`s executed in chunks. Each dataset written to the store is saved as a
+        Fortran-ordered (column-major) ".npy" file, which is memory-mapped, so the DataFrame
+        returned by :meth:`write` reads only the rows that are actually used, like those of a fold
+
+        Parameters
+        ----------
+        directory: String, or None, default=None
+            Directory in which files are saved. If None, a temporary directory is created
+
+        Notes
+        -----
+        Only datasets whose columns all share a single numeric dtype can be memory-mapped. Other
+        datasets are concatenated in memory from their chunks. Files are deleted as soon as they are
+        mapped, so their space is freed once the DataFrames reading them are garbage collected (on
+        systems that allow deleting open files)"""
+        self.directory = directory or tempfile.mkdtemp(prefix="hh_column_store_")
+        os.makedirs(self.directory, exist_ok=True)
+
+    def write(self, chunks: Iterable[pd.DataFrame], index: pd.Index) -> pd.DataFrame:
+        """Write `chunks` to a new file in the store, and read them back as a single DataFrame
+
+        Parameters
+        ----------
+        chunks: Iterable[pd.DataFrame]
+            Consecutive row chunks of a dataset with `len(index)` rows. All chunks must have the
+            same columns
+        index: pd.Index
+            Index of the resulting DataFrame
+
+        Returns
+        -------
+        pd.DataFrame
+            Concatenation of `chunks`, indexed by `index`. Memory-mapped if possible
+
+        Examples
+        --------
+        >>> store = ColumnStore()
+        >>> df = pd.DataFrame(dict(a=[0, 1, 2], b=[3, 4, 5]), index=[7, 8, 9])
+        >>> store.write(iter_row_chunks(df * 2, 2), df.index)
+           a   b
+        7  0   6
+        8  2   8
+        9  4  10
+        >>> store.write([df.iloc[:2], df.iloc[2:] / 2], df.index)
+             a    b
+        7  0.0  3.0
+        8  1.0  4.0
+        9  1.0  2.5"""
+        chunks = iter(chunks)
+        first = next(chunks)
+        columns, n_rows = first.columns, len(index)
+        values, start = None, 0
+
+        if _is_mappable(first):
+            values = self._allocate(n_rows, len(columns), first.dtypes.iloc[0])
+        in_memory = [] if values is None else None
+
+        for chunk in chain([first], chunks):
+            if not chunk.columns.equals(columns):
+                raise ValueError(f"Chunk columns {chunk.columns} do not match {columns}")
+
+            if values is not None and not _is_mappable(chunk):
+                # Memory-mapping is impossible - Move rows written so far into memory
+                in_memory = [pd.DataFrame(np.array(values[:start]), columns=columns)]
+                values = None
+            elif values is not None and not np.can_cast(chunk.dtypes.iloc[0], values.dtype):
+                # Upcast the file, like `pd.concat` would
+                dtype = np.result_type(values.dtype, chunk.dtypes.iloc[0])
+                values = self._allocate(n_rows, len(columns), dtype, values[:start])
+
+            if values is not None:
+                values[start : start + len(chunk)] = chunk.values
+            else:
+                in_memory.append(chunk)
+            start += len(chunk)
+
+        if start != n_rows:
+            raise ValueError(f"Chunks contain {start} rows, but {n_rows} were expected")
+
+        if values is None:
+            result = pd.concat(in_memory)
+            result.index = index
+            return result
+        values.flush()
+        return pd.DataFrame(values, index=index, columns=columns, copy=False)
+
+    def _allocate(self, n_rows: int, n_columns: int, dtype, initial_values=None) -> np.memmap:
+        """Create a Fortran-ordered memory-mapped array of shape (`n_rows`, `n_columns`), whose
+        first rows are set to `initial_values` (if given)"""
+        path = os.path.join(self.directory, f"{uuid()}.npy")
+        values = open_memmap(
+            path, mode="w+", dtype=dtype, shape=(n_rows, n_columns), fortran_order=True
+        )
+        with suppress(OSError):
+            os.remove(path)  # Data remains available through `values` until it is unmapped
+
+        if initial_values is not None:
+            values[: len(initial_values)] = initial_values
+        return values
+
+
+def _is_mappable(df: pd.DataFrame) -> bool:
+    """Whether all columns of `df` share a single numeric (or boolean) dtype"""
+    dtypes = set(df.dtypes)
+    if len(dtypes) != 1:
+        return False
+    dtype = dtypes.pop()
+    return isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+
+
+##################################################
+# Copy-on-Write Utilities
+##################################################
+def read_only_view(df: pd.DataFrame) -> pd.DataFrame:
+    """Create a new DataFrame that shares the data of `df`, but can't be used to modify it. If
+    pandas' copy-on-write mode is enabled, a shallow copy of `df` already behaves this way.
+    Otherwise, the arrays holding each column of the new DataFrame are views of those of `df`,
+    flagged as not writeable, so in-place modifications raise a `ValueError`. Columns that aren't
+    held in NumPy arrays (like categoricals) can't be flagged, so they are copied
+
+    Parameters
+    ----------
+    df: pd.DataFrame, or None
+        DataFrame to view. If not a DataFrame, it is returned unchanged
+
+    Returns
+    -------
+    pd.DataFrame, or None
+        Read-only view of `df`. Changes to the DataFrame itself, like adding columns, don't affect
+        `df`, but changing its values raises a `ValueError`
+
+    Examples
+    --------
+    >>> df = pd.DataFrame(dict(a=[0.0, 1.0], b=[2.0, 3.0]))
+    >>> view = read_only_view(df)
+    >>> is_read_only(view), is_read_only(df)
+    (True, False)
+    >>> view.iloc[0, 0] = 9.0
+    Traceback (most recent call last):
+        ...
+    ValueError: assignment destination is read-only
+    >>> view["c"] = [4.0, 5.0]
+    >>> list(view.columns), list(df.columns)
+    (['a', 'b', 'c'], ['a', 'b'])"""
+    if not isinstance(df, pd.DataFrame):
+        return df
+
+    view = df.copy(deep=False)
+    if _copy_on_write_enabled():
+        return view
+
+    for block in _get_blocks(view):
+        if isinstance(block.values, np.ndarray):
+            block.values = block.values.view()
+            block.values.flags.writeable = False
+        else:
+            block.values = block.values.copy()
+    return view
+
+
+def is_read_only(df: pd.DataFrame) -> bool:
+    """Whether any column of `df` is held in a NumPy array that is not writeable
+
+    Examples
+    --------
+    >>> df = pd.DataFrame(dict(a=[0, 1]))
+    >>> is_read_only(df), is_read_only(read_only_view(df)), is_read_only(None)
+    (False, True, False)"""
+    if not isinstance(df, pd.DataFrame):
+        return False
+    return any(
+        isinstance(_.values, np.ndarray) and not _.values.flags.writeable for _ in _get_blocks(df)
+    )
+
+
+def _get_blocks(df: pd.DataFrame) -> tuple:
+    """Retrieve the blocks of the block manager holding the columns of `df`"""
+    manager = getattr(df, "_mgr", None)
+    return (df._data if manager is None else manager).blocks
+
+
+def _copy_on_write_enabled() -> bool:
+    """Whether pandas' copy-on-write mode is available and enabled"""
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:
+        return False
+
+
 # FLAG: Tally number of columns "transformed" and "added" at each step and report
 
 
@@ -1165,7 +1869,12 @@ def get_engineering_step_params(f: callable) -> Tuple[str]:
     >>> get_engineering_step_params(error_invalid_dataset)
     Traceback (most recent call last):
         File "feature_engineering.py", line ?, in get_engineering_step_params
-    ValueError: Invalid dataset name: 'foo'"""
+    ValueError: Invalid dataset name: 'foo'
+    >>> def scale_fitted(all_inputs, fit_state):
+    ...     all_inputs = all_inputs - fit_state
+    ...     return all_inputs
+    >>> get_engineering_step_params(scale_fitted)
+    ('all_inputs',)"""
     valid_datasets = MERGED_DATASET_NAMES + STANDARD_DATASET_NAMES
     source_code = getsource(f)
     tree = ast.parse(source_code)
@@ -1178,6 +1887,7 @@ def get_engineering_step_params(f: callable) -> Tuple[str]:
     #################### Collect Parameters and Returns ####################
     parser = ParameterParser()
     parser.visit(tree)
+    parser.args = [_ for _ in parser.args if _ != "fit_state"]  # Given by `EngineerStep.fit`
 
     for name in parser.args:
         if name not in valid_datasets:
@@ -1191,8 +1901,40 @@ def get_engineering_step_params(f: callable) -> Tuple[str]:
     return tuple(parser.args)
 
 
+def _hash_column(column: pd.Series) -> str:
+    """Generate a hash for the values and index of `column` in a single vectorized pass. Columns
+    whose values can't be hashed by :func:`pandas.util.hash_pandas_object` (like lists), and sparse
+    columns, are hashed via :func:`~hyperparameter_hunter.keys.hashing.make_hash_sha256`
+
+    Parameters
+    ----------
+    column: pandas.Series
+        Column of a DataFrame to hash
+
+    Returns
+    -------
+    Str
+        URL-safe base64-encoded sha256 hash of `column`
+
+    Examples
+    --------
+    >>> _hash_column(pd.Series([0, 1])) == _hash_column(pd.Series([0, 1]))
+    True
+    >>> _hash_column(pd.Series([0, 1])) == _hash_column(pd.Series([0, 1], index=[1, 2]))
+    False"""
+    if isinstance(column.dtype, pd.SparseDtype):
+        return make_hash_sha256(column.to_frame())
+
+    try:
+        row_hashes = pd.util.hash_pandas_object(column, index=True).values
+    except TypeError:
+        return make_hash_sha256(column)
+    return base64.urlsafe_b64encode(hashlib.sha256(row_hashes.tobytes()).digest()).decode()
+
+
 def _hash_dataset(dataset: pd.DataFrame) -> dict:
-    """Generate hashes for `dataset` at various levels of specificity
+    """Generate hashes for `dataset` at various levels of specificity. Each column is hashed once
+    via :func:`_hash_column`, and the hash of `dataset` is made from those of its columns
 
     Parameters
     ----------
@@ -1209,23 +1951,27 @@ def _hash_dataset(dataset: pd.DataFrame) -> dict:
     Examples
     --------
     >>> _hash_dataset(pd.DataFrame(dict(a=[0, 1], b=[2, 3])))  # doctest: +NORMALIZE_WHITESPACE
-    {'dataset': 't0rdT14SDIH-CVm-dce1Hlsr2oM7q6pss_GpV3rJ6bw=',
+    {'dataset': 'hUs-2_sSkLkTVflMwmDkvnJSTGwonXviSNOz4uMgtZA=',
      'column_names': 't2r52T-rdDqIDs75-83buoieqk0KyHEpRJMJAAzfzb4=',
-     'column_values': {'a': 'buQ0yuUUbLN57tC6050g7yWrvAdk-NwGIEEWHJC88EY=',
-                       'b': 'j9nBFZVu4ZEnsoaRYiI93DcrbV3A_hzcKdf0P5gS7g4='}}
+     'column_values': {'a': '7iF_tV5kQsn7pLyv2qMDf6H3l5TWoWvmr_I5SMSMHGY=',
+                       'b': '_wIi4UrDlg5gvKpAhSZbWD8nkZH6mspdk7rDmAcTyTU='}}
     >>> _hash_dataset(pd.DataFrame(dict(x=[0, 1], b=[6, 7])))  # doctest: +NORMALIZE_WHITESPACE
-    {'dataset': 'TNLSddRnWVfoytkhHrSNWXqVW2TV7cHKht8MMLWcbhY=',
+    {'dataset': 'F7hwZUW11xdNdO3Rdb-5gCXkAwGKtTOcikjzLx_M7bg=',
      'column_names': '9l1vTGGIxfuA4rJZ-ePalM-9Q5D0BfLp5bogE0U-oYQ=',
-     'column_values': {'x': 'l2dZ6AeGRuHH97J0qb8I1H-pwK-ubHqElDqFIuKAbIw=',
-                       'b': 'uIvA32AuBuj9LTU652UQUBI0VH9UmF2ZJeL4NefiiLg='}}
+     'column_values': {'x': '7iF_tV5kQsn7pLyv2qMDf6H3l5TWoWvmr_I5SMSMHGY=',
+                       'b': '2eSNJPpq3EFkFqGxn9KlrO5DKObYryYY9GYjqGroZR0='}}
     >>> _hash_dataset(None)
     {'dataset': None, 'column_names': None, 'column_values': None}"""
     if (not isinstance(dataset, pd.DataFrame)) and (dataset is None or dataset == 0):
         return dict(dataset=None, column_names=None, column_values=None)
+
+    column_names = make_hash_sha256(dataset.columns)
+    column_hashes = [_hash_column(column) for _, column in dataset.items()]
+    index_hash = hashlib.sha256(pd.util.hash_pandas_object(dataset.index).values.tobytes())
     return dict(
-        dataset=make_hash_sha256(dataset),
-        column_names=make_hash_sha256(dataset.columns),
-        column_values={_: make_hash_sha256(dataset[_]) for _ in dataset.columns},
+        dataset=make_hash_sha256((column_names, index_hash.hexdigest(), column_hashes)),
+        column_names=column_names,
+        column_values=dict(zip(dataset.columns, column_hashes)),
     )
 
 
@@ -1253,6 +1999,69 @@ def hash_datasets(datasets: dict) -> dict:
     return hashes
 
 
+class DatasetHashCache(object):
+    def __init__(self):
+        """Cache of the hashes made by :func:`_hash_dataset`, so consecutive validated
+        :class:`EngineerStep`s only rehash the datasets they may have modified. Entries are keyed
+        by the identity of each DataFrame, and hold only weak references to them, so replaced
+        datasets are not kept alive by the cache
+
+        Notes
+        -----
+        Identity can't reveal in-place modifications, like `train_inputs[columns] = values`, so
+        the datasets given to a step must always be rehashed after it is called. Datasets that
+        the step was not given keep their identities, and their cached hashes are reused. For this
+        reason, a cache should only live for a single call of :class:`FeatureEngineer`, during
+        which the datasets are only modified by its steps
+
+        Examples
+        --------
+        >>> df_x, df_y = pd.DataFrame(dict(a=[0, 1])), pd.DataFrame(dict(b=[2, 3]))
+        >>> cache = DatasetHashCache()
+        >>> hashes = cache.hash_datasets(dict(x=df_x, y=df_y))
+        >>> hashes == hash_datasets(dict(x=df_x, y=df_y))
+        True
+        >>> df_x["a"] = [4, 5]  # In-place modification keeps the identity of `df_x`
+        >>> cache.hash_datasets(dict(x=df_x, y=df_y), modified=[])["x"] == hashes["x"]
+        True
+        >>> cache.hash_datasets(dict(x=df_x, y=df_y), modified=["x"])["x"] == hashes["x"]
+        False"""
+        self.entries = dict()
+
+    def hash_datasets(self, datasets: dict, modified: Iterable[str] = None) -> dict:
+        """Describe `datasets` with dicts of hashes, like :func:`hash_datasets`, reusing the cached
+        hashes of datasets that are not `modified`
+
+        Parameters
+        ----------
+        datasets: Dict
+            Mapping of dataset names to `pandas.DataFrame` instances
+        modified: Iterable[str], or None, default=None
+            Names of the datasets in `datasets` that may have been modified in place since they
+            were last hashed, which are always rehashed. If None, all datasets are rehashed
+
+        Returns
+        -------
+        hashes: Dict
+            Mapping with same keys as `datasets`, whose values are dicts of hashes produced by
+            :func:`_hash_dataset`"""
+        modified = set(datasets) if modified is None else set(modified)
+        hashes = dict()
+
+        for name, dataset in datasets.items():
+            if not isinstance(dataset, pd.DataFrame):
+                hashes[name] = _hash_dataset(dataset)
+                continue
+
+            ref, dataset_hashes = self.entries.get(id(dataset), (None, None))
+            if name in modified or ref is None or ref() is not dataset:
+                dataset_hashes = _hash_dataset(dataset)
+                self.entries[id(dataset)] = (weakref.ref(dataset), dataset_hashes)
+            hashes[name] = dataset_hashes
+
+        return hashes
+
+
 # def _compare_hash_(columns_a: dict, columns_b: dict):
 #     """
 #
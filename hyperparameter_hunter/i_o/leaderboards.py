@@ -103,6 +103,16 @@ class GlobalLeaderboard(Leaderboard):
         entry_columns.extend(evaluation_columns)
         entry_data.extend(evaluation_values)
 
+        # Add peak memory usage, if recorded by `AggregatorMemory`
+        for kind, memory in experiment.stat_aggregates.get("memory", {}).items():
+            entry_columns.append(f"peak_{kind}_mib")
+            entry_data.append(memory["final"])
+
+        # Add the framework's share of the Experiment's time, as reported by its `StageTimer`
+        if "overhead" in experiment.stat_aggregates:
+            entry_columns.append("framework_fraction")
+            entry_data.append(experiment.stat_aggregates["overhead"]["framework_fraction"])
+
         identifier_cols = [
             "experiment_id",
             "hyperparameter_key",
@@ -14,6 +14,7 @@ from hyperparameter_hunter.i_o.exceptions import EnvironmentInactiveError, Envir
 from hyperparameter_hunter.i_o.leaderboards import GlobalLeaderboard
 from hyperparameter_hunter.settings import G
 from hyperparameter_hunter.utils.file_utils import write_json, add_to_json, make_dirs, read_json
+from hyperparameter_hunter.utils.boltons_utils import remap
 from hyperparameter_hunter.utils.file_utils import RetryMakeDirs
 from hyperparameter_hunter.utils.general_utils import subdict
 
@@ -22,8 +23,8 @@ from hyperparameter_hunter.utils.general_utils import subdict
 ##################################################
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
+import numpy as np
 from platform import node
-import shutil
 from sys import exc_info
 
 
@@ -133,6 +134,7 @@ class RecorderList(object):
             PredictionsOOFRecorder,
             PredictionsHoldoutRecorder,
             PredictionsTestRecorder,
+            CallbackProfileRecorder,
             HeartbeatRecorder,
         ]
 
@@ -176,7 +178,8 @@ class RecorderList(object):
         learning), while extra results like Predictions are not saved"""
         for recorder in self.recorders:
             G.log(f"Saving result file for '{type(recorder).__name__}'", 4)
-            exit_code = recorder.save_result()
+            with G.tracer.span("save_result", recorder=type(recorder).__name__):
+                exit_code = recorder.save_result()
 
             if exit_code and exit_code == "break":
                 break
@@ -220,7 +223,7 @@ class DescriptionRecorder(BaseRecorder):
                 ("platform", node()),
                 ("source_script", self.source_script),
                 ("notes", self.notes or ""),
-                ("aggregates", self.stat_aggregates),
+                ("aggregates", _aggregates_to_lists(self.stat_aggregates)),
             ]
         )
 
@@ -251,12 +254,31 @@ class DescriptionRecorder(BaseRecorder):
             return "break"
 
 
+def _aggregates_to_lists(stat_aggregates: dict) -> dict:
+    """Copy `stat_aggregates`, converting its arrays (like the evaluations of
+    :class:`~hyperparameter_hunter.callbacks.aggregators.AggregatorEvaluations`) to nested lists
+
+    Examples
+    --------
+    >>> aggregates = {"evaluations": {"oof_f1": {"folds": np.array([[0.5, 0.75]]), "final": 0.6}}}
+    >>> _aggregates_to_lists(aggregates)
+    {'evaluations': {'oof_f1': {'folds': [[0.5, 0.75]], 'final': 0.6}}}
+    >>> type(aggregates["evaluations"]["oof_f1"]["folds"])
+    <class 'numpy.ndarray'>"""
+    return remap(
+        stat_aggregates,
+        visit=lambda path, key, value: (key, value.tolist())
+        if isinstance(value, np.ndarray)
+        else True,
+    )
+
+
 ##################################################
 # Heartbeat
 ##################################################
 class HeartbeatRecorder(BaseRecorder):
     result_path_key = "heartbeat"
-    required_attributes = ["experiment_id"]
+    required_attributes = ["experiment_id", "heartbeat_buffer"]
 
     def format_result(self):
         """Do nothing"""
@@ -264,10 +286,9 @@ class HeartbeatRecorder(BaseRecorder):
 
     @RetryMakeDirs()
     def save_result(self):
-        """Copy global Heartbeat log to results dir as .log file named for :attr:`experiment_id`"""
-        shutil.copyfile(
-            G.Env.result_paths["current_heartbeat"], f"{self.result_path}/{self.experiment_id}.log"
-        )
+        """Save the heartbeat messages collected by :attr:`heartbeat_buffer` to results dir as .log
+        file named for :attr:`experiment_id`"""
+        self.heartbeat_buffer.save(f"{self.result_path}/{self.experiment_id}.log")
 
 
 ##################################################
@@ -341,6 +362,25 @@ class PredictionsTestRecorder(BaseRecorder):
 #     required_attributes = ['final_in_fold_predictions', 'train_dataset'] + prediction_requirements
 
 
+##################################################
+# Callback Profiles
+##################################################
+class CallbackProfileRecorder(BaseRecorder):
+    result_path_key = "callback_profile"
+    required_attributes = ["experiment_id", "callback_profiler"]
+
+    def format_result(self):
+        """Format the Chrome trace of the Experiment's :attr:`callback_profiler`, if it has one"""
+        if self.callback_profiler is not None:
+            self.result = self.callback_profiler.to_chrome_trace()
+
+    @RetryMakeDirs()
+    def save_result(self):
+        """Save the Chrome trace to a .json file, named after :attr:`experiment_id`"""
+        if self.result is not None:
+            write_json(f"{self.result_path}/{self.experiment_id}.json", self.result)
+
+
 ##################################################
 # Keys (Cross-Experiment, Hyperparameter), and IDs
 ##################################################
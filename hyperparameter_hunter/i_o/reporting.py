@@ -12,9 +12,15 @@ from hyperparameter_hunter.utils.general_utils import now_time, expand_mins_secs
 from contextlib import suppress
 from datetime import datetime
 import inspect
+import json
 import logging
+import logging.handlers
+from math import isfinite
+from numbers import Integral, Real
+import os
 import os.path
 import sys
+from time import time
 from typing import List
 
 
@@ -26,6 +32,7 @@ class ReportingHandler(object):
         console_params=None,
         heartbeat_params=None,
         add_frame=False,
+        buffer_heartbeat=False,
     ):
         """Class in control of logging methods, log formatting, and initializing Experiment logging
 
@@ -42,13 +49,37 @@ class ReportingHandler(object):
             Parameters passed to :meth:`_configure_heartbeat_handler`
         add_frame: Boolean, default=False
             If True, whenever :meth:`log` is called, the source of the call will be prepended to
-            the content being logged"""
+            the content being logged
+        buffer_heartbeat: Boolean, default=False
+            If True, and `heartbeat_path` is given, messages added to the heartbeat file are also
+            collected by :attr:`heartbeat_buffer`, so the heartbeat of the current Experiment can be
+            saved on its own
+
+        Attributes
+        ----------
+        heartbeat_buffer: :class:`HeartbeatBuffer`, or None
+            Handler collecting the heartbeat messages logged since this `ReportingHandler` was
+            initialized. None unless `buffer_heartbeat` is True and `heartbeat_path` is given
+
+        Notes
+        -----
+        Each logging method checks whether its message would be emitted by any handler before doing
+        any work. Messages that are expensive to build can therefore be given lazily, either as a
+        callable that returns the message, or as a `%`-style format string with its `args`. They
+        are only formatted if they will actually be emitted. See :func:`render_content`
+
+        Examples
+        --------
+        >>> G.debug(lambda: f"Parameters: {expensive_repr()}")  # doctest: +SKIP
+        >>> G.log("Fold %d score: %.5f", args=(fold, score))  # doctest: +SKIP"""
         self.reporting_type = "logging"  # TODO: Add `reporting_type` kwarg (logging, advanced)
         self.heartbeat_path = heartbeat_path
         self.float_format = float_format
         self.console_params = console_params or {}
         self.heartbeat_params = heartbeat_params or {}
         self.add_frame = add_frame
+        self.buffer_heartbeat = buffer_heartbeat
+        self.heartbeat_buffer = None
 
         self._validate_parameters()
         self._configure_reporting_type()
@@ -110,7 +141,9 @@ class ReportingHandler(object):
         """Initialize and configure logging to be handled by the `logging` library"""
         #################### Clear Logging Configuration ####################
         root = logging.getLogger()
-        list(map(root.removeHandler, root.handlers[:]))
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
         list(map(root.removeFilter, root.filters[:]))
 
         #################### Configure Logging ####################
@@ -125,6 +158,12 @@ class ReportingHandler(object):
         with suppress(FileExistsError):
             handlers.append(self._configure_heartbeat_handler(**self.heartbeat_params))
 
+            if self.buffer_heartbeat is True:
+                self.heartbeat_buffer = HeartbeatBuffer()
+                self.heartbeat_buffer.setLevel(handlers[-1].level)
+                self.heartbeat_buffer.setFormatter(handlers[-1].formatter)
+                handlers.append(self.heartbeat_buffer)
+
         logging.basicConfig(handlers=handlers, level=logging.DEBUG)
         self.debug("Logging Logging has been initialized!")
 
@@ -161,9 +200,18 @@ class ReportingHandler(object):
 
     # noinspection PyUnusedLocal
     def _configure_heartbeat_handler(
-        self, level="DEBUG", fmt=None, datefmt=None, style="%", **kwargs
+        self,
+        level="DEBUG",
+        fmt=None,
+        datefmt=None,
+        style="%",
+        max_bytes=10 * 1024 ** 2,
+        backup_count=3,
+        **kwargs,
     ):
-        """Configure the file handler in charge of adding log messages to the heartbeat file
+        """Configure the file handler in charge of adding log messages to the heartbeat file. The
+        heartbeat file is appended to for the lifetime of the results directory, and it is rotated
+        once it reaches `max_bytes`
 
         Parameters
         ----------
@@ -178,17 +226,25 @@ class ReportingHandler(object):
             :meth:`logging.Formatter.__init__`
         style: String, default='%'
             Type of string formatting used. Passed to :meth:`logging.Formatter.__init__`
+        max_bytes: Int, default=10485760 (10 MiB)
+            Size at which the heartbeat file is rotated. If 0, it is never rotated. Passed to
+            :class:`logging.handlers.RotatingFileHandler` as `maxBytes`
+        backup_count: Int, default=3
+            Number of rotated heartbeat files to keep, as "Heartbeat.log.1", "Heartbeat.log.2", and
+            so on. Passed to :class:`logging.handlers.RotatingFileHandler` as `backupCount`
         **kwargs: Dict
             Extra keyword arguments
 
         Returns
         -------
-        file_handler: `logging.FileHandler` instance
+        file_handler: `logging.handlers.RotatingFileHandler` instance
             The instantiated handler for the heartbeat file"""
         if self.heartbeat_path is None:
             raise FileExistsError
 
-        file_handler = logging.FileHandler(self.heartbeat_path, mode="w")
+        file_handler = logging.handlers.RotatingFileHandler(
+            self.heartbeat_path, maxBytes=max_bytes, backupCount=backup_count
+        )
         file_handler.setLevel(level)
 
         fmt = fmt or "<%(asctime)s> %(levelname)-8s - %(message)s"
@@ -211,16 +267,42 @@ class ReportingHandler(object):
     ##################################################
     # Logging-Logging Methods:
     ##################################################
+    @staticmethod
+    def _will_emit(level: int) -> bool:
+        """Determine whether a message logged on `level` would be emitted by any of the root
+        logger's handlers. If the root logger has no handlers, the message is assumed to be emitted
+        by the handler that `logging` configures by default
+
+        Parameters
+        ----------
+        level: Int
+            `logging` level of the message, like `logging.DEBUG`
+
+        Returns
+        -------
+        Boolean
+            True if the message would be emitted, else False"""
+        root = logging.root
+        if not root.isEnabledFor(level):
+            return False
+        return (not root.handlers) or any(level >= _.level for _ in root.handlers)
+
     # noinspection PyUnusedLocal
     def _logging_log(
-        self, content, verbose_threshold=None, previous_frame=None, add_time=False, **kwargs
+        self,
+        content,
+        verbose_threshold=None,
+        previous_frame=None,
+        add_time=False,
+        args=None,
+        **kwargs,
     ):
         """Log an info message via the `logging` library
 
         Parameters
         ----------
-        content: String
-            The message to log
+        content: String, or callable
+            The message to log, or a callable that returns it. See :func:`render_content`
         verbose_threshold: Int, or None, default=None
             If None, `content` logged normally. If int and `G.Env.verbose` >= `verbose_threshold`,
             `content` is logged normally. Else if int and `G.Env.verbose` < `verbose_threshold`,
@@ -229,8 +311,20 @@ class ReportingHandler(object):
             The frame preceding the log call. If not provided, it will be inferred
         add_time: Boolean, default=False
             If True, the current time will be added to `content` before logging
+        args: Tuple, dict, or None, default=None
+            If given, `content` is a `%`-style format string, which is formatted with `args`
         **kwargs: Dict
             Extra keyword arguments"""
+        if (verbose_threshold is None) or (G.Env.verbose >= verbose_threshold):
+            level = logging.INFO
+        else:
+            level = logging.DEBUG
+
+        if not self._will_emit(level):
+            return
+
+        content = render_content(content, args)
+
         if self.add_frame is True:
             previous_frame = previous_frame or inspect.currentframe().f_back
             try:
@@ -240,26 +334,29 @@ class ReportingHandler(object):
             content = f"{frame_source} - {content}"
 
         content = add_time_to_content(content, add_time=add_time)
-
-        if (verbose_threshold is None) or (G.Env.verbose >= verbose_threshold):
-            logging.info(content)
-        else:
-            logging.debug(content)
+        logging.log(level, content)
 
     # noinspection PyUnusedLocal
-    def _logging_debug(self, content, previous_frame=None, add_time=False, **kwargs):
+    def _logging_debug(self, content, previous_frame=None, add_time=False, args=None, **kwargs):
         """Log a debug message via the `logging` library
 
         Parameters
         ----------
-        content: String
-            The message to log
+        content: String, or callable
+            The message to log, or a callable that returns it. See :func:`render_content`
         previous_frame: Frame, or None, default=None
             The frame preceding the debug call. If not provided, it will be inferred
         add_time: Boolean, default=False
             If True, the current time will be added to `content` before logging
+        args: Tuple, dict, or None, default=None
+            If given, `content` is a `%`-style format string, which is formatted with `args`
         **kwargs: Dict
             Extra keyword arguments"""
+        if not self._will_emit(logging.DEBUG):
+            return
+
+        content = render_content(content, args)
+
         if self.add_frame is True:
             previous_frame = previous_frame or inspect.currentframe().f_back
             try:
@@ -272,15 +369,22 @@ class ReportingHandler(object):
         logging.debug(content)
 
     # noinspection PyUnusedLocal
-    def _logging_warn(self, content, **kwargs):
+    def _logging_warn(self, content, args=None, **kwargs):
         """Log a warning message via the `logging` library
 
         Parameters
         ----------
-        content: String
-            The message to log
+        content: String, or callable
+            The message to log, or a callable that returns it. See :func:`render_content`
+        args: Tuple, dict, or None, default=None
+            If given, `content` is a `%`-style format string, which is formatted with `args`
         **kwargs: Dict
             Extra keyword arguments"""
+        if not self._will_emit(logging.WARNING):
+            return
+
+        content = render_content(content, args)
+
         if self.add_frame is True:
             previous_frame = inspect.currentframe().f_back
             try:
@@ -292,6 +396,62 @@ class ReportingHandler(object):
         logging.warning(content)
 
 
+class HeartbeatBuffer(logging.Handler):
+    def __init__(self):
+        """Handler that collects formatted log messages in memory, so the heartbeat of a single
+        Experiment can be saved with one write, rather than by copying the global heartbeat file
+
+        Examples
+        --------
+        >>> buffer = HeartbeatBuffer()
+        >>> buffer.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+        >>> buffer.emit(logging.makeLogRecord(dict(msg="Fold %d", args=(3,), levelname="INFO")))
+        >>> buffer.getvalue()
+        'INFO - Fold 3\\n'"""
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        """Format and collect `record`"""
+        try:
+            self.messages.append(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+    def getvalue(self) -> str:
+        """Get all of the collected messages, each ending with a newline
+
+        Returns
+        -------
+        String
+            Collected messages"""
+        return "".join(self.messages)
+
+    def save(self, path: str):
+        """Write the collected messages to the file at `path`, then stop collecting messages by
+        detaching from the root logger
+
+        Parameters
+        ----------
+        path: String
+            Path of the file to which the collected messages are written"""
+        with open(path, "w") as f:
+            f.write(self.getvalue())
+
+        self.detach()
+
+    def detach(self):
+        """Stop collecting messages by detaching from the root logger, and discard the collected
+        messages. Safe to call after :meth:`save`, or if the handler was never attached"""
+        logging.getLogger().removeHandler(self)
+        self.close()
+
+    def close(self):
+        """Discard the collected messages, and close the handler"""
+        self.messages = []
+        super().close()
+
+
 class _Color:
     """Object defining color codes for use with logging"""
 
@@ -348,7 +508,16 @@ def get_param_column_sizes(space: list, names: List[str]) -> List[int]:
 
 
 class OptimizationReporter:
-    def __init__(self, space: list, verbose=1, show_experiment_id=8, do_maximize=True):
+    def __init__(
+        self,
+        space: list,
+        verbose=1,
+        show_experiment_id=8,
+        do_maximize=True,
+        events_path=None,
+        textfile_path=None,
+        progress_labels=None,
+    ):
         """A MixIn class for reporting the results of hyperparameter optimization rounds
 
         Parameters
@@ -364,7 +533,22 @@ class OptimizationReporter:
             printed in each row
         do_maximize: Boolean, default=True
             If False, smaller metric values will be considered preferred and will be highlighted to
-            stand out. Else larger metric values will be treated as preferred"""
+            stand out. Else larger metric values will be treated as preferred
+        events_path: String, or None, default=None
+            If given, an event describing each result is appended to this file as a line of JSON,
+            regardless of `verbose`. See :class:`ProgressExporter`
+        textfile_path: String, or None, default=None
+            If given, this file is atomically rewritten with Prometheus metrics of the progress of
+            optimization after each result, for the textfile collector of the Prometheus node
+            exporter. The file name should end with ".prom". See :class:`ProgressExporter`
+        progress_labels: Dict, or None, default=None
+            Labels added to each metric in `textfile_path`, like `dict(job="my_search")`, to tell
+            apart the metrics of concurrent optimizations
+
+        Attributes
+        ----------
+        progress_exporter: :class:`ProgressExporter`, or None
+            Exporter of the results reported, if `events_path` or `textfile_path` is given"""
         self.original_parameter_names = [_.name for _ in space]
         self.verbose = verbose
         self.show_experiment_id = (
@@ -386,13 +570,20 @@ class OptimizationReporter:
             range(len(self.parameter_names)), key=self.parameter_names.__getitem__
         )
 
+        self.stage = "optimization"
+        self.progress_exporter = None
+        if events_path is not None or textfile_path is not None:
+            self.progress_exporter = ProgressExporter(events_path, textfile_path, progress_labels)
+
     def print_saved_results_header(self):
         """Print a header signifying that saved Experiment results are being read"""
+        self.stage = "saved_results"
         header = f"{_Color.RED}Saved Results{_Color.STOP}"
         self.print_header(header, (_Color.RED + "_" * self._line_len() + _Color.STOP))
 
     def print_optimization_header(self):
         """Print a header signifying that Optimization rounds are starting"""
+        self.stage = "optimization"
         header = f"{_Color.RED}Hyperparameter Optimization{_Color.STOP}"
         self.print_header(header, (_Color.RED + "_" * self._line_len() + _Color.STOP))
 
@@ -452,8 +643,17 @@ class OptimizationReporter:
             The number of characters that `value` should span"""
         print("{0:>{1}}".format(value, size), end=self.end)
 
-    def print_result(self, hyperparameters, evaluation, experiment_id=None):
-        """Print a row containing the results of an Experiment just executed
+    def print_result(
+        self,
+        hyperparameters,
+        evaluation,
+        experiment_id=None,
+        experiment_duration=None,
+        skipped_iterations=0,
+        surrogate_fit_time=None,
+    ):
+        """Print a row containing the results of an Experiment just executed, and export it via
+        :attr:`progress_exporter`, if there is one
 
         Parameters
         ----------
@@ -462,36 +662,66 @@ class OptimizationReporter:
         evaluation: Float
             An evaluation of the performance of `hyperparameters`
         experiment_id: Str, or None, default=None
-            If not None, should be a string that is the UUID of the Experiment"""
-        if not self.verbose:
-            return
-        print("{:>3d}".format(self.iteration), end=self.end)
+            If not None, should be a string that is the UUID of the Experiment
+        experiment_duration: Float, or None, default=None
+            Seconds spent by the Experiment itself. Only exported
+        skipped_iterations: Int, default=0
+            Number of iterations skipped so far because their Experiments were repeats. Only
+            exported
+        surrogate_fit_time: Float, or None, default=None
+            Seconds spent fitting the OptPro's surrogate model with `evaluation`. Only exported"""
+        round_duration = (datetime.now() - self.last_round).total_seconds()
+        is_best = (
+            (self.y_max is None)  # First evaluation
+            or (self.do_maximize and self.y_max < evaluation)  # Found new max (best)
+            or (not self.do_maximize and self.y_max > evaluation)  # Found new min (best)
+        )
 
-        #################### Experiment ID ####################
-        if self.show_experiment_id:
-            if experiment_id is not None:
-                print("{}".format(experiment_id[: self.show_experiment_id]), end=self.end)
+        if self.verbose:
+            print("{:>3d}".format(self.iteration), end=self.end)
+
+            #################### Experiment ID ####################
+            if self.show_experiment_id:
+                if experiment_id is not None:
+                    print("{}".format(experiment_id[: self.show_experiment_id]), end=self.end)
+                else:
+                    print(" " * self.show_experiment_id, end=self.end)
+
+            #################### Time Elapsed ####################
+            print(expand_mins_secs(*divmod(round_duration, 60)), end=self.end)
+
+            #################### Evaluation Result ####################
+            if is_best:
+                self._print_target_value(evaluation, pre=_Color.MAGENTA, post=_Color.STOP)
+                self._print_input_values(hyperparameters, pre=_Color.GREEN, post=_Color.STOP)
             else:
-                print(" " * self.show_experiment_id, end=self.end)
+                self._print_target_value(evaluation)
+                self._print_input_values(hyperparameters)
 
-        #################### Time Elapsed ####################
-        minutes, seconds = divmod((datetime.now() - self.last_round).total_seconds(), 60)
-        print(expand_mins_secs(minutes, seconds), end=self.end)
+            print("")
 
-        #################### Evaluation Result ####################
-        if (
-            (self.y_max is None)  # First evaluation
-            or (self.do_maximize and self.y_max < evaluation)  # Found new max (best)
-            or (not self.do_maximize and self.y_max > evaluation)  # Found new min (best)
-        ):
+        if is_best:
             self.y_max, self.x_max = evaluation, hyperparameters
-            self._print_target_value(evaluation, pre=_Color.MAGENTA, post=_Color.STOP)
-            self._print_input_values(hyperparameters, pre=_Color.GREEN, post=_Color.STOP)
-        else:
-            self._print_target_value(evaluation)
-            self._print_input_values(hyperparameters)
 
-        print("")
+        #################### Export Progress ####################
+        if self.progress_exporter is not None:
+            self.progress_exporter.export(
+                dict(
+                    timestamp=time(),
+                    stage=self.stage,
+                    iteration=self.iteration,
+                    experiment_id=experiment_id,
+                    score=evaluation,
+                    best_score=self.y_max,
+                    is_best=is_best,
+                    round_duration=round_duration,
+                    experiment_duration=experiment_duration,
+                    skipped_iterations=skipped_iterations,
+                    surrogate_fit_time=surrogate_fit_time,
+                    elapsed=(datetime.now() - self.start_time).total_seconds(),
+                )
+            )
+
         self.last_round = datetime.now()
         self.iteration += 1
 
@@ -547,8 +777,244 @@ class OptimizationReporter:
         # TODO: Do this
 
 
+class ProgressExporter(object):
+    metric_prefix = "hyperparameter_hunter_optimization_"
+
+    def __init__(self, events_path=None, textfile_path=None, labels=None):
+        """Export the results reported by :class:`OptimizationReporter` in machine-readable forms,
+        so the progress of optimization can be monitored without parsing its logs
+
+        Parameters
+        ----------
+        events_path: String, or None, default=None
+            If given, each event is appended to this file as a line of JSON. Values that are not
+            finite numbers are written as null
+        textfile_path: String, or None, default=None
+            If given, this file is rewritten after each event with Prometheus metrics summarizing
+            all events so far, in the text format read by the textfile collector of the Prometheus
+            node exporter. The metrics are written to a temporary file in the same directory, which
+            then replaces `textfile_path`, so it is never read while half-written
+        labels: Dict, or None, default=None
+            Labels added to each metric in `textfile_path`
+
+        Attributes
+        ----------
+        last_event: Dict, or None
+            The last event exported
+        totals: Dict
+            Maps each stage ("saved_results", or "optimization") to running totals of its number of
+            "experiments", and of their "experiment_seconds" and "surrogate_fit_seconds"
+
+        Examples
+        --------
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     exporter = ProgressExporter(
+        ...         events_path=os.path.join(directory, "events.ndjson"),
+        ...         textfile_path=os.path.join(directory, "progress.prom"),
+        ...         labels=dict(job="demo"),
+        ...     )
+        ...     for i, score in enumerate([0.7, 0.8]):
+        ...         exporter.export(
+        ...             dict(stage="optimization", iteration=i, score=score, best_score=0.8,
+        ...                  experiment_duration=2.0, skipped_iterations=1)
+        ...         )
+        ...     with open(exporter.events_path) as f:
+        ...         event = json.loads(f.readline())
+        ...     with open(exporter.textfile_path) as f:
+        ...         metrics = [_ for _ in f if not _.startswith("# HELP")]
+        >>> print("".join(_ for _ in metrics if "_best_score" in _ or "_experiments_" in _))
+        # TYPE hyperparameter_hunter_optimization_best_score gauge
+        hyperparameter_hunter_optimization_best_score{job="demo"} 0.8
+        # TYPE hyperparameter_hunter_optimization_experiments_total counter
+        hyperparameter_hunter_optimization_experiments_total{job="demo",stage="optimization"} 2.0
+        <BLANKLINE>
+        >>> sorted(event)
+        ['best_score', 'experiment_duration', 'iteration', 'score', 'skipped_iterations', 'stage']
+        >>> event["stage"], event["iteration"], event["score"], event["best_score"]
+        ('optimization', 0, 0.7, 0.8)"""
+        self.events_path = events_path
+        self.textfile_path = textfile_path
+        self.labels = dict(labels or {})
+
+        self.last_event = None
+        self.totals = {}
+
+        for path in [self.events_path, self.textfile_path]:
+            if path is not None:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def export(self, event: dict):
+        """Append `event` to :attr:`events_path`, and rewrite :attr:`textfile_path` to include it
+
+        Parameters
+        ----------
+        event: Dict
+            Description of a result, whose keys are those exported by
+            :meth:`OptimizationReporter.print_result`. Missing keys are treated as None"""
+        totals = self.totals.setdefault(
+            event.get("stage") or "optimization",
+            dict(experiments=0, experiment_seconds=0.0, surrogate_fit_seconds=0.0),
+        )
+        totals["experiments"] += 1
+        totals["experiment_seconds"] += event.get("experiment_duration") or 0.0
+        totals["surrogate_fit_seconds"] += event.get("surrogate_fit_time") or 0.0
+        self.last_event = event
+
+        if self.events_path is not None:
+            line = json.dumps({k: _to_json_value(v) for k, v in event.items()}, allow_nan=False)
+            with open(self.events_path, "a") as f:
+                f.write(line + "\n")
+
+        if self.textfile_path is not None:
+            temp_path = f"{self.textfile_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w") as f:
+                f.write(self.format_metrics())
+            os.replace(temp_path, self.textfile_path)
+
+    def format_metrics(self) -> str:
+        """Format Prometheus metrics describing :attr:`last_event` and :attr:`totals`
+
+        Returns
+        -------
+        String
+            Metrics in the Prometheus text exposition format"""
+        event = self.last_event or {}
+        metrics = [
+            ("best_score", "gauge", "Best score found so far", [({}, event.get("best_score"))]),
+            ("score", "gauge", "Score of the last Experiment", [({}, event.get("score"))]),
+            (
+                "iteration",
+                "gauge",
+                "Iteration of the last Experiment",
+                [({}, event.get("iteration"))],
+            ),
+            (
+                "experiment_duration_seconds",
+                "gauge",
+                "Seconds spent by the last Experiment",
+                [({}, event.get("experiment_duration"))],
+            ),
+            (
+                "skipped_iterations_total",
+                "counter",
+                "Number of iterations skipped because their Experiments were repeats",
+                [({}, event.get("skipped_iterations"))],
+            ),
+            (
+                "last_result_timestamp_seconds",
+                "gauge",
+                "Time at which the last Experiment result was reported",
+                [({}, event.get("timestamp"))],
+            ),
+        ]
+        for name, total, help_text in [
+            ("experiments_total", "experiments", "Number of Experiment results reported"),
+            ("experiment_seconds_total", "experiment_seconds", "Seconds spent by Experiments"),
+            (
+                "surrogate_fit_seconds_total",
+                "surrogate_fit_seconds",
+                "Seconds spent fitting surrogate models",
+            ),
+        ]:
+            samples = [(dict(stage=k), v[total]) for k, v in sorted(self.totals.items())]
+            metrics.append((name, "counter", help_text, samples))
+
+        lines = []
+        for name, metric_type, help_text, samples in sorted(metrics):
+            samples = [(labels, value) for (labels, value) in samples if value is not None]
+            if not samples:
+                continue
+            name = self.metric_prefix + name
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples:
+                labels = sorted(dict(self.labels, **labels).items())
+                labels = ",".join(f'{k}="{_escape_label_value(v)}"' for k, v in labels)
+                labels = f"{{{labels}}}" if labels else ""
+                lines.append(f"{name}{labels} {_format_sample_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _to_json_value(value):
+    """Convert `value` to a type that can be written to JSON, replacing non-finite numbers with None
+
+    Examples
+    --------
+    >>> [_to_json_value(_) for _ in [True, 3, 0.5, float("nan"), "a", None]]
+    [True, 3, 0.5, None, 'a', None]"""
+    if isinstance(value, (bool, str)) or value is None:
+        return value
+    if isinstance(value, Integral):
+        return int(value)
+    if isinstance(value, Real):
+        return float(value) if isfinite(value) else None
+    return str(value)
+
+
+def _format_sample_value(value) -> str:
+    """Format `value` as the value of a Prometheus sample
+
+    Examples
+    --------
+    >>> [_format_sample_value(_) for _ in [True, 3, 0.5, float("nan"), float("-inf")]]
+    ['1.0', '3.0', '0.5', 'NaN', '-Inf']"""
+    value = float(value)
+    if isfinite(value):
+        return repr(value)
+    return "NaN" if value != value else ("+Inf" if value > 0 else "-Inf")
+
+
+def _escape_label_value(value) -> str:
+    """Escape backslashes, double quotes, and line feeds in the Prometheus label value `value`
+
+    Examples
+    --------
+    >>> print(_escape_label_value('say "hi"'))
+    say \\"hi\\\""""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_content(content, args=None):
+    """Build the message to be logged from lazily-given `content`. This is only called once it is
+    known that the message will be emitted, so expensive messages are never built needlessly
+
+    Parameters
+    ----------
+    content: String, or callable
+        The message, or a callable that takes no arguments and returns the message
+    args: Tuple, dict, or None, default=None
+        If given, the message is a `%`-style format string, which is formatted with `args`
+
+    Returns
+    -------
+    content: String
+        The formatted message
+
+    Examples
+    --------
+    >>> render_content("Plain message")
+    'Plain message'
+    >>> render_content(lambda: "Lazy " + "message")
+    'Lazy message'
+    >>> render_content("Fold %d score: %.3f", args=(2, 0.12345))
+    'Fold 2 score: 0.123'
+    >>> render_content("%(name)s done", args=dict(name="Experiment"))
+    'Experiment done'"""
+    if callable(content):
+        content = content()
+    if args:
+        content = content % args
+    return content
+
+
+#: Results of :func:`stringify_frame_source`, keyed by the call site and the kwargs given to it
+_FRAME_SOURCES = {}
+
+
 def format_frame_source(previous_frame, **kwargs):
-    """Construct a string describing the location at which a call was made
+    """Construct a string describing the location at which a call was made. The result is cached
+    for each call site, so the source of each call site is only formatted once
 
     Parameters
     ----------
@@ -560,13 +1026,20 @@ def format_frame_source(previous_frame, **kwargs):
     Returns
     -------
     The stringified frame source information of `previous_frame`"""
-    source = inspect.getframeinfo(previous_frame)
-    src_script, src_line_no, src_func, src_class = source[0], source[1], source[2], None
+    code, src_line_no, src_class = previous_frame.f_code, previous_frame.f_lineno, None
 
     with suppress(AttributeError, KeyError):
         src_class = type(previous_frame.f_locals["self"]).__name__
 
-    return stringify_frame_source(src_script, src_line_no, src_func, src_class, **kwargs)
+    key = (code.co_filename, src_line_no, code.co_name, src_class, tuple(sorted(kwargs.items())))
+    try:
+        return _FRAME_SOURCES[key]
+    except KeyError:
+        source = stringify_frame_source(
+            code.co_filename, src_line_no, code.co_name, src_class, **kwargs
+        )
+        _FRAME_SOURCES[key] = source
+        return source
 
 
 def stringify_frame_source(
@@ -0,0 +1,345 @@
+"""This module defines the tracing layer enabled by
+:class:`~hyperparameter_hunter.environment.Environment`'s `trace_spans` kwarg. While it is enabled,
+OptPros and Experiments record their work as a tree of nested, timed spans: each
+:meth:`~hyperparameter_hunter.optimization.protocol_core.BaseOptPro.go` contains a span for each
+Experiment it executes, which contains its preparation and cross-validation workflows, down to each
+repetition, fold, and run, as well as its feature engineering stages and recorder saves. Finished
+spans are appended to a local file by :class:`FileSpanExporter` in the JSON encoding of the
+OpenTelemetry Protocol (OTLP), so they can be inspected directly, or loaded by any tool that reads
+OpenTelemetry traces, without running a collector or any other network service
+
+Related
+-------
+:mod:`hyperparameter_hunter.settings`
+    :attr:`~hyperparameter_hunter.settings.G.tracer` is the tracer used by all instrumented code. It
+    is :data:`NULL_TRACER` unless tracing is enabled by the active `Environment`
+:mod:`hyperparameter_hunter.callbacks.profilers`
+    Defines more detailed, Experiment-specific profiling of callback methods and stages
+
+Notes
+-----
+When tracing is disabled, :meth:`NullTracer.span` returns the same inert :class:`NullSpan` each
+time, so instrumented code pays for little more than a method call. Code that must do extra work
+to compute an attribute should check :attr:`Span.is_recording` first"""
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from contextlib import contextmanager
+import json
+from math import isfinite
+from numbers import Integral, Real
+import os
+
+try:
+    from time import time_ns
+except ImportError:  # Python < 3.7
+    from time import time
+
+    def time_ns() -> int:
+        """Fallback for :func:`time.time_ns`, which is new in Python 3.7. Return the current time
+        in nanoseconds since the epoch, with the precision of :func:`time.time`"""
+        return int(time() * 1e9)
+
+
+##################################################
+# Global Variables
+##################################################
+SCOPE_NAME = "hyperparameter_hunter"
+SPAN_KIND_INTERNAL = 1
+STATUS_CODE_ERROR = 2
+
+
+##################################################
+# Spans
+##################################################
+class Span(object):
+    is_recording = True
+
+    def __init__(self, name, trace_id, parent_id=None, attributes=None, clock=time_ns):
+        """Timed, named unit of work in a trace, which may be nested in another span
+
+        Parameters
+        ----------
+        name: String
+            Name of the span, usually that of the method whose work it describes
+        trace_id: String
+            Hex-encoded 16-byte ID of the trace to which the span belongs
+        parent_id: String, or None, default=None
+            Hex-encoded 8-byte ID of the span's parent. If None, the span is the root of its trace
+        attributes: Dict, or None, default=None
+            Initial attributes of the span. Attributes whose values are None are dropped
+        clock: Callable, default=`time.time_ns`
+            Function returning the current time in nanoseconds since the epoch
+
+        Attributes
+        ----------
+        span_id: String
+            Hex-encoded 8-byte ID of the span
+        start_time: Int
+            Time at which the span was created, in nanoseconds since the epoch
+        end_time: Int, or None
+            Time at which the span ended, or None if it has not ended
+        error: String, or None
+            Description of the exception that ended the span, if any"""
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = {}
+        self.set_attributes(**(attributes or {}))
+        self.start_time = clock()
+        self.end_time = None
+        self.error = None
+
+    def set_attribute(self, key: str, value):
+        """Set the attribute `key` of the span to `value`, unless `value` is None"""
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, **attributes):
+        """Set each of the `attributes` of the span, skipping those whose values are None"""
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    def to_otlp(self) -> dict:
+        """Encode the span as an OTLP/JSON `Span` message
+
+        Returns
+        -------
+        Dict
+            The span, with hex-encoded IDs, and times in nanoseconds since the epoch as strings"""
+        span = dict(
+            traceId=self.trace_id,
+            spanId=self.span_id,
+            name=self.name,
+            kind=SPAN_KIND_INTERNAL,
+            startTimeUnixNano=str(self.start_time),
+            endTimeUnixNano=str(self.end_time),
+            attributes=[dict(key=k, value=to_any_value(v)) for k, v in self.attributes.items()],
+            status={},
+        )
+        if self.parent_id is not None:
+            span["parentSpanId"] = self.parent_id
+        if self.error is not None:
+            span["status"] = dict(code=STATUS_CODE_ERROR, message=self.error)
+        return span
+
+
+class NullSpan(object):
+    """Inert stand-in for :class:`Span` used while tracing is disabled. It is also its own context
+    manager, so it can be returned directly by :meth:`NullTracer.span`"""
+
+    is_recording = False
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_attributes(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+
+def to_any_value(value) -> dict:
+    """Encode an attribute value as an OTLP/JSON `AnyValue` message
+
+    Parameters
+    ----------
+    value: Object
+        Attribute value. Booleans, integers, and real numbers keep their types. Anything else is
+        converted to a string
+
+    Returns
+    -------
+    Dict
+        Single-key dict, whose key names the type of `value`
+
+    Examples
+    --------
+    >>> to_any_value(True), to_any_value(3), to_any_value(0.5), to_any_value("a")
+    ({'boolValue': True}, {'intValue': '3'}, {'doubleValue': 0.5}, {'stringValue': 'a'})
+    >>> to_any_value(float("nan")), to_any_value(("oof", "roc_auc_score"))
+    ({'doubleValue': 'NaN'}, {'stringValue': "('oof', 'roc_auc_score')"})"""
+    if isinstance(value, bool):
+        return dict(boolValue=value)
+    if isinstance(value, Integral):
+        return dict(intValue=str(int(value)))  # 64-bit integers are strings in OTLP/JSON
+    if isinstance(value, Real):
+        value = float(value)
+        if not isfinite(value):
+            return dict(
+                doubleValue={"nan": "NaN", "inf": "Infinity", "-inf": "-Infinity"}[repr(value)]
+            )
+        return dict(doubleValue=value)
+    return dict(stringValue=str(value))
+
+
+##################################################
+# Tracers
+##################################################
+class Tracer(object):
+    def __init__(self, exporter, clock=time_ns):
+        """Create nested :class:`Span` objects, and send them to `exporter` as they finish
+
+        Parameters
+        ----------
+        exporter: Object
+            Receives lists of finished spans via its `export` method, like :class:`FileSpanExporter`
+        clock: Callable, default=`time.time_ns`
+            Function returning the current time in nanoseconds since the epoch
+
+        Attributes
+        ----------
+        stack: List[Span]
+            Spans that have started, but not yet ended, from outermost to innermost
+        finished: List[Span]
+            Spans that have ended, but have not yet been exported
+
+        Notes
+        -----
+        Finished spans are exported in batches whenever a root span, or a direct child of a root
+        span, ends. For an OptPro, this exports the spans of each Experiment as it finishes
+
+        Examples
+        --------
+        >>> class ListExporter:
+        ...     def __init__(self):
+        ...         self.spans = []
+        ...     def export(self, spans):
+        ...         self.spans.extend(spans)
+        >>> tracer = Tracer(ListExporter())
+        >>> with tracer.span("experiment", experiment_id="abc") as experiment_span:
+        ...     with tracer.span("fold", fold=0) as fold_span:
+        ...         fold_span.set_attribute("score", 0.75)
+        >>> [_.name for _ in tracer.exporter.spans]
+        ['fold', 'experiment']
+        >>> fold_span.parent_id == experiment_span.span_id, fold_span.attributes
+        (True, {'fold': 0, 'score': 0.75})"""
+        self.exporter = exporter
+        self.clock = clock
+        self.stack = []
+        self.finished = []
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Record the body of the `with` statement as a span, nested in the innermost open span
+
+        Parameters
+        ----------
+        name: String
+            Name of the span
+        **attributes: Dict
+            Initial attributes of the span. More can be set on the yielded span
+
+        Yields
+        ------
+        Span
+            The new span. If an exception is raised in the body, it is described by its `error`"""
+        parent = self.stack[-1] if self.stack else None
+        span = Span(
+            name,
+            parent.trace_id if parent else os.urandom(16).hex(),
+            parent_id=parent.span_id if parent else None,
+            attributes=attributes,
+            clock=self.clock,
+        )
+        self.stack.append(span)
+        try:
+            yield span
+        except BaseException as _ex:
+            span.error = f"{type(_ex).__name__}: {_ex}"
+            raise
+        finally:
+            span.end_time = self.clock()
+            self.stack.pop()
+            self.finished.append(span)
+            if len(self.stack) <= 1:
+                self.flush()
+
+    def flush(self):
+        """Export all spans in :attr:`finished`"""
+        if self.finished:
+            spans, self.finished = self.finished, []
+            self.exporter.export(spans)
+
+
+class NullTracer(object):
+    """Tracer used while tracing is disabled, which records nothing"""
+
+    def span(self, name, **attributes):
+        return NULL_SPAN
+
+    def flush(self):
+        pass
+
+
+NULL_SPAN = NullSpan()
+NULL_TRACER = NullTracer()
+
+
+##################################################
+# Exporters
+##################################################
+class FileSpanExporter(object):
+    def __init__(self, file_path: str, service_name: str = SCOPE_NAME, scope_version: str = None):
+        """Append finished spans to a local file as OTLP/JSON, one `ExportTraceServiceRequest` per
+        line, which is the format written by the OpenTelemetry Collector's file exporter
+
+        Parameters
+        ----------
+        file_path: String
+            Path of the file to which spans are appended. Its directory is created if necessary
+        service_name: String, default="hyperparameter_hunter"
+            Value of the "service.name" attribute of the resource that produced the spans
+        scope_version: String, or None, default=None
+            Version of the instrumentation scope, which is named "hyperparameter_hunter"
+
+        Examples
+        --------
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as directory:
+        ...     exporter = FileSpanExporter(os.path.join(directory, "Traces.jsonl"))
+        ...     tracer = Tracer(exporter, clock=lambda: 10)
+        ...     with tracer.span("experiment", experiment_id="abc"):
+        ...         pass
+        ...     with open(exporter.file_path) as f:
+        ...         request = json.loads(f.readline())
+        >>> scope_spans = request["resourceSpans"][0]["scopeSpans"][0]
+        >>> scope_spans["scope"]["name"], scope_spans["spans"][0]["name"]
+        ('hyperparameter_hunter', 'experiment')
+        >>> scope_spans["spans"][0]["attributes"]
+        [{'key': 'experiment_id', 'value': {'stringValue': 'abc'}}]"""
+        self.file_path = file_path
+        self.service_name = service_name
+        self.scope_version = scope_version
+
+    def export(self, spans):
+        """Append one line describing all `spans` to :attr:`file_path`
+
+        Parameters
+        ----------
+        spans: List[Span]
+            Finished spans to export"""
+        scope = dict(name=SCOPE_NAME)
+        if self.scope_version is not None:
+            scope["version"] = self.scope_version
+
+        resource = dict(
+            attributes=[dict(key="service.name", value=to_any_value(self.service_name))]
+        )
+        request = dict(
+            resourceSpans=[
+                dict(
+                    resource=resource,
+                    scopeSpans=[dict(scope=scope, spans=[_.to_otlp() for _ in spans])],
+                )
+            ]
+        )
+
+        os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+        with open(self.file_path, "a") as f:
+            f.write(json.dumps(request, separators=(",", ":")) + "\n")
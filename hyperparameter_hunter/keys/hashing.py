@@ -50,12 +50,56 @@ def to_hashable(obj, **kwargs):
     if isinstance(obj, (set, frozenset)):
         return tuple(sorted(to_hashable(_, **kwargs) for _ in obj))
     if isinstance(obj, pd.DataFrame):
+        if any(isinstance(_, pd.SparseDtype) for _ in obj.dtypes):
+            return sparse_frame_to_hashable(obj)
         # `pd.util.hash_pandas_object` ignores columns, so return them as well
         return (tuple(pd.util.hash_pandas_object(obj, index=True)), tuple(obj.columns))
 
     return obj
 
 
+def sparse_frame_to_hashable(df: pd.DataFrame) -> tuple:
+    """Format a DataFrame containing sparse columns to be hashable without densifying it. Each
+    sparse column is described by the positions and values of its non-fill values, and its fill
+    value. Dense columns are described by their hashed values
+
+    Parameters
+    ----------
+    df: pd.DataFrame
+        DataFrame containing at least one sparse column
+
+    Returns
+    -------
+    Tuple
+        Hashed index values, a digest of each column, and the column names
+
+    Examples
+    --------
+    >>> df = pd.DataFrame(dict(a=pd.arrays.SparseArray([0, 0, 1]), b=[1, 2, 3]))
+    >>> _index, digests, columns = sparse_frame_to_hashable(df)
+    >>> len(digests), columns
+    (2, ('a', 'b'))
+    >>> df_other = pd.DataFrame(dict(a=pd.arrays.SparseArray([0, 1, 0]), b=[1, 2, 3]))
+    >>> sparse_frame_to_hashable(df_other)[1][0] == digests[0]
+    False"""
+    digests = []
+
+    for _, column in df.items():
+        hasher = hashlib.sha256()
+        values = column.array
+
+        if isinstance(values.dtype, pd.SparseDtype):
+            hasher.update(repr((values.dtype, values.fill_value)).encode())
+            hasher.update(values.sp_index.to_int_index().indices.tobytes())
+            hasher.update(values.sp_values.tobytes())
+        else:
+            hasher.update(pd.util.hash_pandas_object(column, index=False).values.tobytes())
+
+        digests.append(hasher.hexdigest())
+
+    return (tuple(pd.util.hash_pandas_object(df.index)), tuple(digests), tuple(df.columns))
+
+
 def hash_callable(
     obj,
     ignore_line_comments=True,
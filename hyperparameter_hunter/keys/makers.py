@@ -17,6 +17,7 @@ Related
 ##################################################
 # Import Own Assets
 ##################################################
+from hyperparameter_hunter.data.data_core import is_sparse_frame
 from hyperparameter_hunter.feature_engineering import FeatureEngineer, EngineerStep
 from hyperparameter_hunter.i_o.exceptions import EnvironmentInvalidError, EnvironmentInactiveError
 from hyperparameter_hunter.keys.hashing import make_hash_sha256
@@ -221,6 +222,10 @@ class KeyMaker(metaclass=ABCMeta):
             with shelve.open(lookup_path(f"{key}"), flag="c") as s:
                 # NOTE: When reading from shelve file, DO NOT add the ".db" file extension
                 s[hashed_value] = value
+        elif is_sparse_frame(value):
+            # Pickle sparse DataFrames, because saving them as .csv files would densify them
+            make_dirs(lookup_path(key), exist_ok=True)
+            value.to_pickle(lookup_path(key, f"{hashed_value}.pkl"))
         elif isinstance(value, pd.DataFrame):
             make_dirs(lookup_path(key), exist_ok=True)
             value.to_csv(lookup_path(key, f"{hashed_value}.csv"), index=False)
@@ -1,8 +1,8 @@
 """This module provides wrapper classes around the raw algorithms being executed to facilitate use
 by :class:`hyperparameter_hunter.experiments.BaseExperiment`. The algorithms created by most
 libraries can be handled by :class:`hyperparameter_hunter.models.Model`, but some need special
-attention, hence :class:`KerasModel`, and :class:`XGBoostModel`. The model classes defined herein
-handle algorithm instantiation, as well as fitting and predicting
+attention, hence :class:`KerasModel`, :class:`XGBoostModel`, and :class:`CatBoostModel`. The model
+classes defined herein handle algorithm instantiation, as well as fitting and predicting
 
 Related
 -------
@@ -14,7 +14,7 @@ Related
 ##################################################
 # Import Own Assets
 ##################################################
-from hyperparameter_hunter.sentinels import locate_sentinels
+from hyperparameter_hunter.sentinels import find_sentinel_paths, resolve_sentinel_paths
 from hyperparameter_hunter.settings import G
 
 # from hyperparameter_hunter.utils.metrics_utils import wrap_xgboost_metric
@@ -24,7 +24,9 @@ from hyperparameter_hunter.settings import G
 ##################################################
 from contextlib import suppress
 import inspect
+import pandas as pd
 import sys
+from typing import Dict, List
 import warnings
 
 ##################################################
@@ -37,8 +39,249 @@ try:
 except ImportError:
     K = None
 
+try:
+    from catboost import Pool
+except ImportError:
+    Pool = None
+
 load_model = lambda _: _
 
+##################################################
+# Model Metadata Caches
+##################################################
+_FIT_PARAMETERS_CACHE = {}  # type: Dict[type, tuple]
+_SENTINEL_PATHS_CACHE = {}  # type: Dict[tuple, List[tuple]]
+
+
+def get_fit_parameters(model) -> tuple:
+    """Determine the names of the parameters accepted by `model.fit`. The result of inspecting the
+    signature of `model.fit` is cached by the type of `model`, so repeated calls (once per run of
+    each Experiment) don't need to introspect the signature again
+
+    Parameters
+    ----------
+    model: Object
+        Initialized model, whose `fit` method will be called
+
+    Returns
+    -------
+    Tuple
+        Names of the parameters in the signature of `model.fit`
+
+    Examples
+    --------
+    >>> class Foo:
+    ...     def fit(self, X, y, sample_weight=None):
+    ...         pass
+    >>> get_fit_parameters(Foo())
+    ('X', 'y', 'sample_weight')"""
+    #################### Instance-Level `fit` Can't be Cached by Type ####################
+    if "fit" in getattr(model, "__dict__", {}):
+        return tuple(inspect.signature(model.fit).parameters)
+
+    try:
+        return _FIT_PARAMETERS_CACHE[type(model)]
+    except KeyError:
+        fit_parameters = tuple(inspect.signature(model.fit).parameters)
+        _FIT_PARAMETERS_CACHE[type(model)] = fit_parameters
+        return fit_parameters
+
+
+def get_default_fit_kwargs(model) -> dict:
+    """Determine the keyword arguments that should be given to `model.fit` to silence it
+
+    Parameters
+    ----------
+    model: Object
+        Initialized model, whose `fit` method will be called
+
+    Returns
+    -------
+    Dict
+        Default keyword arguments for `model.fit`. Contains `verbose=False` if `model.fit` expects
+        "verbose". Else, contains `silent=True` if `model.fit` expects "silent". Else, empty
+
+    Examples
+    --------
+    >>> from sklearn.svm import SVC
+    >>> get_default_fit_kwargs(SVC())
+    {}
+    >>> class Verbose:
+    ...     def fit(self, X, y, verbose=1):
+    ...         pass
+    >>> get_default_fit_kwargs(Verbose())
+    {'verbose': False}
+    >>> class Silent:
+    ...     def fit(self, X, y, silent=False):
+    ...         pass
+    >>> get_default_fit_kwargs(Silent())
+    {'silent': True}"""
+    fit_parameters = get_fit_parameters(model)
+    if "verbose" in fit_parameters:
+        return dict(verbose=False)
+    if "silent" in fit_parameters:
+        return dict(silent=True)
+    return {}
+
+
+def get_sentinel_paths(model_initializer, params_name: str, params) -> List[tuple]:
+    """Find the paths to the `Sentinel` values in `params`. Within an Experiment, the structure of
+    the `params` given to each run's model is identical, so the paths are cached by the current
+    Experiment's ID, `model_initializer` and `params_name`. Only paths for the most recent
+    Experiment are retained
+
+    Parameters
+    ----------
+    model_initializer: Callable
+        The callable used to create an instance of some algorithm
+    params_name: String
+        Name of the params given to :class:`Model`. One of ["initialization_params",
+        "extra_params"]. Distinguishes the two trees of params for the same `model_initializer`
+    params: Dict
+        Parameters that may contain nested `Sentinel` values
+
+    Returns
+    -------
+    List[tuple]
+        Paths to each `Sentinel` in `params`, as returned by
+        :func:`~hyperparameter_hunter.sentinels.find_sentinel_paths`"""
+    experiment_id = getattr(getattr(G.Env, "current_task", None), "experiment_id", None)
+    if experiment_id is None:
+        return find_sentinel_paths(params)
+
+    try:
+        key = (experiment_id, model_initializer, params_name)
+        hash(key)
+    except TypeError:
+        return find_sentinel_paths(params)
+
+    try:
+        return _SENTINEL_PATHS_CACHE[key]
+    except KeyError:
+        if any(_[0] != experiment_id for _ in _SENTINEL_PATHS_CACHE):
+            _SENTINEL_PATHS_CACHE.clear()
+        paths = _SENTINEL_PATHS_CACHE[key] = find_sentinel_paths(params)
+        return paths
+
+
+def clear_model_metadata_caches():
+    """Empty the caches used by :func:`get_fit_parameters`, and :func:`get_sentinel_paths`"""
+    _FIT_PARAMETERS_CACHE.clear()
+    _SENTINEL_PATHS_CACHE.clear()
+
+
+##################################################
+# Native Data Containers
+##################################################
+class NativeDataCache(object):
+    def __init__(self):
+        """Cache of library-specific data containers (like CatBoost's `Pool`), built from the input
+        and target data given to a model. Containers are looked up by the identity of their source
+        data, which is the same object for each run in a fold, so a container is only built once per
+        fold, then reused by all of the fold's runs and prediction calls
+
+        Attributes
+        ----------
+        entries: Dict
+            Maps the IDs of (input, target) pairs to tuples of (input, target, container). The
+            source data are kept alongside the container so an ID reused by a new object isn't
+            mistaken for the original"""
+        self.entries = {}
+        self._train_input = None
+
+    def get(self, input_data, target_data, build):
+        """Retrieve the container for `input_data` and `target_data`, building it if necessary
+
+        Parameters
+        ----------
+        input_data: Array-like
+            Input data from which the container is built
+        target_data: Array-like, or None
+            Target data from which the container is built. None when building a container for
+            prediction
+        build: Callable
+            Called with `input_data` and `target_data` to build the container if it isn't cached
+
+        Returns
+        -------
+        Object
+            The container built by `build`
+
+        Examples
+        --------
+        >>> cache = NativeDataCache()
+        >>> data = [1, 2, 3]
+        >>> first = cache.get(data, None, lambda x, y: tuple(x))
+        >>> first
+        (1, 2, 3)
+        >>> cache.get(data, None, lambda x, y: tuple(x)) is first
+        True
+        >>> cache.get([1, 2, 3], None, lambda x, y: tuple(x)) is first
+        False"""
+        key = (id(input_data), id(target_data))
+        with suppress(KeyError):
+            cached_input, cached_target, container = self.entries[key]
+            if cached_input is input_data and cached_target is target_data:
+                return container
+
+        container = build(input_data, target_data)
+        self.entries[key] = (input_data, target_data, container)
+        return container
+
+    def start_fold(self, train_input):
+        """Clear the cache if `train_input` differs from the training data of the last call, which
+        signals the start of a new fold
+
+        Parameters
+        ----------
+        train_input: Array-like
+            The training input data of the current fold"""
+        if train_input is not self._train_input:
+            self.clear()
+            self._train_input = train_input
+
+    def clear(self):
+        """Release all cached containers, along with the data from which they were built"""
+        self.entries.clear()
+        self._train_input = None
+
+
+##################################################
+# Sparse Data
+##################################################
+def to_model_input(input_data):
+    """Convert `input_data` to a `scipy.sparse.csr_matrix` if it is a DataFrame consisting entirely
+    of sparse columns, so it is given to the model without densifying. Other values are unchanged
+
+    Parameters
+    ----------
+    input_data: Array-like
+        Input data for a model's `fit` or `predict` methods
+
+    Returns
+    -------
+    Array-like
+        `input_data` as a `scipy.sparse.csr_matrix`, or `input_data` itself
+
+    Examples
+    --------
+    >>> df = pd.DataFrame(
+    ...     dict(a=pd.arrays.SparseArray([0, 0, 1]), b=pd.arrays.SparseArray([2, 0, 0]))
+    ... )
+    >>> matrix = to_model_input(df)
+    >>> matrix.format, matrix.shape, matrix.nnz
+    ('csr', (3, 2), 2)
+    >>> df["c"] = [1, 2, 3]
+    >>> to_model_input(df) is df
+    True"""
+    if (
+        isinstance(input_data, pd.DataFrame)
+        and len(input_data.columns) > 0
+        and all(isinstance(_, pd.SparseDtype) for _ in input_data.dtypes)
+    ):
+        return input_data.sparse.to_coo().tocsr()
+    return input_data
+
 
 def model_selector(model_initializer):
     """Selects the appropriate Model class to use for `model_initializer`
@@ -65,6 +308,8 @@ def model_selector(model_initializer):
             return KerasModel
         elif model_initializer.__name__ in ("XGBClassifier", "XGBRegressor"):
             return XGBoostModel
+        elif model_initializer.__name__ in ("CatBoostClassifier", "CatBoostRegressor"):
+            return CatBoostModel
         else:
             return Model
     except AttributeError:
@@ -154,8 +399,16 @@ class Model(object):
         self.model = None
         self.epochs_elapsed = None
 
-        self.initialization_params = locate_sentinels(self.initialization_params)
-        self.extra_params = locate_sentinels(self.extra_params)
+        self.initialization_params = resolve_sentinel_paths(
+            self.initialization_params,
+            get_sentinel_paths(
+                model_initializer, "initialization_params", self.initialization_params
+            ),
+        )
+        self.extra_params = resolve_sentinel_paths(
+            self.extra_params,
+            get_sentinel_paths(model_initializer, "extra_params", self.extra_params),
+        )
 
         self.initialize_model()
 
@@ -172,25 +425,45 @@ class Model(object):
 
     def fit(self):
         """Train model according to :attr:`extra_params['fit']` (if appropriate) on training data"""
-        expected_fit_parameters = list(inspect.signature(self.model.fit).parameters)
-        fit_kwargs = {}
-        if "verbose" in expected_fit_parameters:
-            fit_kwargs["verbose"] = False
-        if "silent" in expected_fit_parameters and "verbose" not in fit_kwargs:
-            fit_kwargs["silent"] = True
+        fit_kwargs = self.get_fit_kwargs()
 
-        fit_kwargs = dict(
-            fit_kwargs,
-            **{k: v for k, v in self.extra_params.get("fit", {}).items() if k not in ["X", "y"]},
-        )
+        train_input = to_model_input(self.train_input)
 
         try:
-            self.model = self.model.fit(self.train_input, self.train_target, **fit_kwargs)
+            self.model = self.model.fit(train_input, self.train_target, **fit_kwargs)
         except (TypeError, sklearn_utils.DataConversionWarning):
             self.model = self.model.fit(
-                self.train_input.values, self.train_target.values, **fit_kwargs
+                getattr(train_input, "values", train_input), self.train_target.values, **fit_kwargs
             )
 
+    def get_fit_kwargs(self) -> dict:
+        """Build the keyword arguments given to :meth:`model.fit`, from the defaults of
+        :func:`get_default_fit_kwargs`, updated by :attr:`extra_params['fit']`. If
+        `early_stopping_rounds` is given, but `eval_set` is not, and `model.fit` accepts both, then
+        the fold's validation data is used as `eval_set` to enable the library's early stopping
+
+        Returns
+        -------
+        Dict
+            Keyword arguments for :meth:`model.fit`, excluding the training input and target"""
+        fit_kwargs = dict(
+            get_default_fit_kwargs(self.model),
+            **{k: v for k, v in self.extra_params.get("fit", {}).items() if k not in ["X", "y"]},
+        )
+
+        #################### Validation Data for Early Stopping ####################
+        if (
+            fit_kwargs.get("early_stopping_rounds") is not None
+            and fit_kwargs.get("eval_set") is None
+            and self.validation_input is not None
+            and {"early_stopping_rounds", "eval_set"}.issubset(get_fit_parameters(self.model))
+        ):
+            fit_kwargs["eval_set"] = [
+                (to_model_input(self.validation_input), self.validation_target)
+            ]
+
+        return fit_kwargs
+
     def predict(self, input_data):
         """Generate model predictions for `input_data`
 
@@ -211,6 +484,8 @@ class Model(object):
         if input_data is None:
             return None
 
+        input_data = to_model_input(input_data)
+
         if (self.do_predict_proba is True) or type(self.do_predict_proba) == int:
             prediction = self.model.predict_proba(input_data)
         else:
@@ -298,6 +573,118 @@ class XGBoostModel(Model):
     #     self.model.fit(self.train_input, self.train_target, **fit_kwargs)
 
 
+_CATBOOST_DATA = NativeDataCache()
+
+
+def clear_native_data_caches():
+    """Release the data containers cached for all library-specific models, along with the datasets
+    from which they were built. Called at the end of each Experiment, so the last fold's data isn't
+    kept alive by the process-wide caches"""
+    _CATBOOST_DATA.clear()
+
+
+class CatBoostModel(Model):
+    def __init__(
+        self,
+        model_initializer,
+        initialization_params,
+        extra_params,
+        train_input=None,
+        train_target=None,
+        validation_input=None,
+        validation_target=None,
+        do_predict_proba=False,
+        target_metric=None,
+        metrics=None,
+    ):
+        """A special Model class for handling CatBoost algorithms. Consider documentation to be
+        identical to that of :class:`Model`, except where noted. CatBoost models are given `Pool`
+        objects, rather than the raw datasets, for fitting, evaluation and prediction. Each `Pool`
+        is built once per fold, then reused by all of the fold's runs
+
+        Parameters
+        ----------
+        model_initializer: Class
+            :class:`catboost.CatBoostClassifier`, or :class:`catboost.CatBoostRegressor`. See
+            :class:`Model`
+        initialization_params: See :class:`Model`
+        extra_params: Dict, default={}
+            See :class:`Model`. Pairs of datasets in :attr:`extra_params['fit']['eval_set']` are
+            converted to cached `Pool` objects. :attr:`extra_params['fit']['cat_features']` is
+            given to each `Pool`, rather than to :meth:`catboost.CatBoost.fit`
+        train_input: See :class:`Model`
+        train_target: See :class:`Model`
+        validation_input: See :class:`Model`
+        validation_target: See :class:`Model`
+        do_predict_proba: See :class:`Model`
+        target_metric: See :class:`Model`
+        metrics: See :class:`Model`"""
+        if model_initializer.__name__ not in ("CatBoostClassifier", "CatBoostRegressor"):
+            raise ValueError(f"Invalid `model_initializer`: {model_initializer}")
+
+        super().__init__(
+            model_initializer,
+            initialization_params,
+            extra_params,
+            train_input=train_input,
+            train_target=train_target,
+            validation_input=validation_input,
+            validation_target=validation_target,
+            do_predict_proba=do_predict_proba,
+            target_metric=target_metric,
+            metrics=metrics,
+        )
+
+    def fit(self):
+        """Train model on a `Pool` of the training data, according to :attr:`extra_params['fit']`"""
+        _CATBOOST_DATA.start_fold(self.train_input)
+        fit_kwargs = self.get_fit_kwargs()
+        fit_kwargs.pop("cat_features", None)  # Given to each `Pool`, instead
+
+        eval_set = fit_kwargs.get("eval_set")
+        if isinstance(eval_set, tuple):
+            fit_kwargs["eval_set"] = self.get_pool(*eval_set)
+        elif isinstance(eval_set, list):
+            fit_kwargs["eval_set"] = [
+                _ if not isinstance(_, tuple) else self.get_pool(*_) for _ in eval_set
+            ]
+
+        self.model = self.model.fit(
+            self.get_pool(self.train_input, self.train_target), **fit_kwargs
+        )
+
+    def predict(self, input_data):
+        """Generate model predictions for a `Pool` of `input_data`. See :meth:`Model.predict`"""
+        if input_data is None:
+            return None
+        return super().predict(self.get_pool(input_data))
+
+    def get_pool(self, input_data, target_data=None):
+        """Retrieve the cached `Pool` for `input_data` and `target_data`, building it if necessary
+
+        Parameters
+        ----------
+        input_data: Array-like
+            Input data of the `Pool`
+        target_data: Array-like, or None, default=None
+            Target data of the `Pool`. None when building a `Pool` for prediction
+
+        Returns
+        -------
+        catboost.Pool"""
+        cat_features = self.extra_params.get("fit", {}).get("cat_features")
+        if cat_features is None:
+            cat_features = self.model.get_params().get("cat_features")
+
+        return _CATBOOST_DATA.get(
+            input_data,
+            target_data,
+            lambda _input, _target: Pool(
+                to_model_input(_input), label=_target, cat_features=cat_features
+            ),
+        )
+
+
 class KerasModel(Model):
     def __init__(
         self,
@@ -26,7 +26,8 @@ from hyperparameter_hunter.algorithm_handlers import (
     identify_algorithm_hyperparameters,
 )
 from hyperparameter_hunter.experiments import CVExperiment
-from hyperparameter_hunter.feature_engineering import FeatureEngineer
+from hyperparameter_hunter.keys.hashing import make_hash_sha256
+from hyperparameter_hunter.feature_engineering import EngineerStep, FeatureEngineer
 from hyperparameter_hunter.i_o.exceptions import (
     EnvironmentInactiveError,
     EnvironmentInvalidError,
@@ -46,6 +47,7 @@ from hyperparameter_hunter.settings import G, TEMP_MODULES_DIR_PATH
 from hyperparameter_hunter.space.dimensions import RejectedOptional
 from hyperparameter_hunter.space.space_core import Space
 from hyperparameter_hunter.utils.boltons_utils import get_path
+from hyperparameter_hunter.utils.file_utils import make_dirs, read_pickle, write_pickle
 from hyperparameter_hunter.utils.general_utils import deep_restricted_update, subdict
 from hyperparameter_hunter.utils.optimization_utils import get_choice_dimensions, dimension_subset
 from hyperparameter_hunter.utils.version_utils import Deprecated
@@ -57,8 +59,10 @@ from abc import ABCMeta, abstractmethod
 from datetime import datetime
 from inspect import currentframe, getframeinfo
 from os import walk, remove, rmdir
-from os.path import abspath
-from typing import Any, Dict
+from os.path import abspath, isfile, join
+import pickle
+from time import perf_counter
+from typing import Any, Dict, Optional
 from warnings import warn
 
 ##################################################
@@ -144,7 +148,9 @@ class BaseOptPro(metaclass=MergedOptProMeta):
             Unless provided explicitly, the key "do_maximize" will be added by default to
             `reporter_params`, with a value inferred from the `direction` of :attr:`target_metric`
             in `G.Env.metrics`. In nearly all cases, the "do_maximize" key should be ignored,
-            as there are very few reasons to explicitly include it
+            as there are very few reasons to explicitly include it. To monitor
+            optimization without parsing its logs, give the "events_path" and/or "textfile_path"
+            keys to export each result as JSON, and as Prometheus metrics
         warn_on_re_ask: Boolean, default=False
             If True, and the internal `optimizer` recommends a point that has already been evaluated
             on invocation of `ask`, a warning is logged before recommending a random point. Either
@@ -206,6 +212,7 @@ class BaseOptPro(metaclass=MergedOptProMeta):
         self.module_name = None
         self.current_experiment = None
         self.current_score = None
+        self.surrogate_fit_time = None
 
         #################### Keras-Specific Attributes ####################
         self.dummy_layers = []
@@ -217,6 +224,7 @@ class BaseOptPro(metaclass=MergedOptProMeta):
         self.fe_iter_attrs = [lambda p, k, v: isinstance(v, FeatureEngineer)]
 
         self.logger = None
+        self.checkpoint_every = 0
         self._preparation_workflow()
         self.do_maximize = G.Env.metrics[self.target_metric[-1]].direction == "max"
 
@@ -474,7 +482,7 @@ class BaseOptPro(metaclass=MergedOptProMeta):
         self._set_hyperparameter_space()
         self._find_similar_experiments()
 
-    def go(self, force_ready=True):
+    def go(self, force_ready=True, resume=False, checkpoint_every=0):
         """Execute hyperparameter optimization, building an Experiment for each iteration
 
         This method may only be invoked after invoking :meth:`.forge_experiment`, which defines
@@ -490,12 +498,44 @@ class BaseOptPro(metaclass=MergedOptProMeta):
             If True, :meth:`get_ready` will be invoked even if it has already been called. This will
             re-initialize the hyperparameter `space` and `similar_experiments`. Standard behavior is
             for :meth:`go` to invoke :meth:`get_ready`, so `force_ready` is ignored unless
-            :meth:`get_ready` has been manually invoked"""
-        if force_ready or self.space is None:
+            :meth:`get_ready` has been manually invoked
+        resume: Boolean, default=False
+            If True, and a checkpoint saved by an OptPro with the same class, search dimensions,
+            target metric, algorithm and Environment exists, then the optimizer's state is restored
+            from the checkpoint, rather than invoking :meth:`get_ready`. This continues the search
+            trajectory of the checkpointed OptPro without re-reading saved Experiment descriptions.
+            The optimization loop continues until a total of :attr:`iterations` Experiments have
+            been executed, including those executed before the checkpoint was saved. If there is no
+            checkpoint to resume from, `resume` is ignored. Note that Experiments saved after the
+            checkpoint by other OptPros are not learned from when resuming
+        checkpoint_every: Int, default=0
+            Save a checkpoint of the optimizer's state after every `checkpoint_every` successful
+            iterations, as well as at the end of the optimization loop. Checkpoints are saved in
+            the "<ASSETS_DIRNAME>/Optimizers/Checkpoints" directory. Each checkpoint pickles the
+            whole optimizer, including any fitted surrogate models, so frequent checkpoints add I/O
+            to every iteration. If 0, or if the active `Environment` has no `results_path`,
+            checkpoints are not saved"""
+        self.checkpoint_every = checkpoint_every
+        iteration = 0
+
+        if resume and self._resume_from_checkpoint():
+            iteration = self.successful_iterations
+        elif force_ready or self.space is None:
             self.get_ready()
 
         loop_start_time = datetime.now()
-        self._optimization_loop()
+        with G.tracer.span(
+            "go",
+            optpro=type(self).__name__,
+            target_metric=self.target_metric,
+            iterations=self.iterations,
+        ) as span:
+            self._optimization_loop(iteration)
+            span.set_attributes(
+                best_experiment=self.best_experiment,
+                score=self.best_score,
+                skipped_iterations=self.skipped_iterations,
+            )
         loop_end_time = datetime.now()
         G.log_(f"Optimization loop completed in {loop_end_time - loop_start_time}")
         G.log_(f'Best score was {self.best_score} from Experiment "{self.best_experiment}"')
@@ -517,7 +557,14 @@ class BaseOptPro(metaclass=MergedOptProMeta):
 
         while iteration < self.iterations:
             try:
-                self._execute_experiment()
+                with G.tracer.span("_execute_experiment", iteration=iteration) as span:
+                    self._execute_experiment()
+                    if span.is_recording:
+                        span.set_attributes(
+                            experiment_id=self.current_experiment.experiment_id,
+                            hyperparameter_key=str(self.current_experiment.hyperparameter_key),
+                            score=self.current_score,
+                        )
             except RepeatedExperimentError:
                 # G.debug_(F'Skipping repeated Experiment: {_ex!s}\n')
                 if len(self.similar_experiments) + len(self.tested_keys) >= self.search_space_size:
@@ -528,10 +575,14 @@ class BaseOptPro(metaclass=MergedOptProMeta):
             # NOTE: If reimplementing grid search, like `UninformedOptimizationProtocol`, add
             #   `except StopIteration` and see this commit, and 9b7ca73 / e2c3b73 (October 25, 2018)
 
+            overhead = self.current_experiment.stat_aggregates.get("overhead", {})
             self.logger.print_result(
                 self.current_hyperparameters_list,
                 self.current_score,
                 experiment_id=self.current_experiment.experiment_id,
+                experiment_duration=overhead.get("total"),
+                skipped_iterations=self.skipped_iterations,
+                surrogate_fit_time=self.surrogate_fit_time,
             )
 
             #################### Update Best Experiment ####################
@@ -545,6 +596,12 @@ class BaseOptPro(metaclass=MergedOptProMeta):
 
             iteration += 1
 
+            if self.checkpoint_every and self.successful_iterations % self.checkpoint_every == 0:
+                self.save_checkpoint()
+
+        if self.checkpoint_every:
+            self.save_checkpoint()
+
     def _execute_experiment(self):
         """Instantiate and run a :class:`experiments.CVExperiment` after checking for duplicate keys
 
@@ -650,7 +707,10 @@ class BaseOptPro(metaclass=MergedOptProMeta):
         # TODO: Add `current_feature_selector`
 
         #################### Initialize `current_feature_engineer` ####################
-        current_fe = subdict(self.current_feature_engineer, keep=["steps", "do_validate"])
+        current_fe = subdict(
+            self.current_feature_engineer,
+            keep=["steps", "do_validate", "chunk_size", "store_dir", "n_jobs"],
+        )
         current_fe["steps"] = [_ for _ in current_fe["steps"] if _ != RejectedOptional()]
         self.current_feature_engineer = FeatureEngineer(**current_fe)
 
@@ -662,6 +722,166 @@ class BaseOptPro(metaclass=MergedOptProMeta):
 
         # No need to reinitialize Keras `initializers` - Their values are passed to `build_fn` via extra `params`
 
+    ##################################################
+    # Checkpoint Methods:
+    ##################################################
+    @property
+    def checkpoint_path(self) -> Optional[str]:
+        """Path to the file at which the OptPro's checkpoint is saved. The filename is a hash of
+        the OptPro's class, the active Environment's `cross_experiment_key`, the algorithm being
+        optimized, :attr:`target_metric`, the names of the search :attr:`dimensions`, and the fixed
+        parameters of the forged Experiment (see :meth:`_get_fixed_parameters`). Because search
+        bounds are not hashed, a checkpoint's dimensions are compared to :attr:`dimensions` when
+        resuming. None if checkpoints cannot be saved
+
+        Returns
+        -------
+        String, or None
+            Path to the .pkl checkpoint file, or None if `checkpoint` result files are not saved"""
+        checkpoint_dir = G.Env.result_paths.get("optimizer_checkpoint")
+        if checkpoint_dir is None:
+            return None
+
+        checkpoint_key = make_hash_sha256(
+            dict(
+                opt_pro=type(self).__name__,
+                cross_experiment_key=str(G.Env.cross_experiment_key),
+                algorithm_name=self.algorithm_name,
+                module_name=self.module_name,
+                target_metric=self.target_metric,
+                dimensions=[_.name for _ in self.dimensions],
+                fixed_parameters=self._get_fixed_parameters(),
+            )
+        )
+        return join(checkpoint_dir, f"{checkpoint_key}.pkl")
+
+    def _get_fixed_parameters(self) -> dict:
+        """Collect the parameters of the forged Experiment that are not searched, with each of the
+        :attr:`dimensions` replaced by a placeholder, so OptPros searching the same dimensions with
+        different fixed hyperparameters don't share a checkpoint
+
+        Returns
+        -------
+        Dict
+            The forged `model_init_params`, `model_extra_params`, `feature_engineer` steps, and
+            `feature_selector`, without the values of any search dimensions"""
+        placeholders = [(_.name, "<dimension>") for _ in self.dimensions]
+
+        init_params = deep_restricted_update(
+            self.model_init_params,
+            self._select_params("model_init_params", placeholders),
+            iter_attrs=self.init_iter_attrs,
+        )
+        extra_params = deep_restricted_update(
+            self.model_extra_params,
+            self._select_params("model_extra_params", placeholders),
+            iter_attrs=self.extra_iter_attrs,
+        )
+        feature_engineer = deep_restricted_update(
+            self.feature_engineer,
+            self._select_params("feature_engineer", placeholders),
+            iter_attrs=self.fe_iter_attrs,
+        )
+
+        # Dataset hashes are set on `EngineerStep`s as they execute, so they are not hashed
+        fe_steps = [
+            subdict(_.get_key_data(), drop=["original_hashes", "updated_hashes"])
+            if isinstance(_, EngineerStep)
+            else _
+            for _ in feature_engineer["steps"]
+        ]
+        return dict(
+            model_init_params=init_params,
+            model_extra_params=extra_params,
+            feature_engineer=dict(steps=fe_steps, do_validate=feature_engineer["do_validate"]),
+            feature_selector=list(self.feature_selector),
+        )
+
+    def save_checkpoint(self):
+        """Save the state of the OptPro (see :meth:`_get_checkpoint_state`) to
+        :attr:`checkpoint_path`, from which it can be resumed via :meth:`go`"""
+        checkpoint_path = self.checkpoint_path
+        if checkpoint_path is None:
+            return
+
+        make_dirs(G.Env.result_paths["optimizer_checkpoint"], exist_ok=True)
+        try:
+            write_pickle(checkpoint_path, self._get_checkpoint_state())
+        except (pickle.PicklingError, AttributeError, TypeError) as _ex:
+            G.warn_(f"Unable to save optimization checkpoint. Checkpoints disabled. {_ex!r}")
+            self.checkpoint_every = 0
+
+    def _resume_from_checkpoint(self) -> bool:
+        """Restore the state of the OptPro from the checkpoint at :attr:`checkpoint_path`. This is
+        the counterpart to :meth:`get_ready`, which is not invoked when a checkpoint is restored
+
+        Returns
+        -------
+        Boolean
+            True if the checkpoint was restored. False if there is no checkpoint to restore"""
+        if self.model_initializer is None:
+            raise ValueError("Must invoke `forge_experiment` before starting optimization")
+
+        checkpoint_path = self.checkpoint_path
+        if checkpoint_path is None or not isfile(checkpoint_path):
+            G.log_("No optimization checkpoint found. Starting from scratch")
+            return False
+
+        state = read_pickle(checkpoint_path)
+        if state["dimensions"] != self.dimensions:
+            G.warn_("Optimization checkpoint search dimensions differ. Starting from scratch")
+            return False
+
+        _reporter_params = dict(dict(do_maximize=self.do_maximize), **self.reporter_parameters)
+        self.logger = OptimizationReporter(self.dimensions, **_reporter_params)
+        self._set_hyperparameter_space()
+        self._set_checkpoint_state(state)
+
+        G.log_(
+            f"Resuming optimization from checkpoint after {self.successful_iterations} iterations"
+        )
+        return True
+
+    def _get_checkpoint_state(self) -> dict:
+        """Collect the attributes that constitute the OptPro's progress, to be saved by
+        :meth:`save_checkpoint`. Descendants should extend the returned dict with the state of any
+        optimizers they use
+
+        Returns
+        -------
+        Dict
+            The state of the OptPro's search"""
+        return dict(
+            dimensions=self.dimensions,
+            best_experiment=self.best_experiment,
+            best_score=self.best_score,
+            successful_iterations=self.successful_iterations,
+            skipped_iterations=self.skipped_iterations,
+            tested_keys=self.tested_keys,
+            similar_experiments=self.similar_experiments,
+            reporter=dict(
+                iteration=self.logger.iteration, y_max=self.logger.y_max, x_max=self.logger.x_max
+            ),
+        )
+
+    def _set_checkpoint_state(self, state: dict):
+        """Restore the attributes collected by :meth:`_get_checkpoint_state`
+
+        Parameters
+        ----------
+        state: Dict
+            The state of the OptPro's search, read from a checkpoint"""
+        self.best_experiment = state["best_experiment"]
+        self.best_score = state["best_score"]
+        self.successful_iterations = state["successful_iterations"]
+        self.skipped_iterations = state["skipped_iterations"]
+        self.tested_keys = state["tested_keys"]
+        self.similar_experiments = state["similar_experiments"]
+
+        self.logger.iteration = state["reporter"]["iteration"]
+        self.logger.y_max = state["reporter"]["y_max"]
+        self.logger.x_max = state["reporter"]["x_max"]
+
     ##################################################
     # Abstract Methods:
     ##################################################
@@ -815,7 +1035,9 @@ class SKOptPro(BaseOptPro, metaclass=ABCMeta):
             Unless provided explicitly, the key "do_maximize" will be added by default to
             `reporter_params`, with a value inferred from the `direction` of :attr:`target_metric`
             in `G.Env.metrics`. In nearly all cases, the "do_maximize" key should be ignored,
-            as there are very few reasons to explicitly include it
+            as there are very few reasons to explicitly include it. To monitor
+            optimization without parsing its logs, give the "events_path" and/or "textfile_path"
+            keys to export each result as JSON, and as Prometheus metrics
         warn_on_re_ask: Boolean, default=False
             If True, and the internal `optimizer` recommends a point that has already been evaluated
             on invocation of `ask`, a warning is logged before recommending a random point. Either
@@ -957,6 +1179,12 @@ class SKOptPro(BaseOptPro, metaclass=ABCMeta):
         """Set :attr:`optimizer` to the optimizing class used to both estimate the utility of sets
         of hyperparameters by learning from executed Experiments, and suggest points at which the
         objective should be evaluated"""
+        #################### Cap Acquisition Optimizer Jobs to CPU Budget ####################
+        cpu_budget = getattr(G.Env, "cpu_budget", None)
+        n_jobs = self.acquisition_optimizer_kwargs.get("n_jobs", 1)
+        if cpu_budget is not None and (n_jobs is None or not 0 < n_jobs <= cpu_budget.n_cores):
+            self.acquisition_optimizer_kwargs["n_jobs"] = cpu_budget.n_cores
+
         self.optimizer = Optimizer(
             dimensions=self.space,
             base_estimator=self.base_estimator,
@@ -969,6 +1197,31 @@ class SKOptPro(BaseOptPro, metaclass=ABCMeta):
             warn_on_re_ask=self.warn_on_re_ask,
         )
 
+    def _get_checkpoint_state(self) -> dict:
+        """Extend the parent's checkpoint state with :attr:`optimizer`, including its observations,
+        fitted estimators, random state, acquisition function gains and candidate points
+
+        Returns
+        -------
+        Dict
+            The state of the OptPro's search"""
+        return dict(
+            super()._get_checkpoint_state(),
+            optimizer=self.optimizer,
+            optimizer_result=self.optimizer_result,
+        )
+
+    def _set_checkpoint_state(self, state: dict):
+        """Restore the attributes collected by :meth:`_get_checkpoint_state`
+
+        Parameters
+        ----------
+        state: Dict
+            The state of the OptPro's search, read from a checkpoint"""
+        super()._set_checkpoint_state(state)
+        self.optimizer = state["optimizer"]
+        self.optimizer_result = state["optimizer_result"]
+
     def _update_optimizer(self, hyperparameters, score, fit=True):
         """Record an observation (or set of observations) of the objective function
 
@@ -983,10 +1236,17 @@ class SKOptPro(BaseOptPro, metaclass=ABCMeta):
             Value of the objective function at `hyperparameters` in the hyperparameter space
         fit: Boolean, default=True
             Fit a model to observed evaluations of the objective. Regardless of `fit`, a model will
-            only be fitted after telling :attr:`n_initial_points` points to :attr:`optimizer`"""
+            only be fitted after telling :attr:`n_initial_points` points to :attr:`optimizer`
+
+        Notes
+        -----
+        The seconds spent telling :attr:`optimizer` the observations, which include fitting its
+        surrogate model, are stored in :attr:`surrogate_fit_time`"""
         if self.do_maximize:
             score = -score
+        start_time = perf_counter()
         self.optimizer_result = self.optimizer.tell(hyperparameters, score, fit=fit)
+        self.surrogate_fit_time = perf_counter() - start_time
 
     def _execute_experiment(self):
         """After executing parent's :meth:`_execute_experiment`, fit :attr:`optimizer` with the set
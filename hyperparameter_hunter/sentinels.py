@@ -26,18 +26,21 @@ Related
     :meth:`hyperparameter_hunter.experiments.BaseExperiment.__init__`
 :mod:`hyperparameter_hunter.models`
     This is ultimately where `Sentinel` instances will be converted to the actual values that they
-    represent via calls to :func:`hyperparameter_hunter.sentinels.locate_sentinels`"""
+    represent via calls to :func:`hyperparameter_hunter.sentinels.resolve_sentinel_paths`, using the
+    paths found by :func:`hyperparameter_hunter.sentinels.find_sentinel_paths`"""
 ##################################################
 # Import Own Assets
 ##################################################
 from hyperparameter_hunter.data.data_core import BaseDataset
 from hyperparameter_hunter.settings import G
-from hyperparameter_hunter.utils.boltons_utils import remap
+from hyperparameter_hunter.utils.boltons_utils import default_enter, remap
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
 from abc import ABCMeta, abstractmethod
+from copy import copy
+from typing import List
 
 
 ##################################################
@@ -135,6 +138,88 @@ def locate_sentinels(parameters):
     return remap(parameters, visit=_sentinel_visitor)
 
 
+def find_sentinel_paths(parameters) -> List[tuple]:
+    """Find the location of each `Sentinel` in `parameters`, so they can later be resolved without
+    traversing all of `parameters` via :func:`resolve_sentinel_paths`
+
+    Parameters
+    ----------
+    parameters: Dict
+        Dict of parameters, which may contain nested `Sentinel` values
+
+    Returns
+    -------
+    List[tuple]
+        Paths to each `Sentinel` in `parameters`, in the tuple path format used by
+        :func:`~hyperparameter_hunter.utils.boltons_utils.remap`. Empty if there are no `Sentinel`s
+
+    Examples
+    --------
+    >>> find_sentinel_paths(dict(a=1, b=[2, 3]))
+    []"""
+    paths = []
+
+    def _visit(path, key, value):
+        if isinstance(value, Sentinel):
+            paths.append(path + (key,))
+        return True
+
+    def _enter(path, key, value):
+        # Tuples (namedtuples, especially) can't be built empty, but the copy is discarded anyway
+        if isinstance(value, tuple):
+            return [], enumerate(value)
+        return default_enter(path, key, value)
+
+    if len(G.sentinel_registry) > 0:
+        remap(parameters, visit=_visit, enter=_enter)
+    return paths
+
+
+def resolve_sentinel_paths(parameters, paths: List[tuple]):
+    """Produce a mirrored `parameters` dict, wherein the `Sentinel` values located at `paths` are
+    converted to the objects they represent. Only the containers along `paths` are copied
+
+    Parameters
+    ----------
+    parameters: Dict
+        Dict of parameters, which may contain nested `Sentinel` values
+    paths: List[tuple]
+        Paths to each `Sentinel` in `parameters`, as produced by :func:`find_sentinel_paths`
+
+    Returns
+    -------
+    Dict
+        Mirror of `parameters`, except where a `Sentinel` was found at one of `paths`, the value it
+        represents is returned instead
+
+    Examples
+    --------
+    >>> resolve_sentinel_paths(dict(a=1, b=[2, (3, 4)]), [])
+    {'a': 1, 'b': [2, (3, 4)]}"""
+    for path in paths:
+        parameters = _replace_at_path(parameters, path)
+    return parameters
+
+
+def _replace_at_path(container, path: tuple):
+    """Helper for :func:`resolve_sentinel_paths` to replace the `Sentinel` at `path` in a shallow
+    copy of `container` (and of each container between it and the `Sentinel`)"""
+    if len(path) == 0:
+        return container.retrieve_by_sentinel()
+
+    key, rest = path[0], path[1:]
+    value = _replace_at_path(container[key], rest)
+
+    if isinstance(container, tuple):
+        items = list(container)
+        items[key] = value
+        return type(container)(*items) if hasattr(container, "_fields") else tuple(items)
+
+    container = copy(container)
+    container[key] = value
+    return container
+
+
 ##################################################
 # Sentinel Classes
 ##################################################
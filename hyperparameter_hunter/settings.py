@@ -9,6 +9,11 @@ Related
 :mod:`hyperparameter_hunter.environment`
     This module sets :attr:`hyperparameter_hunter.settings.G.Env` to itself, creating the primary
     gateway used by other modules to access the active Environment's information"""
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.i_o.tracing import NULL_TRACER
+
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
@@ -25,9 +30,11 @@ ASSETS_EXPERIMENTS_DIRNAME = "Experiments"
 ASSETS_TESTED_KEYS_DIRNAME = "TestedKeys"
 ASSETS_KEY_ATTRIBUTE_LOOKUP_DIRNAME = "KeyAttributeLookup"
 ASSETS_LEADERBOARDS_DIRNAME = "Leaderboards"
+ASSETS_OPTIMIZERS_DIRNAME = "Optimizers"
 
 RESULT_FILE_SUB_DIR_PATHS = {
     #################### Experiments ####################
+    "callback_profile": "{}/CallbackProfiles".format(ASSETS_EXPERIMENTS_DIRNAME),
     "checkpoint": "{}/Checkpoints".format(ASSETS_EXPERIMENTS_DIRNAME),
     "description": "{}/Descriptions".format(ASSETS_EXPERIMENTS_DIRNAME),
     "heartbeat": "{}/Heartbeats".format(ASSETS_EXPERIMENTS_DIRNAME),
@@ -43,8 +50,11 @@ RESULT_FILE_SUB_DIR_PATHS = {
     #################### Leaderboards ####################
     "leaderboards": "{}".format(ASSETS_LEADERBOARDS_DIRNAME),
     "global_leaderboard": "{}/GlobalLeaderboard.csv".format(ASSETS_LEADERBOARDS_DIRNAME),
+    #################### Optimizers ####################
+    "optimizer_checkpoint": "{}/Checkpoints".format(ASSETS_OPTIMIZERS_DIRNAME),
     #################### Other ####################
     "current_heartbeat": "Heartbeat.log",
+    "traces": "Traces.jsonl",
     # 'analytics': '{}'.format(),
     # 'ensembles': '{}'.format(),
     # 'optimization_rounds': '{}'.format(),
@@ -110,6 +120,10 @@ class G(object):
         ...
     sentinel_registry: List
         ...
+    tracer: :class:`~hyperparameter_hunter.i_o.tracing.NullTracer`
+        Creates the spans recorded by OptPros and Experiments. This is set to a
+        :class:`~hyperparameter_hunter.i_o.tracing.Tracer` by :class:`environment.Environment` if
+        its `trace_spans` is True. Otherwise, it is a tracer that records nothing
     """
 
     Env = None
@@ -146,6 +160,7 @@ class G(object):
 
     import_hooks = []
     sentinel_registry = []
+    tracer = NULL_TRACER
 
     @classmethod
     def reset_attributes(cls):
@@ -154,3 +169,4 @@ class G(object):
         cls.log = print
         cls.debug = print
         cls.warn = warnings.warn
+        cls.tracer = NULL_TRACER
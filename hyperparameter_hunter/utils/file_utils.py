@@ -13,10 +13,17 @@ import numpy as np
 import os
 import os.path
 import pandas as pd
+import pickle
+from scipy import sparse
 import simplejson as json
 from typing import Union
 import wrapt
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 
 ##################################################
 # JSON File Functions
@@ -181,6 +188,107 @@ def add_to_json(file_path, data_to_add, key=None, condition=None, default=None,
         write_json(file_path, original_data)
 
 
+##################################################
+# Pickle File Functions
+##################################################
+def write_pickle(file_path, data):
+    """Write `data` to the pickle file specified by `file_path`. `data` is first written to a
+    temporary file, which then replaces `file_path`, so an interrupted write never leaves a
+    partially-written file at `file_path`
+
+    Parameters
+    ----------
+    file_path: String
+        The target .pkl file path to which `data` will be written
+    data: Object
+        The content to save at the .pkl file given by `file_path`. Must be picklable"""
+    temp_path = f"{file_path}.tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, file_path)
+    finally:
+        with suppress(FileNotFoundError):
+            os.remove(temp_path)
+
+
+def read_pickle(file_path):
+    """Get the contents of the pickle file located at `file_path`
+
+    Parameters
+    ----------
+    file_path: String
+        The path of the .pkl file to be read
+
+    Returns
+    -------
+    content: Object
+        The contents of the .pkl file located at `file_path`"""
+    with open(file_path, "rb") as f:
+        return pickle.load(f)
+
+
+##################################################
+# Dataset File Functions
+##################################################
+def read_dataset(file_path: str) -> pd.DataFrame:
+    """Read the dataset at `file_path` into a DataFrame, using the reader for its file extension.
+    Only the DataFrames of ".npy" files remain memory-mapped. Other formats are read into memory
+
+    Parameters
+    ----------
+    file_path: String
+        Path to a dataset file. The following extensions are recognized:
+
+        * ".parquet"/".pq": Read via :func:`pandas.read_parquet`. If `pyarrow` is installed, the
+          file is memory-mapped while it is converted to a DataFrame, which avoids buffering the
+          file, but the DataFrame's values are still copied into memory
+        * ".feather"/".ftr": Read via :func:`pandas.read_feather`, or via
+          `pyarrow.feather.read_table` on the memory-mapped file if `pyarrow` is installed. As with
+          Parquet, the DataFrame's values are copied into memory by `pyarrow.Table.to_pandas`
+        * ".npy": Two-dimensional array, memory-mapped in copy-on-write mode via :func:`numpy.load`.
+          The DataFrame reads its values directly from the file, and changes made to it are never
+          written back to the file. Columns are named by the fields of structured arrays, or else by
+          their integer positions. Structured arrays are read into memory
+        * ".npz": Sparse matrix saved by :func:`scipy.sparse.save_npz`. Read into a DataFrame of
+          sparse columns via :meth:`pandas.DataFrame.sparse.from_spmatrix`, without densifying
+        * Any other extension (like ".csv"): Read via :func:`pandas.read_csv`
+
+    Returns
+    -------
+    pd.DataFrame
+        Dataset read from `file_path`
+
+    Raises
+    ------
+    ValueError
+        If a ".npy" file does not contain a two-dimensional array, or a one-dimensional structured
+        array"""
+    extension = os.path.splitext(file_path)[1].lower()
+
+    if extension in (".parquet", ".pq"):
+        if pyarrow is not None:
+            return pd.read_parquet(file_path, engine="pyarrow", memory_map=True)
+        return pd.read_parquet(file_path)
+    elif extension in (".feather", ".ftr"):
+        if pyarrow is not None:
+            from pyarrow import feather
+
+            return feather.read_table(file_path, memory_map=True).to_pandas()
+        return pd.read_feather(file_path)
+    elif extension == ".npy":
+        values = np.load(file_path, mmap_mode="c")
+        if values.dtype.names is not None and values.ndim == 1:
+            return pd.DataFrame(np.asarray(values))
+        if values.ndim != 2:
+            raise ValueError(f"Expected 2-dimensional array in {file_path!r}, not {values.ndim}")
+        return pd.DataFrame(values, copy=False)
+    elif extension == ".npz":
+        return pd.DataFrame.sparse.from_spmatrix(sparse.load_npz(file_path))
+
+    return pd.read_csv(file_path)
+
+
 ##################################################
 # General File Functions
 ##################################################
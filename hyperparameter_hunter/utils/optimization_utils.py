@@ -195,6 +195,9 @@ def visit_feature_engineer(path, key, value):
     False
     >>> visit_feature_engineer(("feature_engineer", "steps"), "f", lambda _: _)  # pytest: +ELLIPSIS
     ('f', '...')
+    >>> steps_path = ("feature_engineer", "steps")
+    >>> visit_feature_engineer(steps_path, "fit", lambda _: _)  # pytest: +ELLIPSIS
+    ('fit', '...')
     >>> visit_feature_engineer(("feature_engineer", "steps"), "foo", lambda _: _)
     Traceback (most recent call last):
         File "optimization_utils.py", line ?, in visit_feature_engineer
@@ -211,9 +214,9 @@ def visit_feature_engineer(path, key, value):
         # Drop dataset hashes
         if key in ("datasets", "original_hashes", "updated_hashes") and isinstance(value, dict):
             return False
-        # Ensure `EngineerStep.f` is hashed
+        # Ensure `EngineerStep.f` and `EngineerStep.fit` are hashed
         with suppress(IndexError):
-            if path[1] == "steps" and key == "f" and callable(value):
+            if path[1] == "steps" and key in ("f", "fit") and callable(value):
                 return key, make_hash_sha256(value)
     raise ContinueRemap
 
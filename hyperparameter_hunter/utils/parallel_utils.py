@@ -0,0 +1,201 @@
+"""This module defines utilities for dividing the CPU cores available to HyperparameterHunter
+between outer workers (Experiments conducted in parallel, for example), and the threads used by the
+models fitted by each worker. Without such a division, models that each try to use every core,
+multiplied by the number of workers, oversubscribe the machine and drastically slow everything down
+
+Related
+-------
+:mod:`hyperparameter_hunter.environment`
+    :class:`~hyperparameter_hunter.environment.Environment` accepts the `cpu_budget` kwarg, which is
+    converted to a :class:`CPUBudget` available to all Experiments via `G.Env.cpu_budget`
+:mod:`hyperparameter_hunter.experiments`
+    Experiments use :attr:`hyperparameter_hunter.environment.Environment.cpu_budget` to set the
+    thread parameters of each run's model, and to limit BLAS threads while executing"""
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from contextlib import contextmanager, suppress
+from inspect import signature
+import os
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+##################################################
+# Global Variables
+##################################################
+THREAD_PARAMETERS = ("n_jobs", "nthread", "thread_count")
+BLAS_THREAD_VARIABLES = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+class CPUBudget(object):
+    def __init__(self, n_cores: int, n_workers: int = 1):
+        """Division of `n_cores` CPU cores between `n_workers` outer workers, each of which fits
+        models using :attr:`threads_per_worker` threads
+
+        Parameters
+        ----------
+        n_cores: Int
+            Number of CPU cores that may be used. If negative, follows the convention of `n_jobs` in
+            Scikit-learn/Joblib: -1 means all cores, -2 means all cores but one, and so on
+        n_workers: Int, default=1
+            Number of outer workers executing in parallel, between which `n_cores` are divided.
+            Capped at `n_cores`, so each worker has at least one thread
+
+        Attributes
+        ----------
+        threads_per_worker: Int
+            Number of threads each worker's model may use. At least 1
+
+        Examples
+        --------
+        >>> CPUBudget(8)
+        CPUBudget(n_cores=8, n_workers=1)
+        >>> CPUBudget(8).threads_per_worker
+        8
+        >>> CPUBudget(8, n_workers=3).threads_per_worker
+        2
+        >>> CPUBudget(2, n_workers=4)
+        CPUBudget(n_cores=2, n_workers=2)
+        >>> print(CPUBudget(8).split(4))
+        8 cores: 4 worker(s) x 2 model thread(s)
+        >>> CPUBudget(0)
+        Traceback (most recent call last):
+            ...
+        ValueError: `cpu_budget` must be a non-zero integer. Received: 0"""
+        if isinstance(n_cores, bool) or not isinstance(n_cores, int) or n_cores == 0:
+            raise ValueError(f"`cpu_budget` must be a non-zero integer. Received: {n_cores!r}")
+        if isinstance(n_workers, bool) or not isinstance(n_workers, int) or n_workers < 1:
+            raise ValueError(f"`n_workers` must be a positive integer. Received: {n_workers!r}")
+
+        if n_cores < 0:
+            n_cores = max(1, (os.cpu_count() or 1) + 1 + n_cores)
+
+        self.n_cores = n_cores
+        self.n_workers = min(n_workers, n_cores)
+        self.threads_per_worker = max(1, self.n_cores // self.n_workers)
+
+        self._initializer_parameters = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(n_cores={self.n_cores}, n_workers={self.n_workers})"
+
+    def __str__(self):
+        return "{} cores: {} worker(s) x {} model thread(s)".format(
+            self.n_cores, self.n_workers, self.threads_per_worker
+        )
+
+    def split(self, n_workers: int) -> "CPUBudget":
+        """Divide the budget's cores between `n_workers` outer workers
+
+        Parameters
+        ----------
+        n_workers: Int
+            Number of outer workers executing in parallel
+
+        Returns
+        -------
+        CPUBudget
+            New budget of the same number of cores, divided between `n_workers`"""
+        return CPUBudget(self.n_cores, n_workers=n_workers)
+
+    def inject(self, params: dict, model_initializer=None) -> dict:
+        """Set the thread parameters in `params` to :attr:`threads_per_worker`. Thread parameters
+        are those named in :data:`THREAD_PARAMETERS`. Each one in `params` with a value other than
+        None is set. If there are no such values, the first thread parameter in `params`, or in the
+        signature of `model_initializer`, is set. This avoids setting deprecated aliases, like
+        XGBoost's "nthread", alongside their replacements
+
+        Parameters
+        ----------
+        params: Dict
+            Initialization parameters for a model. Not modified
+        model_initializer: Callable, or None, default=None
+            The callable used to create an instance of some algorithm. Its signature is used to
+            find thread parameters that are absent from `params`
+
+        Returns
+        -------
+        Dict
+            Shallow copy of `params` with updated thread parameters
+
+        Examples
+        --------
+        >>> budget = CPUBudget(8, n_workers=2)
+        >>> budget.inject(dict(a=1, n_jobs=-1))
+        {'a': 1, 'n_jobs': 4}
+        >>> budget.inject(dict(n_jobs=1, nthread=None))
+        {'n_jobs': 4, 'nthread': None}
+        >>> budget.inject(dict(n_jobs=None, nthread=None))
+        {'n_jobs': 4, 'nthread': None}
+        >>> def cat_boost(depth=6, thread_count=-1):
+        ...     pass
+        >>> budget.inject(dict(depth=4), cat_boost)
+        {'depth': 4, 'thread_count': 4}
+        >>> budget.inject(dict(depth=4))
+        {'depth': 4}"""
+        params = dict(params)
+        names = [_ for _ in THREAD_PARAMETERS if params.get(_) is not None]
+
+        if not names:
+            accepted = self._get_initializer_parameters(model_initializer)
+            names = [_ for _ in THREAD_PARAMETERS if _ in params or _ in accepted][:1]
+
+        for name in names:
+            params[name] = self.threads_per_worker
+        return params
+
+    def _get_initializer_parameters(self, model_initializer) -> tuple:
+        """Helper for :meth:`inject` to retrieve the (cached) names of the parameters accepted by
+        `model_initializer`"""
+        if model_initializer is None:
+            return tuple()
+
+        with suppress(KeyError, TypeError):
+            return self._initializer_parameters[model_initializer]
+
+        try:
+            parameters = tuple(signature(model_initializer).parameters)
+        except (TypeError, ValueError):
+            parameters = tuple()
+
+        with suppress(TypeError):
+            self._initializer_parameters[model_initializer] = parameters
+        return parameters
+
+    @contextmanager
+    def limit_threads(self):
+        """Context manager to cap the threads used by BLAS/OpenMP libraries to
+        :attr:`threads_per_worker`. The environment variables in :data:`BLAS_THREAD_VARIABLES` are
+        set, which affects libraries loaded afterwards and any subprocesses started, such as
+        Joblib's workers. If `threadpoolctl` is installed, it is also used to limit the thread pools
+        of libraries that are already loaded. All limits are restored upon exit
+
+        Examples
+        --------
+        >>> with CPUBudget(3).limit_threads():
+        ...     os.environ["OMP_NUM_THREADS"]
+        '3'"""
+        original_variables = {_: os.environ.get(_) for _ in BLAS_THREAD_VARIABLES}
+        os.environ.update({_: str(self.threads_per_worker) for _ in BLAS_THREAD_VARIABLES})
+
+        try:
+            if threadpool_limits is not None:
+                with threadpool_limits(limits=self.threads_per_worker):
+                    yield self
+            else:
+                yield self
+        finally:
+            for name, value in original_variables.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
@@ -0,0 +1,191 @@
+"""This module tests the chunked execution of row-wise
+:class:`~hyperparameter_hunter.feature_engineering.EngineerStep`s by
+:class:`~hyperparameter_hunter.feature_engineering.FeatureEngineer`, alone and in Experiments"""
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter import Environment, CVExperiment, FeatureEngineer, EngineerStep
+from hyperparameter_hunter import Categorical
+from hyperparameter_hunter.i_o.exceptions import IncompatibleCandidateError
+from hyperparameter_hunter.i_o.result_reader import validate_fe_steps
+from hyperparameter_hunter.keys.hashing import make_hash_sha256
+from hyperparameter_hunter.utils.learning_utils import get_boston_data
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+import pytest
+
+##################################################
+# Import Learning Assets
+##################################################
+from sklearn.linear_model import Ridge
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+
+##################################################
+# Global Settings
+##################################################
+assets_dir = "hyperparameter_hunter/__TEST__HyperparameterHunterAssets__"
+
+
+##################################################
+# Engineer Step Functions
+##################################################
+def log_transform(all_inputs):
+    all_inputs = np.log1p(all_inputs.abs())
+    return all_inputs
+
+
+def fit_scaler(train_chunks):
+    scaler = StandardScaler()
+    for chunk in train_chunks:
+        scaler.partial_fit(chunk.values)
+    return scaler
+
+
+def fit_min_max_scaler(train_chunks):
+    scaler = MinMaxScaler()
+    for chunk in train_chunks:
+        scaler.partial_fit(chunk.values)
+    return scaler
+
+
+def fitted_scale(all_inputs, fit_state):
+    all_inputs[all_inputs.columns] = fit_state.transform(all_inputs.values)
+    return all_inputs
+
+
+def drop_first_row(all_inputs):
+    all_inputs = all_inputs.iloc[1:]
+    return all_inputs
+
+
+def two_dataset_step(train_inputs, non_train_inputs):
+    return train_inputs, non_train_inputs
+
+
+def _get_datasets():
+    data = get_boston_data()
+    inputs, targets = data.drop(columns=["DIS"]), data.loc[:, ["DIS"]]
+    return dict(
+        train_inputs=inputs.iloc[:300],
+        train_targets=targets.iloc[:300],
+        holdout_inputs=inputs.iloc[300:400],
+        holdout_targets=targets.iloc[300:400],
+        test_inputs=inputs.iloc[400:],
+    )
+
+
+def _is_memory_mapped(values: np.ndarray) -> bool:
+    while values is not None:
+        if isinstance(values, np.memmap):
+            return True
+        values = values.base
+    return False
+
+
+def _row_wise_steps():
+    return [
+        EngineerStep(log_transform, stage="pre_cv", row_wise=True),
+        EngineerStep(fitted_scale, stage="pre_cv", row_wise=True, fit=fit_scaler),
+    ]
+
+
+##################################################
+# FeatureEngineer Tests
+##################################################
+@pytest.mark.parametrize("chunk_size", [1, 7, 300, 1000])
+def test_chunked_matches_whole(chunk_size, tmpdir):
+    """Test that row-wise steps produce the same datasets when executed on row chunks, and that
+    the results are memory-mapped from files in `store_dir`"""
+    fe_whole = FeatureEngineer(_row_wise_steps())
+    fe_chunked = FeatureEngineer(_row_wise_steps(), chunk_size=chunk_size, store_dir=str(tmpdir))
+    fe_whole("pre_cv", **_get_datasets())
+    fe_chunked("pre_cv", **_get_datasets())
+
+    for name in ["train_inputs", "holdout_inputs", "test_inputs", "train_targets"]:
+        assert_frame_equal(fe_chunked.datasets[name], fe_whole.datasets[name])
+
+    for name in ["train_inputs", "holdout_inputs", "test_inputs"]:
+        assert _is_memory_mapped(fe_chunked.datasets[name].values)
+    assert not _is_memory_mapped(fe_whole.datasets["train_inputs"].values)
+
+    scaler = fe_chunked.steps[1].fit_state
+    assert np.allclose(scaler.mean_, fe_whole.steps[1].fit_state.mean_)
+
+
+def test_chunking_does_not_affect_key():
+    """Test that `chunk_size` and `store_dir` do not affect the `FeatureEngineer`'s key data"""
+    fe_whole = FeatureEngineer(_row_wise_steps())
+    fe_chunked = FeatureEngineer(_row_wise_steps(), chunk_size=10)
+    assert fe_whole == fe_chunked
+    assert fe_whole.get_key_data() == fe_chunked.get_key_data()
+
+
+def _saved_step_dict(step: EngineerStep) -> dict:
+    """Mimic the `step` dict of a saved Experiment description, in which callables are hashed"""
+    step_dict = step.get_key_data()
+    step_dict["f"] = make_hash_sha256(step_dict["f"])
+    step_dict["fit"] = make_hash_sha256(step_dict["fit"])
+    return step_dict
+
+
+def test_fit_distinguishes_steps():
+    """Test that steps differing only in `fit` are unequal, and are not matched to saved steps"""
+    es_0 = EngineerStep(fitted_scale, stage="pre_cv", row_wise=True, fit=fit_scaler)
+    es_1 = EngineerStep(fitted_scale, stage="pre_cv", row_wise=True, fit=fit_min_max_scaler)
+    assert es_0 != es_1
+    assert es_0.stringify() != es_1.stringify()
+    assert es_0 == _saved_step_dict(es_0)
+    assert es_0 != _saved_step_dict(es_1)
+
+    with pytest.raises(IncompatibleCandidateError):
+        validate_fe_steps([_saved_step_dict(es_1)], [es_0])
+    assert validate_fe_steps([_saved_step_dict(es_1)], [Categorical([es_0, es_1])]) == [es_1]
+    with pytest.raises(ValueError, match="`step_dict` could not be found in `dimension`"):
+        EngineerStep.honorary_step_from_dict(_saved_step_dict(es_1), Categorical([es_0]))
+
+
+def test_row_wise_row_count_error():
+    fe = FeatureEngineer([EngineerStep(drop_first_row, row_wise=True)], chunk_size=50)
+    with pytest.raises(ValueError, match="must return one row for each row given"):
+        fe("pre_cv", **_get_datasets())
+
+
+def test_row_wise_param_errors():
+    with pytest.raises(ValueError, match="Row-wise steps must request a single dataset"):
+        EngineerStep(two_dataset_step, row_wise=True)
+    with pytest.raises(ValueError, match="`fit` may only be given for row-wise steps"):
+        EngineerStep(log_transform, fit=fit_scaler)
+
+
+##################################################
+# Experiment Tests
+##################################################
+@pytest.fixture()
+def env_boston_holdout():
+    return Environment(
+        train_dataset=get_boston_data().iloc[:400],
+        results_path=assets_dir,
+        target_column="DIS",
+        metrics=["r2_score"],
+        holdout_dataset=get_boston_data().iloc[400:],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=1),
+    )
+
+
+def test_chunked_experiment(env_boston_holdout):
+    """Test that Experiments using chunked row-wise steps have the same key and results as those
+    executing the steps on whole datasets"""
+    exp_0 = CVExperiment(Ridge, {}, feature_engineer=FeatureEngineer(_row_wise_steps()))
+    exp_1 = CVExperiment(
+        Ridge, {}, feature_engineer=FeatureEngineer(_row_wise_steps(), chunk_size=64)
+    )
+    assert exp_0.hyperparameter_key.key == exp_1.hyperparameter_key.key
+    for dataset, evaluations in exp_0.last_evaluation_results.items():
+        for metric, value in (evaluations or {}).items():
+            assert exp_1.last_evaluation_results[dataset][metric] == pytest.approx(value)
@@ -0,0 +1,196 @@
+"""This module tests the concurrent execution of independent
+:class:`~hyperparameter_hunter.feature_engineering.EngineerStep`s by
+:class:`~hyperparameter_hunter.feature_engineering.FeatureEngineer` via its `n_jobs` kwarg"""
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter import Environment, CVExperiment, FeatureEngineer, EngineerStep
+from hyperparameter_hunter import feature_engineering
+from hyperparameter_hunter.feature_engineering import get_step_waves
+from hyperparameter_hunter.utils.learning_utils import get_boston_data
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+import numpy as np
+import os
+from pandas.testing import assert_frame_equal
+import pytest
+from threading import Barrier
+
+##################################################
+# Import Learning Assets
+##################################################
+from sklearn.linear_model import Ridge
+from sklearn.preprocessing import StandardScaler
+
+##################################################
+# Global Settings
+##################################################
+assets_dir = "hyperparameter_hunter/__TEST__HyperparameterHunterAssets__"
+barrier = Barrier(2, timeout=10)
+
+
+##################################################
+# Engineer Step Functions
+##################################################
+def square_inputs(all_inputs):
+    all_inputs = all_inputs ** 2
+    return all_inputs
+
+
+def standard_scale(train_inputs, non_train_inputs):
+    scaler = StandardScaler()
+    train_inputs[train_inputs.columns] = scaler.fit_transform(train_inputs.values)
+    non_train_inputs[train_inputs.columns] = scaler.transform(non_train_inputs.values)
+    return train_inputs, non_train_inputs
+
+
+def log_targets(all_targets):
+    all_targets = np.log1p(all_targets)
+    return all_targets
+
+
+def waiting_inputs(all_inputs):
+    barrier.wait()
+    return all_inputs
+
+
+def waiting_targets(all_targets):
+    barrier.wait()
+    return all_targets
+
+
+def omp_threads_inputs(all_inputs):
+    omp_threads.append(os.environ.get("OMP_NUM_THREADS"))
+    return all_inputs
+
+
+def omp_threads_targets(all_targets):
+    omp_threads.append(os.environ.get("OMP_NUM_THREADS"))
+    return all_targets
+
+
+omp_threads = []
+
+
+def _get_datasets():
+    data = get_boston_data()
+    inputs, targets = data.drop(columns=["DIS"]), data.loc[:, ["DIS"]]
+    return dict(
+        train_inputs=inputs.iloc[:300],
+        train_targets=targets.iloc[:300],
+        validation_inputs=inputs.iloc[300:400],
+        validation_targets=targets.iloc[300:400],
+        test_inputs=inputs.iloc[400:],
+    )
+
+
+def _steps():
+    return [square_inputs, log_targets, standard_scale]
+
+
+def _intra_cv_steps(steps):
+    """Execute `steps` during the "intra_cv" stage, which gives them the datasets of
+    `_get_datasets`"""
+    return [EngineerStep(_, stage="intra_cv") for _ in steps]
+
+
+##################################################
+# `get_step_waves` Tests
+##################################################
+def test_get_step_waves():
+    steps = _intra_cv_steps(_steps())
+    assert get_step_waves(steps) == [steps[:2], steps[2:]]
+
+
+def test_get_step_waves_repeated():
+    """Test that each step is placed in the wave after its last dependency, and that repeated steps
+    depend on each other"""
+    steps = [
+        EngineerStep(square_inputs, stage="pre_cv"),
+        EngineerStep(log_targets, stage="pre_cv"),
+        EngineerStep(standard_scale, stage="pre_cv"),
+        EngineerStep(log_targets, stage="pre_cv"),
+    ]
+    assert get_step_waves(steps) == [steps[:2], steps[2:]]
+
+
+##################################################
+# FeatureEngineer Tests
+##################################################
+@pytest.mark.parametrize("n_jobs", [2, -1])
+def test_parallel_matches_sequential(n_jobs):
+    fe_sequential = FeatureEngineer(_intra_cv_steps(_steps()))
+    fe_parallel = FeatureEngineer(_intra_cv_steps(_steps()), n_jobs=n_jobs)
+    fe_sequential("intra_cv", **_get_datasets())
+    fe_parallel("intra_cv", **_get_datasets())
+
+    for name, df in fe_sequential.datasets.items():
+        if name in _get_datasets():
+            assert_frame_equal(fe_parallel.datasets[name], df)
+    assert fe_sequential == fe_parallel
+
+
+def test_independent_steps_run_concurrently():
+    """Test that independent steps run at the same time. Each waits for the other to start, which
+    would raise `BrokenBarrierError` if they were executed sequentially"""
+    fe = FeatureEngineer(_intra_cv_steps([waiting_inputs, waiting_targets]), n_jobs=2)
+    fe("intra_cv", **_get_datasets())
+    assert not barrier.broken
+
+
+##################################################
+# Experiment Tests
+##################################################
+@pytest.fixture()
+def env_boston():
+    return Environment(
+        train_dataset=get_boston_data(),
+        results_path=assets_dir,
+        target_column="DIS",
+        metrics=["r2_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=1),
+    )
+
+
+@pytest.fixture()
+def env_boston_budget():
+    return Environment(
+        train_dataset=get_boston_data(),
+        results_path=assets_dir,
+        target_column="DIS",
+        metrics=["r2_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=1),
+        cpu_budget=2,
+    )
+
+
+def test_n_jobs_respects_cpu_budget(env_boston_budget, monkeypatch):
+    """Test that `n_jobs=-1` uses no more workers than the cores of a constrained `cpu_budget`, and
+    that steps executed concurrently divide those cores between their BLAS/OpenMP threads"""
+    pool_sizes = []
+
+    class RecordingExecutor(feature_engineering.ThreadPoolExecutor):
+        def __init__(self, max_workers=None, **kwargs):
+            pool_sizes.append(max_workers)
+            super().__init__(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(feature_engineering, "ThreadPoolExecutor", RecordingExecutor)
+    omp_threads.clear()
+
+    fe = FeatureEngineer(_intra_cv_steps([omp_threads_inputs, omp_threads_targets]), n_jobs=-1)
+    fe("intra_cv", **_get_datasets())
+    assert pool_sizes == [2]
+    assert omp_threads == ["1", "1"]
+
+
+def test_parallel_experiment(env_boston):
+    """Test that Experiments executing steps in parallel have the same key and results as those
+    executing steps sequentially"""
+    exp_0 = CVExperiment(Ridge, {}, feature_engineer=FeatureEngineer(_steps()))
+    exp_1 = CVExperiment(Ridge, {}, feature_engineer=FeatureEngineer(_steps(), n_jobs=3))
+    assert exp_0.hyperparameter_key.key == exp_1.hyperparameter_key.key
+    assert exp_0.last_evaluation_results == exp_1.last_evaluation_results
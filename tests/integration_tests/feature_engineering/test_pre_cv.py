@@ -395,6 +395,59 @@ def test_feature_engineer_experiment(toy_environment_fixture, prepped_experiment
     assert_frame_equal(prepped_experiment.data_holdout.target.T.d, end_data[3], check_dtype=False)
 
 
+def add_one(train_inputs, holdout_inputs):
+    train_inputs, holdout_inputs = train_inputs + 1, holdout_inputs + 1
+    return train_inputs, holdout_inputs
+
+
+set_nan_calls = []
+
+
+def counted_set_nan(train_inputs, holdout_inputs):
+    set_nan_calls.append(1)
+    train_inputs, holdout_inputs = set_nan_0(train_inputs, holdout_inputs)
+    return train_inputs, holdout_inputs
+
+
+#################### Copy-on-Write Handoff ####################
+@pytest.mark.parametrize(
+    "prepped_experiment",
+    [
+        [add_one],
+        [EngineerStep(add_one, in_place=False)],
+        [set_nan_0],
+        [EngineerStep(set_nan_0, in_place=True)],
+        [set_nan_0, EngineerStep(add_one, in_place=False), standard_scale_0],
+    ],
+    indirect=True,
+)
+def test_pre_cv_copy_on_write(toy_environment_fixture, prepped_experiment):
+    """Test that pre-CV steps can't modify the original datasets, whether they are given read-only
+    views (if declared with `in_place=False`), or copies"""
+    train_dataset, holdout_dataset = holdout_first_row(pima_indians_head, "class")
+    assert_frame_equal(prepped_experiment.data_train.input.d, train_dataset.drop(columns="class"))
+    assert_frame_equal(
+        prepped_experiment.data_holdout.input.d, holdout_dataset.drop(columns="class")
+    )
+
+
+def test_pre_cv_in_place_error(toy_environment_fixture):
+    """Test that a step declared with `in_place=False` that modifies its read-only datasets raises
+    on its first call, rather than being called again with copies, which would repeat its effects"""
+    set_nan_calls.clear()
+    experiment = CVExperiment(
+        model_initializer=AdaBoostClassifier,
+        model_init_params=dict(),
+        feature_engineer=FeatureEngineer([EngineerStep(counted_set_nan, in_place=False)]),
+        auto_start=False,
+    )
+    experiment.preparation_workflow()
+
+    with pytest.raises(ValueError, match="Declare it with `in_place=True` to give it copies"):
+        experiment.on_exp_start()
+    assert set_nan_calls == [1]
+
+
 @pytest.mark.parametrize(
     "experiment_fixture", [[standard_scale_1], [standard_scale_2]], indirect=True
 )
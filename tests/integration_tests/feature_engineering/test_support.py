@@ -6,6 +6,7 @@
 ##################################################
 from hyperparameter_hunter import Environment, CVExperiment, FeatureEngineer, EngineerStep
 from hyperparameter_hunter import Categorical, GBRT
+from hyperparameter_hunter import feature_engineering
 from hyperparameter_hunter.utils.learning_utils import get_boston_data
 
 ##################################################
@@ -95,6 +96,48 @@ def test_do_not_validate(env_boston):
         assert step.updated_hashes == {}
 
 
+def negate_targets(train_targets, non_train_targets):
+    train_targets, non_train_targets = -train_targets, -non_train_targets
+    return train_targets, non_train_targets
+
+
+def test_do_validate_hash_cache(monkeypatch):
+    """Test that validated steps only rehash the datasets they were given, reusing the hashes of
+    other datasets, and that datasets modified in place are still rehashed"""
+    data = get_boston_data()
+    inputs, targets = data.drop(columns=["DIS"]), data.loc[:, ["DIS"]]
+    datasets = dict(
+        train_inputs=inputs.iloc[:300],
+        train_targets=targets.iloc[:300],
+        validation_inputs=inputs.iloc[300:400],
+        validation_targets=targets.iloc[300:400],
+        holdout_inputs=inputs.iloc[400:450],
+        holdout_targets=targets.iloc[400:450],
+        test_inputs=inputs.iloc[450:],
+    )
+    datasets = {k: v.copy() for k, v in datasets.items()}
+
+    hashed = []
+    _hash_dataset = feature_engineering._hash_dataset
+    monkeypatch.setattr(
+        feature_engineering, "_hash_dataset", lambda _: hashed.append(_) or _hash_dataset(_)
+    )
+
+    fe = FeatureEngineer([standard_scale, negate_targets], do_validate=True)
+    fe("intra_cv", **datasets)
+    step_0, step_1 = fe.steps
+
+    # Each dataset is hashed before the first step, then after each step that was given it. The
+    # ... merged "non_train_*" datasets returned by each step are also hashed
+    assert len(hashed) == len(datasets) + (4 + 1) + (3 + 1)
+    assert step_0.updated_hashes["train_inputs"] != step_0.original_hashes["train_inputs"]
+    assert step_1.original_hashes == step_0.updated_hashes
+    assert step_1.updated_hashes["train_inputs"] is step_0.updated_hashes["train_inputs"]
+    assert step_1.updated_hashes["train_targets"] != step_1.original_hashes["train_targets"]
+    assert step_1.updated_hashes == feature_engineering.hash_datasets(fe.datasets)
+    assert all(_.hash_cache is None for _ in fe.steps)
+
+
 ##################################################
 # `FeatureEngineer.inverse_transform` TypeError Tests
 ##################################################
@@ -0,0 +1,131 @@
+"""This module tests Experiments on sparse datasets, given to
+:class:`~hyperparameter_hunter.environment.Environment` as `scipy.sparse` matrices, or as DataFrames
+of sparse columns, ensuring the inputs given to models are never densified"""
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter import Environment, CVExperiment, FeatureEngineer, EngineerStep
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import sparse
+
+##################################################
+# Import Learning Assets
+##################################################
+from sklearn.linear_model import LogisticRegression
+
+##################################################
+# Global Settings
+##################################################
+assets_dir = "hyperparameter_hunter/__TEST__HyperparameterHunterAssets__"
+SEEN_INPUTS = []
+
+
+##################################################
+# Dummy Objects for Testing
+##################################################
+class RecordingClassifier(LogisticRegression):
+    """`LogisticRegression` that records the type of input data given to `fit` and `predict`"""
+
+    def fit(self, X, y, sample_weight=None):
+        SEEN_INPUTS.append(("fit", type(X)))
+        return super().fit(X, y, sample_weight=sample_weight)
+
+    def predict(self, X):
+        SEEN_INPUTS.append(("predict", type(X)))
+        return super().predict(X)
+
+
+def double_and_drop_first(all_inputs):
+    all_inputs = all_inputs.drop(columns=["f0"]) * 2
+    return all_inputs
+
+
+def _get_sparse_data(n_rows=90, n_columns=12):
+    rng = np.random.RandomState(32)
+    inputs = sparse.random(n_rows, n_columns, density=0.2, format="csr", random_state=rng)
+    targets = (np.asarray(inputs.sum(axis=1)).ravel() > 1).astype(int)
+    return inputs, targets
+
+
+@pytest.fixture()
+def sparse_matrix_env():
+    inputs, targets = _get_sparse_data()
+    return Environment(
+        train_dataset=sparse.hstack([inputs, targets[:, None]], format="csr"),
+        results_path=assets_dir,
+        target_column=[inputs.shape[1]],
+        metrics=["accuracy_score"],
+        cv_type="StratifiedKFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+    )
+
+
+@pytest.fixture()
+def sparse_frame_env():
+    inputs, targets = _get_sparse_data()
+    columns = [f"f{_}" for _ in range(inputs.shape[1])]
+    train_dataset = pd.DataFrame.sparse.from_spmatrix(inputs, columns=columns)
+    train_dataset["target"] = targets
+    return Environment(
+        train_dataset=train_dataset.iloc[:60],
+        holdout_dataset=train_dataset.iloc[60:],
+        results_path=assets_dir,
+        target_column="target",
+        metrics=["accuracy_score"],
+        cv_type="StratifiedKFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+    )
+
+
+##################################################
+# Sparse Dataset Tests
+##################################################
+def test_sparse_matrix_dataset(sparse_matrix_env):
+    """Test that a sparse matrix becomes a sparse DataFrame, whose inputs are given to the model as
+    CSR matrices, and whose dense targets are evaluated as usual"""
+    assert all(isinstance(_, pd.SparseDtype) for _ in sparse_matrix_env.train_dataset.dtypes)
+
+    SEEN_INPUTS.clear()
+    exp = CVExperiment(RecordingClassifier, dict(solver="lbfgs"))
+
+    assert 0 <= exp.last_evaluation_results["oof"]["accuracy_score"] <= 1
+    assert {_[0] for _ in SEEN_INPUTS} == {"fit", "predict"}
+    assert all(_[1] is sparse.csr_matrix for _ in SEEN_INPUTS)
+
+    assert not any(isinstance(_, pd.SparseDtype) for _ in exp.data_train.target.d.dtypes)
+
+
+def test_sparse_matrix_dataset_key(sparse_matrix_env):
+    """Test that equal sparse datasets produce the same cross-experiment key"""
+    inputs, targets = _get_sparse_data()
+    env = Environment(
+        train_dataset=sparse.hstack([inputs, targets[:, None]], format="csr"),
+        results_path=assets_dir,
+        target_column=[inputs.shape[1]],
+        metrics=["accuracy_score"],
+        cv_type="StratifiedKFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+    )
+    assert env.cross_experiment_key == sparse_matrix_env.cross_experiment_key
+
+
+def test_sparse_frame_feature_engineering(sparse_frame_env):
+    """Test that sparse columns stay sparse through feature engineering, and that the holdout
+    dataset is also given to the model as a CSR matrix"""
+    SEEN_INPUTS.clear()
+    exp = CVExperiment(
+        RecordingClassifier,
+        dict(solver="lbfgs"),
+        feature_engineer=FeatureEngineer([EngineerStep(double_and_drop_first)]),
+    )
+
+    assert "holdout" in exp.last_evaluation_results
+    assert all(_[1] is sparse.csr_matrix for _ in SEEN_INPUTS)
+    assert "f0" not in exp.data_train.input.T.d.columns
+    assert all(isinstance(_, pd.SparseDtype) for _ in exp.data_train.input.T.d.dtypes)
@@ -0,0 +1,195 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter import Environment, CVExperiment, lambda_callback
+from hyperparameter_hunter.callbacks import aggregators
+from hyperparameter_hunter.callbacks.aggregators import get_peak_rss
+from hyperparameter_hunter.utils.file_utils import read_json
+from hyperparameter_hunter.utils.learning_utils import get_toy_classification_data
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from os.path import exists
+import numpy as np
+import pandas as pd
+import pytest
+import tracemalloc
+
+##################################################
+# Import Learning Assets
+##################################################
+from sklearn.dummy import DummyClassifier
+from sklearn.linear_model import LogisticRegression
+
+##################################################
+# Global Settings
+##################################################
+HELD_MEMORY = []
+PROCESS_PEAK = dict(rss=100.0, fits=0, resets=[])
+
+
+##################################################
+# Dummy Objects for Testing
+##################################################
+class PeakingClassifier(DummyClassifier):
+    """`DummyClassifier` that raises the peak RSS of the process in `PROCESS_PEAK` in its third
+    call to `fit`, which is the first run of the second fold"""
+
+    def fit(self, X, y, sample_weight=None):
+        PROCESS_PEAK["fits"] += 1
+        if PROCESS_PEAK["fits"] == 3:
+            PROCESS_PEAK["rss"] = 200.0
+        return super().fit(X, y, sample_weight=sample_weight)
+
+
+def get_process_peak(reset=False):
+    """Stand-in for :func:`get_peak_rss`, which reports the peak RSS in `PROCESS_PEAK`"""
+    PROCESS_PEAK["resets"].append(reset)
+    return PROCESS_PEAK["rss"]
+
+
+##################################################
+# `AggregatorEvaluations` Tests
+##################################################
+@pytest.fixture()
+def env_repeated(tmpdir):
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=str(tmpdir),
+        metrics=["roc_auc_score"],
+        cv_type="RepeatedKFold",
+        cv_params=dict(n_splits=3, n_repeats=2, random_state=32),
+        runs=2,
+    )
+
+
+def test_evaluation_aggregates(tmpdir, env_repeated):
+    """Test that evaluations are set in preallocated arrays as each division of each repetition
+    ends, and that they are saved to the Experiment's description as nested lists"""
+    n_splits, n_repeats = env_repeated.cv_params["n_splits"], env_repeated.cv_params["n_repeats"]
+    runs = env_repeated.runs
+    seen_runs = []
+
+    def _on_run_end(stat_aggregates, last_evaluation_results, _rep, _fold, _run):
+        runs = stat_aggregates["evaluations"]["oof_roc_auc_score"]["runs"]
+        assert runs[_rep, _fold, _run] == last_evaluation_results["oof"]["roc_auc_score"]
+        seen_runs.append(np.isnan(runs).sum())
+
+    exp = CVExperiment(
+        LogisticRegression,
+        dict(solver="lbfgs"),
+        callbacks=[lambda_callback(on_run_end=_on_run_end)],
+    )
+    evaluations = exp.stat_aggregates["evaluations"]["oof_roc_auc_score"]
+
+    assert seen_runs == list(range(n_repeats * n_splits * runs - 1, -1, -1))
+    assert evaluations["runs"].shape == (n_repeats, n_splits, runs)
+    assert evaluations["folds"].shape == (n_repeats, n_splits)
+    assert evaluations["reps"].shape == (n_repeats,)
+    assert evaluations["final"] == exp.last_evaluation_results["oof"]["roc_auc_score"]
+    assert not np.isnan(evaluations["folds"]).any()
+    assert evaluations["reps"][0] != evaluations["reps"][1]
+
+    description = read_json(
+        tmpdir.join(
+            "HyperparameterHunterAssets", "Experiments", "Descriptions", f"{exp.experiment_id}.json"
+        )
+    )
+    saved = description["aggregates"]["evaluations"]["oof_roc_auc_score"]
+    assert saved["runs"] == evaluations["runs"].tolist()
+    assert saved["folds"] == evaluations["folds"].tolist()
+    assert isinstance(evaluations["runs"], np.ndarray)
+
+
+##################################################
+# `AggregatorMemory` Tests
+##################################################
+@pytest.fixture()
+def env_memory(request, tmpdir):
+    """`Environment` tracking memory as given by `request.param`, or not at all by default"""
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=str(tmpdir),
+        metrics=["roc_auc_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+        runs=2,
+        track_memory=getattr(request, "param", False),
+    )
+
+
+@pytest.mark.skipif(
+    not exists("/proc/self/clear_refs"), reason="Peak RSS can only be reset on Linux"
+)
+@pytest.mark.parametrize("env_memory", ["reset_rss"], indirect=True)
+def test_memory_aggregates(tmpdir, env_memory):
+    """Test that peak RSS is recorded for each division if it is reset, and added to the
+    leaderboard"""
+    n_splits, runs = env_memory.cv_params["n_splits"], env_memory.runs
+    exp = CVExperiment(LogisticRegression, dict(solver="lbfgs"))
+    rss = exp.stat_aggregates["memory"]["rss"]
+
+    assert set(exp.stat_aggregates["memory"]) == {"rss"}
+    assert np.shape(rss["runs"]) == (1, n_splits, runs)
+    assert np.shape(rss["folds"]) == (1, n_splits)
+    assert len(rss["reps"]) == 1
+    assert 0 < max(max(_) for _ in rss["folds"]) <= rss["final"]
+    assert all(run <= fold for runs, fold in zip(rss["runs"][0], rss["folds"][0]) for run in runs)
+
+    leaderboard = pd.read_csv(
+        tmpdir.join("HyperparameterHunterAssets", "Leaderboards", "GlobalLeaderboard.csv")
+    )
+    assert leaderboard["peak_rss_mib"].iloc[0] == pytest.approx(rss["final"])
+
+
+@pytest.mark.parametrize("env_memory", [True], indirect=True)
+def test_memory_aggregates_without_reset(monkeypatch, env_memory):
+    """Test that the peak RSS of the process is not reset by default, so the peak of a division is
+    only recorded if the process reached a new peak during it, and is None otherwise"""
+    PROCESS_PEAK.update(rss=100.0, fits=0, resets=[])
+    monkeypatch.setattr(aggregators, "get_peak_rss", get_process_peak)
+    exp = CVExperiment(PeakingClassifier, dict(strategy="prior"))
+    rss = exp.stat_aggregates["memory"]["rss"]
+
+    assert PROCESS_PEAK["resets"] and not any(PROCESS_PEAK["resets"])
+    assert rss["runs"] == [[[None, None], [200.0, None], [None, None]]]
+    assert rss["folds"] == [[None, 200.0, None]]
+    assert rss["reps"] == [200.0]
+    assert rss["final"] == 200.0
+
+
+@pytest.mark.parametrize("env_memory", ["tracemalloc"], indirect=True)
+def test_memory_aggregates_tracemalloc(env_memory):
+    """Test that memory allocated during a fold counts toward the tracemalloc peaks of the fold, its
+    repetition, and the Experiment, and that tracing stops with the Experiment"""
+    HELD_MEMORY.clear()
+    exp = CVExperiment(
+        LogisticRegression,
+        dict(solver="lbfgs"),
+        callbacks=[lambda_callback(on_fold_start=lambda: HELD_MEMORY.append(bytearray(2 ** 23)))],
+    )
+    traced = exp.stat_aggregates["memory"]["tracemalloc"]
+    HELD_MEMORY.clear()
+
+    assert all(_ >= 8 for _ in traced["folds"][0])
+    assert traced["reps"][0] >= 8 and traced["final"] >= 8
+    assert not tracemalloc.is_tracing()
+
+
+def test_memory_aggregates_disabled(env_memory):
+    """Test that memory is not tracked by default"""
+    exp = CVExperiment(LogisticRegression, dict(solver="lbfgs"))
+    assert "memory" not in exp.stat_aggregates
+
+
+@pytest.mark.skipif(
+    not exists("/proc/self/clear_refs"), reason="Peak RSS can only be reset on Linux"
+)
+def test_get_peak_rss_reset():
+    """Test that resetting the peak RSS forgets memory that has since been freed"""
+    allocation = bytearray(2 ** 26)
+    allocation[:: 2 ** 12] = b"x" * len(allocation[:: 2 ** 12])  # Touch pages so they are resident
+    del allocation
+    peak = get_peak_rss(reset=True)
+    assert get_peak_rss() < peak - 32
@@ -0,0 +1,181 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter import Environment, CVExperiment, lambda_callback
+from hyperparameter_hunter.utils.file_utils import read_json
+from hyperparameter_hunter.utils.learning_utils import get_toy_classification_data
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+import pandas as pd
+from time import sleep
+import pytest
+
+##################################################
+# Import Learning Assets
+##################################################
+from sklearn.dummy import DummyClassifier
+from sklearn.linear_model import LogisticRegression
+
+##################################################
+# Global Settings
+##################################################
+SLEEP = 0.01
+
+
+##################################################
+# Dummy Objects for Testing
+##################################################
+class SlowClassifier(DummyClassifier):
+    """`DummyClassifier` that sleeps for `SLEEP` seconds in `fit`"""
+
+    def fit(self, X, y, sample_weight=None):
+        sleep(SLEEP)
+        return super().fit(X, y, sample_weight=sample_weight)
+
+
+##################################################
+# Fixtures
+##################################################
+@pytest.fixture()
+def env_profiled(tmpdir):
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=str(tmpdir),
+        metrics=["roc_auc_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+        runs=2,
+        profile_callbacks=True,
+    )
+
+
+@pytest.fixture()
+def profiled_experiment(env_profiled):
+    return CVExperiment(
+        LogisticRegression,
+        dict(solver="lbfgs"),
+        callbacks=[
+            lambda_callback(on_run_end=lambda: sleep(SLEEP)),
+            lambda_callback(on_fold_end=lambda: None),
+        ],
+    )
+
+
+##################################################
+# Callback Profiler Tests
+##################################################
+def test_callback_profile_aggregates(profiled_experiment):
+    """Test that the slow callback is found, and that exclusive times add up to the inclusive time
+    of the Experiment's own division methods"""
+    profile = profiled_experiment.stat_aggregates["callback_profile"]
+    n_runs = (
+        profiled_experiment.cv_params["n_splits"] * profiled_experiment.experiment_params["runs"]
+    )
+
+    assert {"CVExperiment", "LambdaCallback", "LambdaCallback[1]", "PredictorOOF"} <= set(profile)
+    assert profile["CVExperiment"]["on_run_end"]["calls"] == n_runs
+    assert profile["CVExperiment"]["on_exp_start"]["calls"] == 1
+
+    slow = profile["LambdaCallback"]["on_run_end"]
+    assert slow["exclusive"] >= n_runs * SLEEP
+    assert profile["LambdaCallback[1]"]["on_run_end"]["exclusive"] < slow["exclusive"]
+
+    for method, total in profile["CVExperiment"].items():
+        exclusive = sum(_[method]["exclusive"] for _ in profile.values() if method in _)
+        assert exclusive == pytest.approx(total["inclusive"])
+
+
+def test_callback_profile_trace(tmpdir, profiled_experiment):
+    """Test that a Chrome trace with one complete event per profiled call is saved"""
+    trace = read_json(
+        tmpdir.join(
+            "HyperparameterHunterAssets",
+            "Experiments",
+            "CallbackProfiles",
+            f"{profiled_experiment.experiment_id}.json",
+        )
+    )
+    summary = profiled_experiment.stat_aggregates["callback_profile"]
+    n_calls = sum(_["calls"] for methods in summary.values() for _ in methods.values())
+
+    assert len(trace["traceEvents"]) == n_calls
+    assert {_["ph"] for _ in trace["traceEvents"]} == {"X"}
+    assert trace["otherData"]["summary"] == summary
+
+
+def test_callback_profile_disabled(tmpdir, profiled_experiment):
+    """Test that Experiments are not profiled by default, and that profiling does not change
+    their results"""
+    Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=str(tmpdir.join("unprofiled")),
+        metrics=["roc_auc_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+        runs=2,
+    )
+    exp = CVExperiment(LogisticRegression, dict(solver="lbfgs"))
+
+    assert exp.callback_profiler is None
+    assert "callback_profile" not in exp.stat_aggregates
+    assert not any(_.__name__.startswith("Profiled") for _ in type(exp).__mro__)
+    assert exp.last_evaluation_results == profiled_experiment.last_evaluation_results
+
+
+##################################################
+# Overhead Report Tests
+##################################################
+@pytest.fixture()
+def env_overhead(request, tmpdir):
+    """`Environment` warning about overhead exceeding `request.param`, if given"""
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=str(tmpdir),
+        metrics=["roc_auc_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+        runs=2,
+        overhead_threshold=getattr(request, "param", None),
+    )
+
+
+def test_overhead_report(tmpdir, env_overhead):
+    """Test that the time spent fitting is reported as model time, that the reported stages add up
+    to the total, and that the report matches the saved description and leaderboard, excluding the
+    time spent recording, which is only reported by the Experiment's `stage_timer`"""
+    exp = CVExperiment(SlowClassifier, dict(strategy="prior"))
+    report = exp.stat_aggregates["overhead"]
+
+    assert report["fit"] >= env_overhead.cv_params["n_splits"] * env_overhead.runs * SLEEP
+    assert report["model"] == pytest.approx(report["fit"] + report["predict"])
+    assert report["framework"] == pytest.approx(report["total"] - report["model"])
+    assert report["framework_fraction"] == pytest.approx(report["framework"] / report["total"])
+    assert all(report[_] > 0 for _ in ["key_making", "evaluation", "other"])
+
+    stages = ["key_making", "feature_engineering", "evaluation", "recording", "other"]
+    assert sum(report[_] for _ in stages) == pytest.approx(report["framework"])
+
+    assets = tmpdir.join("HyperparameterHunterAssets")
+    saved_report = read_json(
+        assets.join("Experiments", "Descriptions", f"{exp.experiment_id}.json")
+    )["aggregates"]["overhead"]
+    assert saved_report == report
+    assert report["recording"] == 0
+
+    final_report = exp.stage_timer.report()
+    assert final_report["recording"] > 0
+    assert final_report["total"] > report["total"]
+
+    leaderboard = pd.read_csv(assets.join("Leaderboards", "GlobalLeaderboard.csv"))
+    assert leaderboard["framework_fraction"].iloc[0] == pytest.approx(report["framework_fraction"])
+
+
+@pytest.mark.parametrize(
+    ["env_overhead", "warned"], [(None, False), (0.01, True)], indirect=["env_overhead"]
+)
+def test_overhead_warning(capsys, env_overhead, warned):
+    """Test that overhead is only warned about if it exceeds a given `overhead_threshold`"""
+    CVExperiment(DummyClassifier, dict(strategy="prior"))
+    assert ("Framework overhead was" in capsys.readouterr().out) is warned
@@ -0,0 +1,140 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter.data.data_chunks.prediction_chunks import (
+    HoldoutPredictionChunk,
+    OOFPredictionChunk,
+    _format_prediction,
+)
+from hyperparameter_hunter.feature_engineering import FeatureEngineer
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+import numpy as np
+import pandas as pd
+import pytest
+
+##################################################
+# Global Settings
+##################################################
+N_REPEATS, N_SPLITS, RUNS = 2, 3, 2
+TARGET_COLUMN = ["t_0", "t_1"]
+
+
+##################################################
+# Helpers
+##################################################
+def _iter_divisions(n_rows):
+    """Yield (rep, fold, run, validation_index) for a repeated CV scheme over `n_rows` rows"""
+    for rep in range(N_REPEATS):
+        folds = np.array_split(np.random.RandomState(rep).permutation(n_rows), N_SPLITS)
+        for fold, validation_index in enumerate(folds):
+            for run in range(RUNS):
+                yield rep, fold, run, validation_index
+
+
+def _reference_oof(n_rows, predictions):
+    """DataFrame-based accumulation of OOF predictions, mirroring the original implementation"""
+    final = pd.DataFrame(0, index=range(n_rows), columns=TARGET_COLUMN)
+    rep_df, fold_df = None, None
+    for (rep, fold, run, validation_index), prediction in zip(_iter_divisions(n_rows), predictions):
+        if fold == 0 and run == 0:
+            rep_df = pd.DataFrame(0, index=range(n_rows), columns=TARGET_COLUMN)
+        if run == 0:
+            fold_df = 0
+        fold_df += _format_prediction(prediction, TARGET_COLUMN)
+        if run == RUNS - 1:
+            fold_df /= RUNS
+            rep_df.iloc[validation_index] += fold_df.values
+            if fold == N_SPLITS - 1:
+                final += rep_df
+    return final / N_REPEATS
+
+
+##################################################
+# Accumulation Tests
+##################################################
+def test_oof_accumulation_matches_dataframe_reference():
+    """Test that array-backed OOF prediction accumulation is identical to the DataFrame-based
+    accumulation it replaced, for both the inverted and the transformed predictions"""
+    n_rows = 30
+    rng = np.random.RandomState(32)
+    divisions = list(_iter_divisions(n_rows))
+    predictions = [rng.rand(len(_[-1]), len(TARGET_COLUMN)) for _ in divisions]
+    zero_predictions = pd.DataFrame(0, index=range(n_rows), columns=TARGET_COLUMN)
+
+    chunk = OOFPredictionChunk(None)
+    chunk.on_exp_start(zero_predictions)
+    for (rep, fold, run, validation_index), prediction in zip(divisions, predictions):
+        if fold == 0 and run == 0:
+            chunk.on_rep_start(zero_predictions)
+        if run == 0:
+            chunk.on_fold_start()
+        chunk.on_run_end(prediction, FeatureEngineer(), TARGET_COLUMN)
+        if run == RUNS - 1:
+            chunk.on_fold_end(validation_index, RUNS)
+            if fold == N_SPLITS - 1:
+                chunk.on_rep_end(N_SPLITS)
+    chunk.on_exp_end(N_REPEATS)
+
+    expected = _reference_oof(n_rows, predictions)
+    pd.testing.assert_frame_equal(chunk.final, expected)
+    pd.testing.assert_frame_equal(chunk.T.final, expected)
+
+
+def test_holdout_accumulation_returns_stable_frames():
+    """Test that DataFrames handed out by a prediction chunk are not modified by further in-place
+    accumulation, and that division placeholders behave as before"""
+    chunk = HoldoutPredictionChunk(None)
+    assert chunk.final is None and chunk.fold is None
+
+    chunk.on_exp_start()
+    chunk.on_rep_start()
+    chunk.on_fold_start()
+    assert chunk.fold == 0 and chunk.T.fold == 0
+
+    chunk.on_run_end(np.array([1.0, 2.0, 3.0]), None, ["y"])
+    first_fold = chunk.fold
+    first_fold_copy = first_fold.copy()
+    chunk.on_run_end(np.array([3.0, 2.0, 1.0]), None, ["y"])
+
+    pd.testing.assert_frame_equal(first_fold, first_fold_copy)
+    pd.testing.assert_frame_equal(chunk.fold, pd.DataFrame(dict(y=[4.0, 4.0, 4.0])))
+
+    chunk.on_fold_end(2)
+    chunk.on_rep_end(1)
+    chunk.on_exp_end(1)
+    pd.testing.assert_frame_equal(chunk.final, pd.DataFrame(dict(y=[2.0, 2.0, 2.0])))
+    assert isinstance(chunk.T.run, pd.DataFrame)
+
+
+def test_prediction_column_mismatch():
+    """Test that predictions whose width does not match `target_column` are rejected early"""
+    chunk = HoldoutPredictionChunk(None)
+    chunk.on_exp_start()
+    chunk.on_rep_start()
+    chunk.on_fold_start()
+    with pytest.raises(ValueError, match="does not match columns"):
+        chunk.on_run_end(np.zeros((4, 3)), None, ["y"])
+
+
+def test_compact_prediction_chunk():
+    """Test that compacting a prediction chunk converts all of its divisions, without changing
+    DataFrames that were already handed out"""
+    chunk = HoldoutPredictionChunk(None)
+    chunk.on_exp_start()
+    chunk.on_rep_start()
+    chunk.on_fold_start()
+    chunk.on_run_end(np.array([0.25, 0.5, 0.75]), None, ["y"])
+    chunk.on_fold_end(1)
+    chunk.on_rep_end(1)
+    chunk.on_exp_end(1)
+
+    final = chunk.final
+    chunk.compact(np.float32)
+    assert final.dtypes["y"] == np.float64
+    for division in ["run", "fold", "rep", "final"]:
+        assert getattr(chunk, division).dtypes["y"] == np.float32
+        assert getattr(chunk.T, division).dtypes["y"] == np.float32
+    pd.testing.assert_frame_equal(chunk.final, final.astype(np.float32))
@@ -5,6 +5,7 @@ from hyperparameter_hunter.callbacks.recipes import confusion_matrix_oof, confus
 from hyperparameter_hunter.environment import (
     Environment,
     define_holdout_set,
+    downcast_dataset,
     validate_file_blacklist,
 )
 
@@ -182,6 +183,66 @@ def test_environment_repr(env_params):
     assert env.__repr__() == f"Environment(cross_experiment_key={env.cross_experiment_key!s})"
 
 
+##################################################
+# `memory_mode` Tests
+##################################################
+def test_memory_mode_downcast():
+    """Test that downcasting datasets does not change the cross-experiment key, or the targets"""
+    env_0 = Environment(**default_env_params)
+    env_1 = Environment(**dict(default_env_params, memory_mode="downcast"))
+    assert env_0 == env_1.cross_experiment_key
+
+    for dataset in [env_1.train_dataset, env_1.holdout_dataset, env_1.test_dataset]:
+        assert dataset.drop(columns=["diagnosis"]).dtypes.eq(np.float32).all()
+        assert dataset["diagnosis"].dtype == train_dataset["diagnosis"].dtype
+
+    assert env_1.train_dataset.memory_usage().sum() < env_0.train_dataset.memory_usage().sum()
+
+
+def test_downcast_integer_widths():
+    """Test that integer columns are narrowed no further than 32 bits, so arithmetic on their values
+    in feature engineering steps does not overflow, and that columns too wide for 32 bits are
+    kept"""
+    df = pd.DataFrame(dict(a=[1, 300], b=np.array([1, 2], dtype=np.uint64), c=[0, 2 ** 40]))
+    downcast = downcast_dataset(df)
+    assert downcast.dtypes.tolist() == [np.int32, np.uint32, np.int64]
+    assert (downcast["a"] ** 2).tolist() == [1, 300 ** 2]
+
+
+def test_memory_mode_value_error():
+    with pytest.raises(ValueError, match="`memory_mode` must be None or 'downcast', not 'foo'"):
+        Environment(**dict(default_env_params, memory_mode="foo"))
+
+
+##################################################
+# Prediction Storage Tests
+##################################################
+def test_prediction_dtype_value_error():
+    with pytest.raises(ValueError, match="`prediction_dtype` must be a float dtype, not 'int32'"):
+        Environment(**dict(default_env_params, prediction_dtype="int32"))
+
+
+def test_prediction_forms_value_error():
+    with pytest.raises(ValueError, match="`prediction_forms` must be 'both' or 'required'.*"):
+        Environment(**dict(default_env_params, prediction_forms="transformed"))
+
+
+def test_track_memory_value_error():
+    with pytest.raises(ValueError, match="`track_memory` must be False, True, 'reset_rss', or .*"):
+        Environment(**dict(default_env_params, track_memory="rss"))
+
+
+@pytest.mark.parametrize("overhead_threshold", [0, 1.5])
+def test_overhead_threshold_value_error(overhead_threshold):
+    with pytest.raises(ValueError, match="`overhead_threshold` must be in \\(0, 1\\], or None.*"):
+        Environment(**dict(default_env_params, overhead_threshold=overhead_threshold))
+
+
+def test_trace_spans_value_error():
+    with pytest.raises(ValueError, match="`trace_spans` must be a boolean.*"):
+        Environment(**dict(default_env_params, trace_spans="yes"))
+
+
 ##################################################
 # Environment Property Scenarios
 ##################################################
@@ -1,15 +1,24 @@
 ##################################################
 # Import Own Assets
 ##################################################
-from hyperparameter_hunter import settings
+from hyperparameter_hunter import Environment, lambda_callback, settings
+from hyperparameter_hunter.experiment_core import ExperimentMeta
 from hyperparameter_hunter.experiments import BaseExperiment, CVExperiment, get_cv_indices
 from hyperparameter_hunter.i_o.exceptions import EnvironmentInactiveError, EnvironmentInvalidError
+from hyperparameter_hunter.utils.learning_utils import get_toy_classification_data
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+import gc
+from inspect import signature
+import logging
 import numpy as np
+import pandas as pd
+import pickle
 from numpy.testing import assert_equal
+from os.path import isfile
+from pandas.testing import assert_frame_equal
 import pytest
 
 ##################################################
@@ -209,3 +218,314 @@ def test_get_cv_indices(folds, cv_params, input_data, target_data, expected_indi
     # assert_array_equal(result, expected_indices)
     result = list(list(_) for _ in get_cv_indices(folds, cv_params, input_data, target_data))
     assert_equal(result, expected_indices)
+
+
+##################################################
+# Fold Checkpoint Tests
+##################################################
+class Interruption(Exception):
+    """Raised by :func:`_interrupt_at` to simulate an Experiment crashing partway through CV"""
+
+
+def _interrupt_at(rep, fold):
+    def _on_fold_end(_rep, _fold):
+        if (_rep, _fold) == (rep, fold):
+            raise Interruption(f"Interrupted at rep {rep}, fold {fold}")
+
+    return lambda_callback(on_fold_end=_on_fold_end)
+
+
+def _make_checkpoint_env(results_path, **kwargs):
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        holdout_dataset=get_holdout_data,
+        results_path=results_path,
+        metrics=["roc_auc_score"],
+        cv_type=RepeatedKFold,
+        cv_params=dict(n_splits=3, n_repeats=2, random_state=32),
+        runs=2,
+        **kwargs,
+    )
+
+
+def get_holdout_data(train, target_column):
+    return train, train.iloc[::4].copy()
+
+
+@pytest.mark.parametrize("interrupt_at", [(0, 1), (1, 0), (1, 2)])
+def test_resume_matches_uninterrupted(tmpdir, interrupt_at):
+    """Test that an Experiment with the same keys as an interrupted Experiment resumes after the
+    last completed fold, and that its final results match those of an uninterrupted Experiment"""
+    model_init_params = dict(C=0.5, solver="lbfgs")
+
+    #################### Uninterrupted Experiment ####################
+    _make_checkpoint_env(str(tmpdir.join("uninterrupted")))
+    exp_0 = CVExperiment(LogisticRegression, model_init_params)
+    assert not isfile(exp_0.checkpoint_path)
+
+    #################### Interrupted Experiment ####################
+    _make_checkpoint_env(str(tmpdir.join("interrupted")))
+    with pytest.raises(Interruption):
+        CVExperiment(
+            LogisticRegression, model_init_params, callbacks=[_interrupt_at(*interrupt_at)]
+        )
+
+    #################### Resumed Experiment ####################
+    _make_checkpoint_env(str(tmpdir.join("interrupted")))
+    fold_starts = []
+    exp_1 = CVExperiment(
+        LogisticRegression,
+        model_init_params,
+        callbacks=[
+            lambda_callback(on_fold_start=lambda _rep, _fold: fold_starts.append((_rep, _fold)))
+        ],
+    )
+    assert not isfile(exp_1.checkpoint_path)
+
+    all_folds = [(rep, fold) for rep in range(2) for fold in range(3)]
+    assert fold_starts == [_ for _ in all_folds if _ >= interrupt_at]
+
+    for dataset in ["data_oof", "data_holdout"]:
+        for chunk in [getattr(exp_0, dataset).prediction, getattr(exp_1, dataset).prediction]:
+            assert chunk.final is not None
+        assert_frame_equal(
+            getattr(exp_0, dataset).prediction.final, getattr(exp_1, dataset).prediction.final
+        )
+        assert_frame_equal(
+            getattr(exp_0, dataset).prediction.T.final, getattr(exp_1, dataset).prediction.T.final
+        )
+
+    assert exp_0.last_evaluation_results == exp_1.last_evaluation_results
+    assert_equal(exp_0.stat_aggregates["evaluations"], exp_1.stat_aggregates["evaluations"])
+    assert np.shape(exp_1.stat_aggregates["times"]["runs"]) == (2, 3, 2)
+    assert len(exp_1.stat_aggregates["times"]["reps"]) == 2
+
+
+def test_blacklisted_checkpoint(tmpdir):
+    """Test that no checkpoint is saved or resumed if "checkpoint" is in `file_blacklist`"""
+    _make_checkpoint_env(str(tmpdir), file_blacklist=["checkpoint"])
+    with pytest.raises(Interruption):
+        CVExperiment(LogisticRegression, dict(solver="lbfgs"), callbacks=[_interrupt_at(0, 1)])
+    assert tmpdir.join("HyperparameterHunterAssets", "Experiments").exists()
+    assert not tmpdir.join("HyperparameterHunterAssets", "Experiments", "Checkpoints").exists()
+
+
+##################################################
+# Prediction Storage Tests
+##################################################
+def _make_prediction_env(results_path, **kwargs):
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        holdout_dataset=get_holdout_data,
+        results_path=results_path,
+        metrics=["roc_auc_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+        **kwargs,
+    )
+
+
+def test_prediction_dtype(tmpdir):
+    """Test that predictions are stored in `prediction_dtype` only after they are evaluated, so
+    evaluations are unaffected, and saved predictions are only rounded"""
+    _make_prediction_env(str(tmpdir.join("float64")))
+    exp_0 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"))
+    _make_prediction_env(str(tmpdir.join("float32")), prediction_dtype="float32")
+    exp_1 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"))
+
+    assert exp_1.last_evaluation_results == exp_0.last_evaluation_results
+    for dataset in ["data_oof", "data_holdout"]:
+        chunk_0, chunk_1 = getattr(exp_0, dataset).prediction, getattr(exp_1, dataset).prediction
+        for division in ["final", "rep"]:
+            assert (getattr(chunk_1, division).dtypes == np.float32).all()
+            assert (getattr(chunk_1.T, division).dtypes == np.float32).all()
+        assert_frame_equal(chunk_0.final.astype(np.float32), chunk_1.final)
+
+
+def test_prediction_forms_required(tmpdir):
+    """Test that only inverted predictions are accumulated if they are the only form evaluated,
+    without changing evaluations or saved predictions, and that getting transformed predictions
+    raises a clear error, rather than giving None"""
+    _make_prediction_env(str(tmpdir.join("both")))
+    exp_0 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"))
+    _make_prediction_env(str(tmpdir.join("required")), prediction_forms="required")
+    exp_1 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"))
+
+    assert exp_1.last_evaluation_results == exp_0.last_evaluation_results
+    for dataset in ["data_oof", "data_holdout"]:
+        chunk_0, chunk_1 = getattr(exp_0, dataset).prediction, getattr(exp_1, dataset).prediction
+        assert_frame_equal(chunk_0.final, chunk_1.final)
+        for division in ["final", "rep", "fold", "run"]:
+            with pytest.raises(
+                ValueError, match=f"Transformed `{division}` predictions are not kept"
+            ):
+                getattr(chunk_1.T, division)
+
+    for (exp, dataset) in [(exp_0, "both"), (exp_1, "required")]:
+        path = tmpdir.join(dataset, "HyperparameterHunterAssets", "Experiments", "PredictionsOOF")
+        saved = pd.read_csv(str(path.join(f"{exp.experiment_id}.csv")))
+        assert_equal(saved["target"].values, exp_0.data_oof.prediction.final["target"].values)
+
+
+def test_prediction_forms_required_transformed_metrics(tmpdir):
+    """Test that transformed predictions are still accumulated if they are evaluated"""
+    _make_prediction_env(str(tmpdir), prediction_forms="required", save_transformed_metrics=True)
+    exp = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"))
+    for dataset in ["data_oof", "data_holdout"]:
+        chunk = getattr(exp, dataset).prediction
+        assert_frame_equal(chunk.T.final, chunk.final)
+
+
+##################################################
+# Assembled Experiment Class Tests
+##################################################
+def test_assembled_class_reuse(env_fixture_0):
+    """Test that Experiments with the same callbacks share one subclass of `CVExperiment`, which is
+    left unmodified, and that Experiments with different callbacks do not"""
+    original_bases = CVExperiment.__bases__
+    callback = lambda_callback(on_exp_end=lambda: None)
+    exp_0 = CVExperiment(LogisticRegression, dict(solver="lbfgs"), callbacks=[callback])
+    exp_1 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"), callbacks=[callback])
+    exp_2 = CVExperiment(LogisticRegression, dict(solver="lbfgs"))
+
+    assert type(exp_0) is type(exp_1)
+    assert type(exp_0) is not type(exp_2)
+    assert all(isinstance(_, CVExperiment) for _ in [exp_0, exp_1, exp_2])
+    assert callback in type(exp_0).__mro__ and callback not in type(exp_2).__mro__
+    assert CVExperiment.__bases__ == original_bases
+    assert exp_0.source_script == exp_2.source_script == __file__
+
+
+def test_assembled_class_pickle(env_fixture_0):
+    """Test that assembled subclasses of `CVExperiment` are only cached while they are in use, and
+    are pickled as the same subclass, or as an equivalent one if it is no longer cached"""
+    exp = CVExperiment(LogisticRegression, dict(solver="lbfgs"))
+    experiment_class = type(exp)
+    pickled_class = pickle.dumps(experiment_class)
+    mro = [_.__name__ for _ in experiment_class.__mro__]
+    key = experiment_class.__dict__["__assembled_from"]
+
+    assert ExperimentMeta.assembled_classes[key] is experiment_class
+    assert pickle.loads(pickled_class) is experiment_class
+
+    del exp, experiment_class
+    gc.collect()
+    assert key not in ExperimentMeta.assembled_classes
+    assert [_.__name__ for _ in pickle.loads(pickled_class).__mro__] == mro
+    assert pickle.loads(pickle.dumps(CVExperiment)) is CVExperiment
+
+
+##################################################
+# `on_repeated` Tests
+##################################################
+@pytest.fixture()
+def env_reuse(tmpdir):
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        holdout_dataset=get_holdout_data,
+        results_path=str(tmpdir),
+        metrics=["roc_auc_score"],
+        cv_type=RepeatedKFold,
+        cv_params=dict(n_splits=3, n_repeats=2, random_state=32),
+        runs=2,
+    )
+
+
+def test_reuse_repeated(env_reuse):
+    """Test that a duplicate Experiment with `on_repeated="reuse"` serves the saved results of the
+    original Experiment without fitting any models"""
+    exp_0 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"))
+    assert exp_0.served_from_cache is False
+
+    fold_starts = []
+    exp_1 = CVExperiment(
+        LogisticRegression,
+        dict(C=0.5, solver="lbfgs"),
+        on_repeated="reuse",
+        callbacks=[lambda_callback(on_fold_start=lambda _fold: fold_starts.append(_fold))],
+    )
+    assert exp_1.served_from_cache is True
+    assert fold_starts == []
+    assert exp_1.experiment_id == exp_0.experiment_id
+    assert exp_1.last_evaluation_results == exp_0.last_evaluation_results
+    assert_equal(exp_1.stat_aggregates["evaluations"], exp_0.stat_aggregates["evaluations"])
+
+    for dataset in ["data_oof", "data_holdout"]:
+        assert_frame_equal(
+            getattr(exp_0, dataset).prediction.final, getattr(exp_1, dataset).prediction.final
+        )
+    assert exp_1.data_test.prediction.final is None
+
+
+def test_reuse_repeated_evaluation_arrays(env_reuse):
+    """Test that the evaluations served from cache are arrays, which can be indexed by the
+    repetition, fold, and run of each division, like those of the original Experiment"""
+    runs_0 = []
+    exp_0 = CVExperiment(
+        LogisticRegression,
+        dict(C=0.5, solver="lbfgs"),
+        callbacks=[
+            lambda_callback(
+                on_run_end=lambda _rep, _fold, _run, last_evaluation_results: runs_0.append(
+                    ((_rep, _fold, _run), last_evaluation_results["oof"]["roc_auc_score"])
+                )
+            )
+        ],
+    )
+    exp_1 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"), on_repeated="reuse")
+    assert exp_1.served_from_cache is True
+
+    for (agg_key, evaluations) in exp_1.stat_aggregates["evaluations"].items():
+        original = exp_0.stat_aggregates["evaluations"][agg_key]
+        for division in ["runs", "folds", "reps"]:
+            assert isinstance(evaluations[division], np.ndarray)
+            assert evaluations[division].shape == original[division].shape
+        assert evaluations["final"] == original["final"]
+
+    runs = exp_1.stat_aggregates["evaluations"]["oof_roc_auc_score"]["runs"]
+    assert len(runs_0) == runs.size == 12
+    for index, evaluation in runs_0:
+        assert runs[index] == evaluation
+    assert_equal(runs[1, :, -1], [_[1] for _ in runs_0 if _[0][0] == 1 and _[0][2] == 1])
+
+
+def test_reuse_repeated_clean_up(tmpdir, env_reuse):
+    """Test that a duplicate Experiment served from cache leaves no script backup of its own, stops
+    collecting its heartbeat, and fills both forms of predictions when targets are not inverted"""
+    exp_0 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"))
+    exp_1 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"), on_repeated="reuse")
+    assert exp_1.served_from_cache is True
+
+    backup_dir = tmpdir.join("HyperparameterHunterAssets", "Experiments", "ScriptBackups")
+    assert [_.purebasename for _ in backup_dir.listdir()] == [exp_0.experiment_id]
+
+    assert exp_1.heartbeat_buffer not in logging.getLogger().handlers
+    assert exp_1.heartbeat_buffer.getvalue() == ""
+
+    for dataset in ["data_oof", "data_holdout"]:
+        prediction = getattr(exp_1, dataset).prediction
+        assert_frame_equal(prediction.T.final, prediction.final)
+
+
+def test_reuse_repeated_without_description(tmpdir, env_reuse):
+    """Test that a duplicate Experiment with `on_repeated="reuse"` is run again if the original
+    Experiment's description was not saved"""
+    exp_0 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"))
+    tmpdir.join(
+        "HyperparameterHunterAssets", "Experiments", "Descriptions", f"{exp_0.experiment_id}.json"
+    ).remove()
+
+    exp_1 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"), on_repeated="reuse")
+    assert exp_1.served_from_cache is False
+    assert exp_1.experiment_id != exp_0.experiment_id
+    assert exp_1.last_evaluation_results == exp_0.last_evaluation_results
+
+
+def test_invalid_on_repeated(env_fixture_0):
+    with pytest.raises(ValueError, match="`on_repeated` must be 'run' or 'reuse'.*"):
+        CVExperiment(LogisticRegression, dict(), on_repeated="skip")
+
+
+def test_on_repeated_after_callbacks():
+    """Test that `on_repeated` follows the existing parameters, so `callbacks` keeps its position"""
+    assert list(signature(CVExperiment.__init__).parameters)[-2:] == ["callbacks", "on_repeated"]
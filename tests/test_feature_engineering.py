@@ -8,11 +8,15 @@ and Optimization Protocols are contained in `tests.integration_tests.feature_eng
 from hyperparameter_hunter.feature_engineering import merge_dfs, split_merged_df
 from hyperparameter_hunter.feature_engineering import DatasetNameReport, validate_dataset_names
 from hyperparameter_hunter.feature_engineering import get_engineering_step_params
+from hyperparameter_hunter.feature_engineering import ColumnStore, iter_row_chunks
+from hyperparameter_hunter.feature_engineering import DatasetHashCache, hash_datasets
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+import numpy as np
 import pandas as pd
+from pandas.testing import assert_frame_equal
 import pytest
 
 
@@ -86,6 +90,33 @@ def test_merge_dfs_0(merge_to, stage, expected_dfs, expected_group, original_dfs
     assert all(v.equals(expected_split_dfs[k]) for k, v in actual_split_dfs.items())
 
 
+def test_split_merged_df_views():
+    """Test that splitting a merged DataFrame with a single dtype makes views, rather than copies"""
+    dfs = {
+        _: original.loc[:, ["a"]].astype(float)
+        for _, original in dfs_0.items()
+        if _.endswith("_inputs")
+    }
+    merged_df = merge_dfs("all_inputs", "intra_cv", dfs)
+    split_dfs = split_merged_df(merged_df)
+
+    for name, df in split_dfs.items():
+        assert_frame_equal(df, dfs[name])
+        assert np.shares_memory(df.values, merged_df.values)
+
+    split_dfs["train_inputs"].iloc[0, 0] = -1.0
+    assert split_dfs["validation_inputs"].iloc[0, 0] == 4.0
+
+
+def test_split_merged_df_shuffled():
+    """Test that merged DataFrames whose datasets are no longer contiguous are split by label"""
+    merged_df = merge_dfs("all_inputs", "intra_cv", dfs_0)
+    split_dfs = split_merged_df(merged_df.iloc[::-1])
+
+    for name, df in split_dfs.items():
+        assert_frame_equal(df, dfs_0[name].iloc[::-1])
+
+
 @pytest.mark.parametrize(
     ["merge_to", "stage", "expected_dfs", "expected_group", "original_dfs"],
     [
@@ -418,3 +449,75 @@ def _err_param_non_train_data(non_train_data):
 def test_get_engineering_step_params_value_error(f):
     with pytest.raises(ValueError, match="Sorry, 'data'-suffixed parameters like .*"):
         get_engineering_step_params(f)
+
+
+##################################################
+# `iter_row_chunks` / `ColumnStore`
+##################################################
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 10])
+def test_iter_row_chunks(chunk_size):
+    chunks = list(iter_row_chunks(train_data_0, chunk_size))
+    assert all(len(_) <= chunk_size for _ in chunks)
+    assert_frame_equal(pd.concat(chunks), train_data_0)
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [pd.DataFrame(dict(a=[0, 1], b=[2, 3])), pd.DataFrame(dict(a=[4], b=[5]))],
+        [pd.DataFrame(dict(a=[0, 1], b=[2, 3])), pd.DataFrame(dict(a=[4.5], b=[5.0]))],
+        [pd.DataFrame(dict(a=[0.0, 1.0], b=[2.0, 3.0])), pd.DataFrame(dict(a=[4], b=[5]))],
+        [pd.DataFrame(dict(a=[0, 1], b=[2, 3])), pd.DataFrame(dict(a=[4], b=["x"]))],
+        [pd.DataFrame(dict(a=[0, 1], b=["x", "y"])), pd.DataFrame(dict(a=[4], b=["z"]))],
+    ],
+    ids=["int", "upcast_to_float", "float", "becomes_mixed", "mixed"],
+)
+def test_column_store_write(chunks, tmpdir):
+    """Test that writing `chunks` to a `ColumnStore` is equivalent to concatenating them"""
+    index = pd.Index([10, 11, 12])
+    expected = pd.concat(chunks)
+    expected.index = index
+
+    actual = ColumnStore(str(tmpdir)).write(iter(chunks), index)
+    assert_frame_equal(actual, expected)
+
+
+def test_column_store_memory_mapped(tmpdir):
+    actual = ColumnStore(str(tmpdir)).write(
+        iter_row_chunks(test_inputs_0[["a"]], 1), pd.Index([3, 4])
+    )
+    values = actual.values
+    while not isinstance(values, np.memmap):
+        values = values.base
+    assert values.flags.f_contiguous
+
+
+def test_column_store_row_count_error(tmpdir):
+    with pytest.raises(ValueError, match="Chunks contain 2 rows, but 3 were expected"):
+        ColumnStore(str(tmpdir)).write([test_inputs_0], pd.Index([0, 1, 2]))
+
+
+##################################################
+# `hash_datasets` / `DatasetHashCache`
+##################################################
+def test_hash_datasets_full_column():
+    """Test that column hashes cover every row, not only those shown by the column's repr"""
+    df_0 = pd.DataFrame(dict(a=np.arange(1000)))
+    df_1 = df_0.copy()
+    df_1.iloc[500, 0] = -1
+    hashes = hash_datasets(dict(x=df_0, y=df_1))
+    assert hashes["x"]["column_values"]["a"] != hashes["y"]["column_values"]["a"]
+    assert hashes["x"]["dataset"] != hashes["y"]["dataset"]
+    assert hashes["x"]["column_names"] == hashes["y"]["column_names"]
+
+
+def test_dataset_hash_cache_identity():
+    """Test that cached hashes are only reused for the same DataFrame object"""
+    cache = DatasetHashCache()
+    hashes = cache.hash_datasets(dict(x=train_data_0, y=test_inputs_0))
+
+    assert cache.hash_datasets(dict(x=train_data_0), modified=[])["x"] is hashes["x"]
+    assert cache.hash_datasets(dict(x=train_data_0.copy()), modified=[])["x"] is not hashes["x"]
+    assert cache.hash_datasets(dict(x=train_data_0.copy()), modified=[])["x"] == hashes["x"]
+    assert cache.hash_datasets(dict(x=train_data_0), modified=["x"])["x"] is not hashes["x"]
+    assert cache.hash_datasets(dict(x=None))["x"]["dataset"] is None
@@ -1,8 +1,12 @@
 ##################################################
 # Import Own Assets
 ##################################################
-from hyperparameter_hunter import Real, Integer, Categorical
+from hyperparameter_hunter import Environment, CVExperiment, Real, Integer, Categorical
+from hyperparameter_hunter.i_o import reporting
 from hyperparameter_hunter.i_o.reporting import get_param_column_sizes
+from hyperparameter_hunter.optimization.backends.skopt import protocols as hh_opt
+from hyperparameter_hunter.settings import G
+from hyperparameter_hunter.utils.learning_utils import get_toy_classification_data
 from tests.integration_tests.feature_engineering.test_feature_optimization import (
     ChoiceMMNormalizeSS,
     ChoiceUpsample,
@@ -11,8 +15,17 @@ from tests.integration_tests.feature_engineering.test_feature_optimization impor
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+import inspect
+import json
+import logging
 import pytest
 
+##################################################
+# Import Learning Assets
+##################################################
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+
 ##################################################
 # Global Settings
 ##################################################
@@ -57,3 +70,190 @@ assets_dir = "hyperparameter_hunter/__TEST__HyperparameterHunterAssets__"
 )
 def test_get_param_column_sizes(space, names, sizes):
     assert sizes == get_param_column_sizes(space, names)
+
+
+##################################################
+# Lazy Logging Tests
+##################################################
+@pytest.fixture()
+def info_env(tmpdir):
+    """`Environment` with its reporting initialized, whose root logger ignores debug messages"""
+    env = Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=str(tmpdir),
+        metrics=["roc_auc_score"],
+    )
+    env.initialize_reporting()
+    logging.root.setLevel(logging.INFO)
+    yield env
+    logging.root.setLevel(logging.DEBUG)
+
+
+def test_lazy_content_skipped(caplog, info_env):
+    """Test that callable messages are only called if they will be emitted"""
+    calls = []
+    G.debug(lambda: calls.append("debug") or "Debug message")
+    G.log(lambda: calls.append("log") or "Info message")
+
+    assert calls == ["log"]
+    assert caplog.messages == ["Info message"]
+
+
+def test_lazy_content_args(caplog, info_env):
+    """Test that `%`-style messages are formatted with `args`, unless skipped by verbosity"""
+    G.log("Fold %d score: %.3f", args=(2, 0.12345))
+    G.log("%(name)s skipped", verbose_threshold=info_env.verbose + 1, args=dict(name="Lazy"))
+
+    assert caplog.messages == ["Fold 2 score: 0.123"]
+
+
+def test_format_frame_source_cached():
+    """Test that frame sources are cached per call site, and match the call site"""
+    sources = []
+    for _ in range(2):
+        sources.append(reporting.format_frame_source(inspect.currentframe()))
+    line_no = inspect.currentframe().f_lineno - 1
+
+    assert sources[0] is sources[1]
+    assert sources[0].startswith(f"{line_no:<4} - test_reporting.test_format_frame_source_cached()")
+
+
+##################################################
+# Heartbeat Tests
+##################################################
+@pytest.fixture()
+def env_heartbeat(request, tmpdir):
+    """`Environment` whose general heartbeat file is rotated as given by `request.param`"""
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=str(tmpdir),
+        metrics=["roc_auc_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+        reporting_params=dict(heartbeat_params=getattr(request, "param", None)),
+    )
+
+
+def test_experiment_heartbeats(tmpdir, env_heartbeat):
+    """Test that each Experiment's heartbeat only holds its own messages, while the general
+    heartbeat file holds the messages of all Experiments"""
+    exp_0 = CVExperiment(LogisticRegression, dict(solver="lbfgs"))
+    exp_1 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"))
+
+    assets = tmpdir.join("HyperparameterHunterAssets")
+    heartbeat_0 = assets.join("Experiments", "Heartbeats", f"{exp_0.experiment_id}.log").read()
+    heartbeat_1 = assets.join("Experiments", "Heartbeats", f"{exp_1.experiment_id}.log").read()
+    general_heartbeat = assets.join("Heartbeat.log").read()
+
+    assert exp_0.experiment_id in heartbeat_0 and exp_1.experiment_id not in heartbeat_0
+    assert exp_1.experiment_id in heartbeat_1 and exp_0.experiment_id not in heartbeat_1
+    assert heartbeat_0 in general_heartbeat and heartbeat_1 in general_heartbeat
+    assert exp_1.heartbeat_buffer not in logging.root.handlers
+
+
+def test_heartbeat_after_save(tmpdir, env_heartbeat):
+    """Test that messages logged after an Experiment's heartbeat is saved are neither collected by
+    its buffer, nor by the heartbeat of the next Experiment, but only by the general heartbeat"""
+    exp_0 = CVExperiment(LogisticRegression, dict(solver="lbfgs"))
+    G.log("Logged between Experiments")
+
+    assert exp_0.heartbeat_buffer not in logging.root.handlers
+    assert exp_0.heartbeat_buffer.getvalue() == ""
+
+    exp_1 = CVExperiment(LogisticRegression, dict(C=0.5, solver="lbfgs"))
+    assets = tmpdir.join("HyperparameterHunterAssets")
+    for exp in [exp_0, exp_1]:
+        heartbeat = assets.join("Experiments", "Heartbeats", f"{exp.experiment_id}.log").read()
+        assert "Logged between Experiments" not in heartbeat
+    assert "Logged between Experiments" in assets.join("Heartbeat.log").read()
+
+
+@pytest.mark.parametrize("env_heartbeat", [dict(max_bytes=2000, backup_count=1)], indirect=True)
+def test_heartbeat_rotation(tmpdir, env_heartbeat):
+    """Test that the general heartbeat file is rotated by size, without truncating the heartbeat
+    of the Experiment"""
+    exp = CVExperiment(LogisticRegression, dict(solver="lbfgs"))
+
+    assets = tmpdir.join("HyperparameterHunterAssets")
+    heartbeat = assets.join("Experiments", "Heartbeats", f"{exp.experiment_id}.log").read()
+
+    assert assets.join("Heartbeat.log.1").exists() and not assets.join("Heartbeat.log.2").exists()
+    assert assets.join("Heartbeat.log").size() <= 2000
+    assert len(heartbeat) > 2000
+    assert f"Initialized Experiment: '{exp.experiment_id}'" in heartbeat
+
+
+##################################################
+# Progress Export Tests
+##################################################
+@pytest.fixture()
+def env_progress(tmpdir):
+    """`Environment` that logs nothing, saving results apart from the exported progress files"""
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=str(tmpdir.join("results")),
+        metrics=["roc_auc_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+        verbose=0,
+    )
+
+
+def _run_exported_opt_pro(progress_dir, iterations):
+    opt = hh_opt.ExtraTreesOptPro(
+        iterations=iterations,
+        random_state=32,
+        n_initial_points=2,
+        verbose=0,
+        reporter_parameters=dict(
+            events_path=str(progress_dir.join("events.ndjson")),
+            textfile_path=str(progress_dir.join("progress.prom")),
+            progress_labels=dict(job="test"),
+        ),
+    )
+    opt.forge_experiment(DecisionTreeClassifier, dict(max_depth=Integer(2, 20)))
+    opt.go()
+    return opt
+
+
+def test_optimization_progress_export(tmpdir, env_progress):
+    """Test that each optimization result is exported as an event, and summarized by the metrics
+    in the Prometheus textfile, even if `verbose`=0"""
+    progress_dir = tmpdir.join("progress")
+    opt = _run_exported_opt_pro(progress_dir, 3)
+
+    events = [json.loads(_) for _ in progress_dir.join("events.ndjson").readlines()]
+    textfile = progress_dir.join("progress.prom").read()
+
+    assert [_["iteration"] for _ in events] == [0, 1, 2]
+    assert {_["stage"] for _ in events} == {"optimization"}
+    assert [_["score"] for _ in events] == [-_ for _ in opt.optimizer.yi]  # Maximizing ROC-AUC
+    assert events[-1]["best_score"] == max(_["score"] for _ in events) == opt.best_score
+    assert all(_["experiment_duration"] > 0 and _["surrogate_fit_time"] >= 0 for _ in events)
+    assert events[-1]["skipped_iterations"] == opt.skipped_iterations
+
+    assert f'hyperparameter_hunter_optimization_best_score{{job="test"}} {opt.best_score!r}' in (
+        textfile
+    )
+    assert (
+        'hyperparameter_hunter_optimization_experiments_total{job="test",stage="optimization"} 3.0'
+        in textfile
+    )
+    assert sorted(_.basename for _ in progress_dir.listdir()) == ["events.ndjson", "progress.prom"]
+
+
+def test_optimization_progress_export_saved_results(tmpdir, env_progress):
+    """Test that the results of saved Experiments read by an OptPro are exported apart from the
+    results of its own Experiments"""
+    _run_exported_opt_pro(tmpdir.join("progress_0"), 2)
+    progress_dir = tmpdir.join("progress_1")
+    _run_exported_opt_pro(progress_dir, 1)
+
+    events = [json.loads(_) for _ in progress_dir.join("events.ndjson").readlines()]
+    textfile = progress_dir.join("progress.prom").read()
+
+    assert [_["stage"] for _ in events] == ["saved_results"] * 2 + ["optimization"]
+    assert [_["iteration"] for _ in events] == [0, 1, 2]
+    assert events[0]["surrogate_fit_time"] is None
+    assert 'experiments_total{job="test",stage="saved_results"} 2.0' in textfile
+    assert 'experiments_total{job="test",stage="optimization"} 1.0' in textfile
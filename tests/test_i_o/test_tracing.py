@@ -0,0 +1,164 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter import Environment, CVExperiment, Integer
+from hyperparameter_hunter.i_o.tracing import NULL_TRACER, Tracer
+from hyperparameter_hunter.optimization.backends.skopt import protocols as hh_opt
+from hyperparameter_hunter.settings import G
+from hyperparameter_hunter.utils.learning_utils import get_toy_classification_data
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from collections import Counter
+import json
+import pytest
+
+##################################################
+# Import Learning Assets
+##################################################
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+
+
+##################################################
+# Helpers
+##################################################
+def _read_spans(env):
+    """Read all spans exported to the "traces" file of `env`, with their attributes as a dict"""
+    spans = []
+    with open(env.result_paths["traces"]) as f:
+        for line in f:
+            for resource_spans in json.loads(line)["resourceSpans"]:
+                for scope_spans in resource_spans["scopeSpans"]:
+                    spans.extend(scope_spans["spans"])
+
+    for span in spans:
+        span["attributes"] = {
+            _["key"]: next(iter(_["value"].values())) for _ in span.pop("attributes")
+        }
+    return spans
+
+
+##################################################
+# Fixtures
+##################################################
+@pytest.fixture()
+def env_traced(request, tmpdir):
+    """`Environment` tracing spans, unless its `trace_spans` and `file_blacklist` are overridden by
+    the kwargs in `request.param`"""
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=str(tmpdir),
+        metrics=["roc_auc_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+        runs=2,
+        **dict(dict(trace_spans=True), **getattr(request, "param", {})),
+    )
+
+
+@pytest.fixture()
+def traced_experiment(env_traced):
+    assert isinstance(G.tracer, Tracer)
+    return env_traced, CVExperiment(LogisticRegression, dict(solver="lbfgs"))
+
+
+##################################################
+# Experiment Tracing Tests
+##################################################
+def test_experiment_span_tree(traced_experiment):
+    """Test that an Experiment's spans are nested from the Experiment down to each run"""
+    env, experiment = traced_experiment
+    n_splits, runs = env.cv_params["n_splits"], env.runs
+    spans = _read_spans(env)
+    by_id = {_["spanId"]: _ for _ in spans}
+
+    counts = Counter(_["name"] for _ in spans)
+    expected_counts = {
+        "Experiment": 1,
+        "preparation_workflow": 1,
+        "cross_validation_workflow": 1,
+        "rep": 1,
+        "cv_fold_workflow": n_splits,
+        "cv_run_workflow": n_splits * runs,
+        "feature_engineer": 1 + n_splits,
+    }
+    assert {_: counts[_] for _ in expected_counts} == expected_counts
+    assert counts["save_result"] >= 1
+    assert len({_["traceId"] for _ in spans}) == 1
+
+    for span in spans:
+        assert int(span["startTimeUnixNano"]) <= int(span["endTimeUnixNano"])
+        if span["name"] == "Experiment":
+            assert "parentSpanId" not in span
+            continue
+
+        parent = by_id[span["parentSpanId"]]
+        expected_parent = dict(
+            cv_run_workflow="cv_fold_workflow",
+            cv_fold_workflow="rep",
+            rep="cross_validation_workflow",
+            cross_validation_workflow="Experiment",
+            preparation_workflow="Experiment",
+        ).get(span["name"])
+        if expected_parent is not None:
+            assert parent["name"] == expected_parent
+        if span["name"] == "cv_run_workflow":
+            assert span["attributes"]["fold"] == parent["attributes"]["fold"]
+
+
+def test_experiment_span_attributes(traced_experiment):
+    """Test that division spans identify the Experiment, and report its target metric"""
+    env, experiment = traced_experiment
+    spans = _read_spans(env)
+    (experiment_span,) = [_ for _ in spans if _["name"] == "Experiment"]
+
+    assert experiment_span["attributes"]["experiment_id"] == experiment.experiment_id
+    assert experiment_span["attributes"]["hyperparameter_key"] == str(experiment.hyperparameter_key)
+    assert experiment_span["attributes"]["score"] == pytest.approx(
+        experiment.last_evaluation_results["oof"]["roc_auc_score"]
+    )
+
+    folds = [_ for _ in spans if _["name"] == "cv_fold_workflow"]
+    assert sorted(int(_["attributes"]["fold"]) for _ in folds) == list(
+        range(env.cv_params["n_splits"])
+    )
+    assert all(0 <= _["attributes"]["score"] <= 1 for _ in folds)
+
+
+@pytest.mark.parametrize(
+    "env_traced", [dict(trace_spans=False), dict(file_blacklist=["traces"])], indirect=True
+)
+def test_tracing_disabled(tmpdir, env_traced):
+    """Test that nothing is traced by default, or if the traces file is blacklisted"""
+    assert G.tracer is NULL_TRACER
+    CVExperiment(LogisticRegression, dict(solver="lbfgs"))
+    assert not tmpdir.join("HyperparameterHunterAssets", "Traces.jsonl").exists()
+
+
+##################################################
+# OptPro Tracing Tests
+##################################################
+def test_optimization_span_tree(env_traced):
+    """Test that an OptPro's spans contain a span for each Experiment it executes"""
+    opt = hh_opt.DummyOptPro(iterations=2, random_state=32, verbose=0)
+    opt.forge_experiment(DecisionTreeClassifier, dict(max_depth=Integer(2, 20)))
+    opt.go()
+
+    spans = _read_spans(env_traced)
+    by_id = {_["spanId"]: _ for _ in spans}
+    (go_span,) = [_ for _ in spans if _["name"] == "go"]
+    iterations = [
+        _ for _ in spans if _["name"] == "_execute_experiment" and "score" in _["attributes"]
+    ]
+
+    assert go_span["attributes"]["optpro"] == "DummyOptPro"
+    assert go_span["attributes"]["best_experiment"] == opt.best_experiment
+    assert len(iterations) == 2
+    assert {_["parentSpanId"] for _ in iterations} == {go_span["spanId"]}
+    assert {_["attributes"]["experiment_id"] for _ in iterations} >= {opt.best_experiment}
+
+    for span in spans:
+        if span["name"] == "cross_validation_workflow":
+            assert by_id[span["parentSpanId"]]["name"] == "_execute_experiment"
@@ -222,6 +222,30 @@ def test_make_hash_sha256_function(obj, expected, kwargs):
     assert make_hash_sha256(obj, **kwargs) == expected
 
 
+def _sparse_frame(values):
+    df = pd.DataFrame(
+        {"a": pd.arrays.SparseArray(values), "b": pd.arrays.SparseArray(values, fill_value=1)}
+    )
+    df["c"] = values
+    return df
+
+
+def test_make_hash_sha256_sparse_dataframe(monkeypatch):
+    """Test that DataFrames with sparse columns are hashed by their values, without densifying"""
+
+    def _densify(*args, **kwargs):
+        raise AssertionError("Sparse column was densified")
+
+    expected = make_hash_sha256(_sparse_frame([0, 0, 3, 0]))
+    monkeypatch.setattr(pd.arrays.SparseArray, "__array__", _densify)
+    monkeypatch.setattr(pd.arrays.SparseArray, "to_dense", _densify)
+
+    assert make_hash_sha256(_sparse_frame([0, 0, 3, 0])) == expected
+    assert make_hash_sha256(_sparse_frame([0, 3, 0, 0])) != expected
+    assert make_hash_sha256(_sparse_frame([0, 0, 3, 0]).iloc[:3]) != expected
+    assert make_hash_sha256(_sparse_frame([0, 0, 3, 0]).rename(columns=dict(a="z"))) != expected
+
+
 ##################################################
 # KeyMaker Scenarios
 ##################################################
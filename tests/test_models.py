@@ -1,11 +1,17 @@
 ##################################################
 # Import Own Assets
 ##################################################
+from hyperparameter_hunter import CVExperiment
 from hyperparameter_hunter.models import model_selector, Model, KerasModel
+from hyperparameter_hunter.models import _FIT_PARAMETERS_CACHE, clear_model_metadata_caches
+from hyperparameter_hunter.models import get_default_fit_kwargs, CatBoostModel, NativeDataCache
+from hyperparameter_hunter.models import to_model_input, _CATBOOST_DATA
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+import numpy as np
+import pandas as pd
 import pytest
 import sys
 
@@ -17,6 +23,16 @@ try:
 except (ModuleNotFoundError, ImportError):
     KerasClassifier, KerasRegressor = None, None
 
+try:
+    from catboost import CatBoostClassifier
+except ImportError:
+    CatBoostClassifier = None
+
+try:
+    from lightgbm import LGBMClassifier
+except ImportError:
+    LGBMClassifier = None
+
 from sklearn.svm import SVC
 
 
@@ -29,9 +45,167 @@ from sklearn.svm import SVC
         pytest.param(
             KerasRegressor, KerasModel, marks=pytest.mark.skipif("'keras' not in sys.modules")
         ),
+        pytest.param(
+            CatBoostClassifier,
+            CatBoostModel,
+            marks=pytest.mark.skipif("'catboost' not in sys.modules"),
+        ),
         (SVC, Model),
         (None, Model),
     ],
 )
 def test_model_selector(initializer, model_cls):
     assert model_selector(initializer) == model_cls
+
+
+##################################################
+# Model Metadata Cache Tests
+##################################################
+class VerboseFit:
+    def fit(self, X, y, verbose=1):
+        return self
+
+
+class SilentFit:
+    def fit(self, X, y, silent=False):
+        return self
+
+
+@pytest.mark.parametrize(
+    ["model", "expected"],
+    [(SVC(), {}), (VerboseFit(), dict(verbose=False)), (SilentFit(), dict(silent=True))],
+)
+def test_get_default_fit_kwargs(model, expected):
+    clear_model_metadata_caches()
+    assert get_default_fit_kwargs(model) == expected
+    assert type(model) in _FIT_PARAMETERS_CACHE
+
+    #################### Cached Result Should not be Mutated by Callers ####################
+    get_default_fit_kwargs(model)["foo"] = "bar"
+    assert get_default_fit_kwargs(model) == expected
+
+
+def test_get_default_fit_kwargs_instance_fit():
+    """Ensure a `fit` attribute set on the instance itself is inspected, rather than cached"""
+    clear_model_metadata_caches()
+    model = SVC()
+    model.fit = VerboseFit().fit
+    assert get_default_fit_kwargs(model) == dict(verbose=False)
+    assert get_default_fit_kwargs(SVC()) == {}
+
+
+##################################################
+# Native Data Container Tests
+##################################################
+def _binary_data(n_rows, seed):
+    rng = np.random.RandomState(seed)
+    input_data = pd.DataFrame(rng.rand(n_rows, 4), columns=list("abcd"))
+    target_data = pd.DataFrame(dict(t=(input_data["a"] > 0.5).astype(int)))
+    return input_data, target_data
+
+
+def test_native_data_cache_start_fold():
+    """Ensure containers are reused within a fold, and released when a new fold starts"""
+    cache = NativeDataCache()
+    train_0, train_1 = _binary_data(10, 0), _binary_data(10, 1)
+
+    cache.start_fold(train_0[0])
+    first = cache.get(*train_0, lambda x, y: object())
+    cache.start_fold(train_0[0])
+    assert cache.get(*train_0, lambda x, y: object()) is first
+
+    cache.start_fold(train_1[0])
+    assert cache.entries == {}
+    assert cache.get(*train_0, lambda x, y: object()) is not first
+
+
+def test_native_data_cache_cleared_after_experiment(env_fixture_0):
+    """Ensure the process-wide container caches don't keep a finished Experiment's data alive"""
+    train_input, train_target = _binary_data(10, 0)
+    _CATBOOST_DATA.start_fold(train_input)
+    _CATBOOST_DATA.get(train_input, train_target, lambda x, y: object())
+
+    CVExperiment(SVC, dict(gamma="scale"))
+    assert _CATBOOST_DATA.entries == {}
+    assert _CATBOOST_DATA._train_input is None
+
+
+@pytest.mark.skipif("'lightgbm' not in sys.modules")
+def test_early_stopping_uses_validation_data():
+    """Ensure `early_stopping_rounds` without `eval_set` evaluates on the fold's validation data"""
+    train_input, train_target = _binary_data(60, 2)
+    validation_input, validation_target = _binary_data(30, 3)
+    model = Model(
+        LGBMClassifier,
+        dict(n_estimators=50),
+        dict(fit=dict(early_stopping_rounds=5)),
+        train_input=train_input,
+        train_target=train_target,
+        validation_input=validation_input,
+        validation_target=validation_target,
+    )
+
+    eval_set = model.get_fit_kwargs()["eval_set"]
+    assert len(eval_set) == 1
+    assert eval_set[0][0] is validation_input and eval_set[0][1] is validation_target
+
+    model.fit()
+    assert model.model.best_iteration_ is not None
+
+
+def test_early_stopping_eval_set_not_injected():
+    """Ensure `eval_set` is not added to the fit kwargs of models that don't accept it"""
+    train_input, train_target = _binary_data(20, 4)
+    model = Model(
+        SVC,
+        dict(),
+        dict(fit=dict(early_stopping_rounds=5)),
+        train_input=train_input,
+        train_target=train_target,
+        validation_input=train_input,
+        validation_target=train_target,
+    )
+    assert "eval_set" not in model.get_fit_kwargs()
+
+
+##################################################
+# Sparse Data Tests
+##################################################
+class _InputRecorder(object):
+    def __init__(self):
+        self.inputs = []
+
+    def fit(self, X, y):
+        self.inputs.append(X)
+        return self
+
+    def predict(self, X):
+        self.inputs.append(X)
+        return np.zeros(X.shape[0])
+
+
+def test_sparse_input_passthrough():
+    """Ensure DataFrames of only sparse columns are given to `fit` and `predict` as CSR matrices"""
+    train_input, train_target = _binary_data(10, 5)
+    sparse_input = train_input.where(train_input > 0.5, 0).astype(pd.SparseDtype(float, 0))
+    model = Model(
+        _InputRecorder, dict(), dict(), train_input=sparse_input, train_target=train_target
+    )
+
+    model.fit()
+    model.predict(sparse_input)
+    model.predict(train_input)
+
+    assert [type(_).__name__ for _ in model.model.inputs] == [
+        "csr_matrix",
+        "csr_matrix",
+        "DataFrame",
+    ]
+    assert np.array_equal(model.model.inputs[0].toarray(), sparse_input.sparse.to_dense().values)
+
+
+def test_to_model_input_mixed_dtypes():
+    """Ensure DataFrames with any dense columns are not converted"""
+    df = pd.DataFrame(dict(a=pd.arrays.SparseArray([0, 1]), b=[2, 3]))
+    assert to_model_input(df) is df
+    assert to_model_input(df.iloc[:, :0]).shape == (2, 0)
@@ -0,0 +1,121 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter import Environment, Integer, Real
+from hyperparameter_hunter.optimization.backends.skopt import protocols as hh_opt
+from hyperparameter_hunter.utils.learning_utils import get_toy_classification_data
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+from os.path import isfile
+import pytest
+
+##################################################
+# Import Learning Assets
+##################################################
+from sklearn.tree import DecisionTreeClassifier
+
+
+##################################################
+# Fixtures
+##################################################
+@pytest.fixture()
+def env_checkpoint(tmpdir):
+    return Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=str(tmpdir),
+        metrics=["roc_auc_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+    )
+
+
+##################################################
+# Helpers
+##################################################
+def make_opt_pro(opt_pro, iterations, **fixed_params):
+    opt = opt_pro(iterations=iterations, random_state=32, n_initial_points=2, verbose=0)
+    opt.forge_experiment(
+        DecisionTreeClassifier,
+        dict(max_depth=Integer(2, 20), min_weight_fraction_leaf=Real(0.0, 0.5), **fixed_params),
+    )
+    return opt
+
+
+##################################################
+# Checkpoint Scenarios
+##################################################
+@pytest.mark.parametrize("opt_pro", [hh_opt.DummyOptPro, hh_opt.ExtraTreesOptPro])
+def test_resume_matches_uninterrupted(tmpdir, env_checkpoint, opt_pro):
+    """Test that an OptPro resumed from a checkpoint continues the same search trajectory as an
+    uninterrupted OptPro, without learning from the saved Experiments again"""
+    #################### Uninterrupted Optimization ####################
+    opt_0 = make_opt_pro(opt_pro, 5)
+    opt_0.go()
+    assert opt_0.checkpoint_path is not None and not isfile(opt_0.checkpoint_path)
+
+    #################### Interrupted, then Resumed Optimization ####################
+    Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=str(tmpdir.join("interrupted")),
+        metrics=["roc_auc_score"],
+        cv_type="KFold",
+        cv_params=dict(n_splits=3, shuffle=True, random_state=32),
+    )
+    opt_1 = make_opt_pro(opt_pro, 3)
+    opt_1.go(checkpoint_every=1)
+    assert isfile(opt_1.checkpoint_path)
+
+    opt_2 = make_opt_pro(opt_pro, 5)
+    opt_2.go(resume=True)
+    assert opt_2.successful_iterations == 5
+    assert opt_2.optimizer.Xi == opt_0.optimizer.Xi
+    assert opt_2.optimizer.yi == opt_0.optimizer.yi
+    assert opt_2.best_score == opt_0.best_score
+
+
+def test_resume_without_checkpoint(env_checkpoint):
+    """Test that `resume=True` without a checkpoint falls back to reading saved Experiments"""
+    opt_0 = make_opt_pro(hh_opt.DummyOptPro, 2)
+    opt_0.go()
+
+    opt_1 = make_opt_pro(hh_opt.DummyOptPro, 1)
+    opt_1.go(resume=True)
+    assert len(opt_1.similar_experiments) == 2
+    assert len(opt_1.optimizer.Xi) == 3
+
+
+def test_resume_different_dimensions(env_checkpoint):
+    """Test that checkpoints are not resumed if the search bounds have changed"""
+    opt_0 = make_opt_pro(hh_opt.DummyOptPro, 2)
+    opt_0.go(checkpoint_every=1)
+
+    opt_1 = hh_opt.DummyOptPro(iterations=1, random_state=32, verbose=0)
+    opt_1.forge_experiment(
+        DecisionTreeClassifier,
+        dict(max_depth=Integer(2, 10), min_weight_fraction_leaf=Real(0.0, 0.5)),
+    )
+    assert opt_1.checkpoint_path == opt_0.checkpoint_path
+
+    with pytest.warns(UserWarning, match="search dimensions differ"):
+        opt_1.go(resume=True)
+    assert opt_1.successful_iterations == 1
+
+
+def test_resume_different_fixed_params(env_checkpoint):
+    """Test that OptPros searching the same dimensions with different fixed hyperparameters don't
+    share a checkpoint, so one can't resume the other's search"""
+    opt_0 = make_opt_pro(hh_opt.DummyOptPro, 2, criterion="gini")
+    opt_0.go(checkpoint_every=1)
+    assert isfile(opt_0.checkpoint_path)
+
+    opt_1 = make_opt_pro(hh_opt.DummyOptPro, 1, criterion="entropy")
+    assert opt_1.checkpoint_path != opt_0.checkpoint_path
+    assert make_opt_pro(hh_opt.DummyOptPro, 1, criterion="gini").checkpoint_path == (
+        opt_0.checkpoint_path
+    )
+
+    opt_1.go(resume=True)
+    assert opt_1.successful_iterations == 1
+    assert not set(opt_1.tested_keys) & set(opt_0.tested_keys)
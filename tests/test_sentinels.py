@@ -3,13 +3,15 @@
 ##################################################
 from hyperparameter_hunter import Environment, CVExperiment, Real, Integer, Categorical, GBRT
 from hyperparameter_hunter import lambda_callback
-from hyperparameter_hunter.sentinels import DatasetSentinel
+from hyperparameter_hunter.sentinels import DatasetSentinel, Sentinel, locate_sentinels
+from hyperparameter_hunter.sentinels import find_sentinel_paths, resolve_sentinel_paths
 from hyperparameter_hunter.settings import G
 from hyperparameter_hunter.utils.learning_utils import get_breast_cancer_data
 
 ##################################################
 # Import Miscellaneous Assets
 ##################################################
+from collections import namedtuple
 import pytest
 import sys
 
@@ -166,3 +168,62 @@ def test_dataset_sentinel_validate_parameters(sentinel_parameters, error_match):
     """Ensure appropriate ValueErrors raised by `sentinels.DatasetSentinel._validate_parameters`"""
     with pytest.raises(ValueError, match=error_match):
         DatasetSentinel(*sentinel_parameters)
+
+
+##################################################
+# Sentinel Path Scenarios
+##################################################
+class StubSentinel(Sentinel):
+    def __init__(self, value):
+        self.value = value
+        super().__init__()
+
+    def _build_sentinel(self):
+        return f"SENTINEL***stub***{self.value}"
+
+    def retrieve_by_sentinel(self):
+        return self.value
+
+    def _validate_parameters(self):
+        pass
+
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+@pytest.fixture()
+def sentinel_registry():
+    """Restore `G.sentinel_registry` after the test, so the test's `StubSentinel` instances aren't
+    left registered for later tests"""
+    registry = list(G.sentinel_registry)
+    yield G.sentinel_registry
+    G.sentinel_registry[:] = registry
+
+
+def test_sentinel_paths_match_locate_sentinels(sentinel_registry):
+    """Ensure resolving the paths found by `find_sentinel_paths` produces the same result as
+    `locate_sentinels`, without modifying the original parameters"""
+    params = dict(
+        a=1,
+        b=StubSentinel("b"),
+        c=[2, StubSentinel("c1"), (3, StubSentinel("c2"))],
+        d=dict(e=Point(StubSentinel("x"), 4), f="foo"),
+    )
+    paths = find_sentinel_paths(params)
+    assert sorted(paths, key=str) == sorted([("b",), ("c", 1), ("c", 2, 1), ("d", "e", 0)], key=str)
+
+    resolved = resolve_sentinel_paths(params, paths)
+    assert resolved == dict(a=1, b="b", c=[2, "c1", (3, "c2")], d=dict(e=Point("x", 4), f="foo"))
+    assert dict(resolved, d=None) == locate_sentinels(dict(params, d=None))
+    assert isinstance(resolved["d"]["e"], Point)
+    assert isinstance(params["b"], Sentinel) and isinstance(params["c"][1], Sentinel)
+    assert resolved["d"] is not params["d"]
+
+
+def test_sentinel_paths_empty(sentinel_registry):
+    """Ensure parameters without `Sentinel`s yield no paths, and are returned unchanged"""
+    StubSentinel("registry")  # Ensure `G.sentinel_registry` is not empty
+    assert len(sentinel_registry) > 0
+    params = dict(a=1, b=[2, (3, 4)], c=dict(d="foo"))
+    assert find_sentinel_paths(params) == []
+    assert resolve_sentinel_paths(params, []) is params
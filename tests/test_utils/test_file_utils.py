@@ -0,0 +1,101 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter import Environment
+from hyperparameter_hunter.utils.file_utils import read_dataset
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+import pytest
+from scipy import sparse
+
+##################################################
+# Global Settings
+##################################################
+assets_dir = "hyperparameter_hunter/__TEST__HyperparameterHunterAssets__"
+
+
+def _memory_map_of(values: np.ndarray):
+    """Find the `np.memmap` that `values` is a view of, or None"""
+    while values is not None and not isinstance(values, np.memmap):
+        values = values.base
+    return values
+
+
+##################################################
+# `read_dataset` Scenarios
+##################################################
+def test_read_dataset_csv(tmpdir):
+    df = pd.DataFrame(dict(a=[0, 1, 2], b=[0.5, 1.5, 2.5]))
+    df.to_csv(str(tmpdir.join("data.csv")), index=False)
+    assert_frame_equal(read_dataset(str(tmpdir.join("data.csv"))), df)
+
+
+def test_read_dataset_npy(tmpdir):
+    """Test that ".npy" datasets are memory-mapped, and that changes are not written to the file"""
+    path = str(tmpdir.join("data.npy"))
+    np.save(path, np.arange(12, dtype=np.float64).reshape(4, 3))
+
+    df = read_dataset(path)
+    assert_frame_equal(df, pd.DataFrame(np.arange(12, dtype=np.float64).reshape(4, 3)))
+    assert _memory_map_of(df.values) is not None
+
+    df.iloc[0, 0] = 100.0
+    assert np.load(path)[0, 0] == 0.0
+
+
+def test_read_dataset_npy_structured(tmpdir):
+    path = str(tmpdir.join("data.npy"))
+    np.save(path, np.array([(0, 0.5), (1, 1.5)], dtype=[("a", "i8"), ("t", "f8")]))
+    assert_frame_equal(read_dataset(path), pd.DataFrame(dict(a=[0, 1], t=[0.5, 1.5])))
+
+
+def test_read_dataset_npy_value_error(tmpdir):
+    path = str(tmpdir.join("data.npy"))
+    np.save(path, np.arange(3))
+    with pytest.raises(ValueError, match="Expected 2-dimensional array in .*, not 1"):
+        read_dataset(path)
+
+
+def test_read_dataset_npz(tmpdir):
+    """Test that sparse ".npz" datasets are read into sparse columns, without densifying"""
+    path = str(tmpdir.join("data.npz"))
+    matrix = sparse.random(5, 3, density=0.4, format="csr", random_state=32)
+    sparse.save_npz(path, matrix)
+
+    df = read_dataset(path)
+    assert all(isinstance(_, pd.SparseDtype) for _ in df.dtypes)
+    assert (df.sparse.to_coo() != matrix).nnz == 0
+
+
+@pytest.mark.parametrize(
+    ["extension", "writer"], [(".parquet", "to_parquet"), (".ftr", "to_feather")]
+)
+def test_read_dataset_columnar(extension, writer, tmpdir):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame(dict(a=[0, 1, 2], b=[0.5, 1.5, 2.5], c=["x", "y", "z"]))
+    path = str(tmpdir.join(f"data{extension}"))
+    getattr(df, writer)(path)
+    assert_frame_equal(read_dataset(path), df)
+
+
+def test_environment_dataset_paths(tmpdir):
+    """Test that Environments read datasets from paths of any supported format, and that the
+    cross-experiment key depends only on the data, not its file format"""
+    df = pd.DataFrame(
+        np.random.RandomState(32).randint(2, size=(20, 3)), columns=["a", "b", "target"]
+    )
+    df.to_csv(str(tmpdir.join("train.csv")), index=False)
+    np.save(str(tmpdir.join("train.npy")), df.values)
+
+    env_kwargs = dict(results_path=assets_dir, metrics=["roc_auc_score"], target_column="target")
+    env_csv = Environment(str(tmpdir.join("train.csv")), **env_kwargs)
+    env_df = Environment(df, **env_kwargs)
+    assert env_csv == env_df.cross_experiment_key
+
+    env_npy = Environment(str(tmpdir.join("train.npy")), **dict(env_kwargs, target_column=[2]))
+    assert _memory_map_of(env_npy.train_dataset.values) is not None
@@ -0,0 +1,95 @@
+##################################################
+# Import Own Assets
+##################################################
+from hyperparameter_hunter import Environment, CVExperiment, lambda_callback
+from hyperparameter_hunter.utils.learning_utils import get_toy_classification_data
+from hyperparameter_hunter.utils.parallel_utils import BLAS_THREAD_VARIABLES, CPUBudget
+
+##################################################
+# Import Miscellaneous Assets
+##################################################
+import os
+import pytest
+
+##################################################
+# Import Learning Assets
+##################################################
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+
+
+##################################################
+# `CPUBudget` Scenarios
+##################################################
+@pytest.mark.parametrize(
+    ["n_cores", "n_workers", "threads_per_worker"],
+    [(8, 1, 8), (8, 2, 4), (8, 3, 2), (3, 8, 1), (1, 1, 1)],
+)
+def test_cpu_budget_split(n_cores, n_workers, threads_per_worker):
+    budget = CPUBudget(n_cores).split(n_workers)
+    assert budget.threads_per_worker == threads_per_worker
+    assert budget.n_workers * budget.threads_per_worker <= max(n_cores, budget.n_workers)
+
+
+def test_cpu_budget_negative():
+    """Test that negative `cpu_budget` values follow the `n_jobs` convention"""
+    assert CPUBudget(-1).n_cores == (os.cpu_count() or 1)
+    assert CPUBudget(-1000).n_cores == 1
+
+
+@pytest.mark.parametrize(["n_cores", "n_workers"], [(0, 1), (2.5, 1), (True, 1), (4, 0)])
+def test_cpu_budget_invalid(n_cores, n_workers):
+    with pytest.raises(ValueError):
+        CPUBudget(n_cores, n_workers=n_workers)
+
+
+def test_limit_threads_restores_variables(monkeypatch):
+    monkeypatch.setenv("OMP_NUM_THREADS", "7")
+    monkeypatch.delenv("MKL_NUM_THREADS", raising=False)
+
+    with CPUBudget(4, n_workers=2).limit_threads():
+        assert all(os.environ[_] == "2" for _ in BLAS_THREAD_VARIABLES)
+
+    assert os.environ["OMP_NUM_THREADS"] == "7"
+    assert "MKL_NUM_THREADS" not in os.environ
+
+
+##################################################
+# Experiment `cpu_budget` Scenarios
+##################################################
+def _thread_recorder(records):
+    """Make a `lambda_callback` recording the `n_jobs` of each run's model, and `OMP_NUM_THREADS`"""
+    return lambda_callback(
+        on_run_end=lambda model: records.append(
+            (model.model.get_params().get("n_jobs"), os.environ.get("OMP_NUM_THREADS"))
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ["model_initializer", "model_init_params", "expected"],
+    [
+        (RandomForestClassifier, dict(n_estimators=5, n_jobs=-1), 2),
+        (LogisticRegression, dict(solver="lbfgs"), 2),
+        (LogisticRegression, dict(solver="lbfgs", n_jobs=64), 2),
+    ],
+)
+def test_experiment_cpu_budget(model_initializer, model_init_params, expected):
+    """Test that `Environment.cpu_budget` sets the thread parameters of every run's model, caps
+    BLAS threads while executing, and doesn't alter the Experiment's recorded parameters"""
+    records = []
+    env = Environment(
+        train_dataset=get_toy_classification_data(),
+        results_path=None,
+        metrics=["roc_auc_score"],
+        cv_type="StratifiedKFold",
+        cv_params=dict(n_splits=2, shuffle=True, random_state=32),
+        experiment_callbacks=[_thread_recorder(records)],
+        cpu_budget=2,
+    )
+    assert env.cpu_budget.threads_per_worker == 2
+
+    exp = CVExperiment(model_initializer, model_init_params)
+    assert len(records) == 2
+    assert all(_ == (expected, "2") for _ in records)
+    assert exp.model_init_params.get("n_jobs") == model_init_params.get("n_jobs")